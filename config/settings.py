@@ -26,6 +26,8 @@ class LLMConfig:
     temperature: float = 0.7
     max_tokens: int = 2048
     timeout: int = 30
+    parallel_extraction: bool = False  # split resume extraction into concurrent section prompts (needs OLLAMA_NUM_PARALLEL > 1)
+    match_batch_size: int = 10  # jobs scored per LLM prompt; 1 = one prompt per job
 
 
 @dataclass
@@ -110,6 +112,8 @@ class AppSettings:
             api_key=os.getenv("LLM_API_KEY"),
             temperature=float(os.getenv("LLM_TEMPERATURE", "0.7")),
             max_tokens=int(os.getenv("LLM_MAX_TOKENS", "2048")),
+            parallel_extraction=os.getenv("LLM_PARALLEL_EXTRACTION", "False").lower() == "true",
+            match_batch_size=int(os.getenv("LLM_MATCH_BATCH_SIZE", "10")),
         )
 
         database_config = DatabaseConfig(
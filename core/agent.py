@@ -12,6 +12,7 @@ from datetime import datetime
 from typing import List, Optional
 
 from models.schemas import UserProfile, Job, JobMatch, RelevanceScore
+from models.job_table import ScoreTable
 from profile.parser import ProfileParserFactory, ProfileValidator
 from jobs.fetchers.base import JobFetcher, LinkedInJobFetcher, IndeedJobFetcher
 from jobs.fetchers.demo import DemoJobFetcher
@@ -216,8 +217,9 @@ class JobHuntingAgent:
             if passed_filters and score.overall_score >= min_score:
                 matches.append(match)
 
-        # Step 4: Sort by overall score descending
-        matches.sort(key=lambda m: m.relevance_score.overall_score, reverse=True)
+        # Step 4: Sort by overall score descending (quantised; ties keep fetch order)
+        table = ScoreTable.from_scores([m.relevance_score for m in matches])
+        matches = [matches[i] for i in table.ranking()]
 
         logger.info(
             f"Matching complete: {len(matches)} jobs passed "
@@ -413,7 +415,11 @@ class AgentBuilder:
             weights = {"skill_based": 0.5, "experience": 0.5}
 
             if self.llm_provider:
-                matchers.append(LLMBasedMatcher(self.llm_provider))
+                llm_config = getattr(self.llm_provider, "config", None)
+                matchers.append(LLMBasedMatcher(
+                    self.llm_provider,
+                    batch_size=getattr(llm_config, "match_batch_size", 1),
+                ))
                 weights = {"skill_based": 0.3, "experience": 0.3, "llm_based": 0.4}
                 logger.info("Using hybrid scorer: Skill + Experience + LLM")
             else:
@@ -171,7 +171,7 @@ class ProfileRepository:
             preferred_salary_range=salary,
             willing_to_relocate=db_obj.willing_to_relocate or False,
             remote_preference=db_obj.remote_preference or "flexible",
-            metadata=db_obj.metadata_json or {},
+            metadata=db_obj.metadata_json or None,
         )
 
     @staticmethod
@@ -198,7 +198,7 @@ class ProfileRepository:
                 {"city": loc.city, "state": loc.state, "country": loc.country, "remote": loc.remote}
                 for loc in profile.preferred_locations
             ],
-            metadata_json=profile.metadata,
+            metadata_json=profile.metadata or {},
         )
 
         for exp in profile.work_experience:
@@ -247,7 +247,7 @@ class ProfileRepository:
             db_obj.preferred_salary_min = profile.preferred_salary_range.min_amount
             db_obj.preferred_salary_max = profile.preferred_salary_range.max_amount
             db_obj.preferred_salary_currency = profile.preferred_salary_range.currency
-        db_obj.metadata_json = profile.metadata
+        db_obj.metadata_json = profile.metadata or {}
         db_obj.updated_at = datetime.utcnow()
 
         # Replace work experiences
@@ -379,7 +379,7 @@ class JobRepository:
             url=db_obj.url,
             source=db_obj.source or "unknown",
             posted_date=db_obj.posted_date,
-            metadata=db_obj.metadata_json or {},
+            metadata=db_obj.metadata_json or None,
         )
 
     @staticmethod
@@ -404,7 +404,7 @@ class JobRepository:
             url=job.url,
             source=job.source,
             posted_date=job.posted_date,
-            metadata_json=job.metadata,
+            metadata_json=job.metadata or {},
         )
 
 
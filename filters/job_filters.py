@@ -7,9 +7,8 @@ filters (AND/OR) and sequential pipeline execution with removal tracking.
 """
 
 import logging
-import re
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Set, Tuple
+from typing import List, Optional, Dict, Set, Tuple, Iterable, Iterator, Callable
 
 from models.schemas import Job, UserProfile, JobLevel
 
@@ -26,10 +25,15 @@ _LEVEL_INDEX: Dict[str, int] = {
     level.value: idx for idx, level in enumerate(_LEVEL_ORDER)
 }
 
+_LEVEL_INDEX_BY_ENUM: Dict[JobLevel, int] = {
+    level: idx for idx, level in enumerate(_LEVEL_ORDER)
+}
+
 
 def _normalize(text: str) -> str:
     """Lowercase, strip, collapse whitespace."""
-    return re.sub(r"\s+", " ", text.lower().strip())
+    # split/join collapses the same characters as \s+ without the regex engine
+    return " ".join(text.lower().split())
 
 
 def _job_text_blob(job: Job) -> str:
@@ -44,6 +48,13 @@ def _job_text_blob(job: Job) -> str:
     return _normalize(" ".join(parts))
 
 
+def _count_through(jobs: Iterable[Job], counts: List[int], slot: int) -> Iterator[Job]:
+    """Yield jobs unchanged while tallying them into counts[slot]."""
+    for job in jobs:
+        counts[slot] += 1
+        yield job
+
+
 # ---------------------------------------------------------------------------
 # Abstract base
 # ---------------------------------------------------------------------------
@@ -75,12 +86,109 @@ class JobFilter(ABC):
         """Get filter name."""
         pass
 
+    def apply_mask(self, jobs: List[Job], profile: UserProfile) -> bytearray:
+        """
+        Apply filter and return a keep-mask aligned with the input positions.
+
+        Args:
+            jobs: List of jobs to filter
+            profile: User profile for context-aware filtering
+
+        Returns:
+            bytearray where mask[i] is 1 if jobs[i] passed the filter, else 0
+        """
+        passed, _ = self.apply(jobs, profile)
+        passed_refs = {id(job) for job in passed}
+        return bytearray(id(job) in passed_refs for job in jobs)
+
+    def apply_stream(
+        self, jobs: Iterable[Job], profile: UserProfile, reasons: List[str]
+    ) -> Iterator[Job]:
+        """
+        Lazily yield the jobs that pass this filter.
+
+        The default implementation materializes the input and falls back to
+        apply(); filters that decide each job independently override this.
+
+        Args:
+            jobs: Iterable of jobs to filter
+            profile: User profile for context-aware filtering
+            reasons: List that removal reasons are appended to
+
+        Yields:
+            Jobs that passed the filter, in input order
+        """
+        passed, batch_reasons = self.apply(list(jobs), profile)
+        reasons.extend(batch_reasons)
+        yield from passed
+
+
+class StreamingJobFilter(JobFilter):
+    """
+    Base class for filters that decide each job independently.
+
+    Responsibility: Implements apply() and apply_stream() on top of a
+    per-profile predicate built by specialize(), so per-job filters can be
+    chained lazily without materializing intermediate lists.
+    """
+
+    def apply(self, jobs: List[Job], profile: UserProfile) -> Tuple[List[Job], List[str]]:
+        """Apply the filter by draining apply_stream()."""
+        reasons: List[str] = []
+        filtered = list(self.apply_stream(jobs, profile, reasons))
+        return filtered, reasons
+
+    def apply_stream(
+        self, jobs: Iterable[Job], profile: UserProfile, reasons: List[str]
+    ) -> Iterator[Job]:
+        """
+        Lazily yield the jobs that pass this filter.
+
+        Rejections are counted as they happen and logged once the input is
+        exhausted, so a fused pipeline still reports what each filter removed.
+        """
+        check = self.specialize(profile)
+        if check is _keep_all:
+            yield from jobs
+            return
+
+        seen = removed = 0
+        for job in jobs:
+            seen += 1
+            reason = check(job)
+            if reason is None:
+                yield job
+            else:
+                removed += 1
+                reasons.append(reason)
+
+        if removed:
+            logger.info(f"{type(self).__name__}: removed {removed}/{seen} jobs")
+
+    @abstractmethod
+    def specialize(self, profile: UserProfile) -> Callable[[Job], Optional[str]]:
+        """
+        Build a per-job predicate with the profile-derived bounds resolved.
+
+        Args:
+            profile: User profile for context-aware filtering
+
+        Returns:
+            Callable returning None to keep a job, or the removal reason
+        """
+        pass
+
+
+def _keep_all(job: Job) -> Optional[str]:
+    """Predicate for filters with no effective constraints."""
+    return None
+
 
 # ---------------------------------------------------------------------------
 # Salary filter
 # ---------------------------------------------------------------------------
 
-class SalaryFilter(JobFilter):
+class SalaryFilter(StreamingJobFilter):
     """
     Filters jobs based on salary requirements.
 
@@ -100,7 +208,7 @@ class SalaryFilter(JobFilter):
         self.min_salary = min_salary
         self.max_salary = max_salary
 
-    def apply(self, jobs: List[Job], profile: UserProfile) -> Tuple[List[Job], List[str]]:
+    def specialize(self, profile: UserProfile) -> Callable[[Job], Optional[str]]:
         """Filter by salary range."""
         # No filter configured and no profile preference — pass everything
         min_sal = self.min_salary
@@ -113,24 +221,21 @@ class SalaryFilter(JobFilter):
             max_sal = profile.preferred_salary_range.max_amount
 
         if min_sal is None and max_sal is None:
-            return jobs, []
+            return _keep_all
 
-        filtered = []
-        reasons = []
+        name = self.get_name()
 
-        for job in jobs:
+        def check(job: Job) -> Optional[str]:
             # No salary info — keep the job (benefit of the doubt)
             if not job.salary:
-                filtered.append(job)
-                continue
+                return None
 
             job_min = job.salary.min_amount
             job_max = job.salary.max_amount
 
             # Both salary bounds are None — keep
             if job_min is None and job_max is None:
-                filtered.append(job)
-                continue
+                return None
 
             # Normalize: use whichever bound exists
             job_highest = job_max or job_min
@@ -138,27 +243,21 @@ class SalaryFilter(JobFilter):
 
             # Check minimum: job's highest offer must meet our minimum
             if min_sal is not None and job_highest is not None and job_highest < min_sal:
-                reasons.append(
-                    f"[{self.get_name()}] Removed '{job.title}' at {job.company}: "
+                return (
+                    f"[{name}] Removed '{job.title}' at {job.company}: "
                     f"salary ${job_highest:,.0f} below minimum ${min_sal:,.0f}"
                 )
-                continue
 
             # Check maximum: job's lowest offer must not exceed our maximum
             if max_sal is not None and job_lowest is not None and job_lowest > max_sal:
-                reasons.append(
-                    f"[{self.get_name()}] Removed '{job.title}' at {job.company}: "
+                return (
+                    f"[{name}] Removed '{job.title}' at {job.company}: "
                     f"salary ${job_lowest:,.0f} above maximum ${max_sal:,.0f}"
                 )
-                continue
 
-            filtered.append(job)
+            return None
 
-        removed = len(jobs) - len(filtered)
-        if removed:
-            logger.info(f"SalaryFilter: removed {removed}/{len(jobs)} jobs")
-
-        return filtered, reasons
+        return check
 
     def get_name(self) -> str:
         return "salary_filter"
@@ -168,7 +267,7 @@ class SalaryFilter(JobFilter):
 # Location filter
 # ---------------------------------------------------------------------------
 
-class LocationFilter(JobFilter):
+class LocationFilter(StreamingJobFilter):
     """
     Filters jobs based on location preferences.
 
@@ -187,7 +286,7 @@ class LocationFilter(JobFilter):
         self.allowed_locations = [_normalize(loc) for loc in (allowed_locations or [])]
         self.require_remote = require_remote
 
-    def apply(self, jobs: List[Job], profile: UserProfile) -> Tuple[List[Job], List[str]]:
+    def specialize(self, profile: UserProfile) -> Callable[[Job], Optional[str]]:
         """Filter by location."""
         # Build location list from profile if none configured
         allowed = list(self.allowed_locations)
@@ -204,59 +303,43 @@ class LocationFilter(JobFilter):
 
         # No constraints at all — pass everything
         if not allowed and not require_remote:
-            return jobs, []
+            return _keep_all
 
-        filtered = []
-        reasons = []
+        name = self.get_name()
+        allowed = [loc for loc in allowed if loc]
 
-        for job in jobs:
+        def check(job: Job) -> Optional[str]:
             # No location info — keep
             if not job.location:
-                filtered.append(job)
-                continue
-
-            # Remote check
-            if require_remote:
-                if job.location.remote:
-                    filtered.append(job)
-                    continue
-                else:
-                    reasons.append(
-                        f"[{self.get_name()}] Removed '{job.title}' at {job.company}: "
-                        f"not remote ({job.location})"
-                    )
-                    continue
+                return None
 
             # Remote jobs always pass location filter
             if job.location.remote:
-                filtered.append(job)
-                continue
+                return None
+
+            # Remote check
+            if require_remote:
+                return (
+                    f"[{name}] Removed '{job.title}' at {job.company}: "
+                    f"not remote ({job.location})"
+                )
 
             # Check if job location matches any allowed location
             job_city = _normalize(job.location.city)
             job_state = _normalize(job.location.state)
             job_country = _normalize(job.location.country)
 
-            matched = False
             for loc in allowed:
-                if loc and (loc == job_city or loc == job_state or loc == job_country
-                            or loc in job_city or loc in job_state):
-                    matched = True
-                    break
+                if (loc == job_city or loc == job_state or loc == job_country
+                        or loc in job_city or loc in job_state):
+                    return None
 
-            if matched:
-                filtered.append(job)
-            else:
-                reasons.append(
-                    f"[{self.get_name()}] Removed '{job.title}' at {job.company}: "
-                    f"location '{job.location}' not in allowed list"
-                )
+            return (
+                f"[{name}] Removed '{job.title}' at {job.company}: "
+                f"location '{job.location}' not in allowed list"
+            )
 
-        removed = len(jobs) - len(filtered)
-        if removed:
-            logger.info(f"LocationFilter: removed {removed}/{len(jobs)} jobs")
-
-        return filtered, reasons
+        return check
 
     def get_name(self) -> str:
         return "location_filter"
@@ -266,7 +349,7 @@ class LocationFilter(JobFilter):
 # Experience level filter
 # ---------------------------------------------------------------------------
 
-class ExperienceLevelFilter(JobFilter):
+class ExperienceLevelFilter(StreamingJobFilter):
     """
     Filters jobs by required experience level.
 
@@ -285,7 +368,7 @@ class ExperienceLevelFilter(JobFilter):
         self.min_level = min_level
         self.max_level = max_level
 
-    def apply(self, jobs: List[Job], profile: UserProfile) -> Tuple[List[Job], List[str]]:
+    def specialize(self, profile: UserProfile) -> Callable[[Job], Optional[str]]:
         """Filter by experience level."""
         # Determine bounds
         min_idx = self._level_to_index(self.min_level)
@@ -294,8 +377,8 @@ class ExperienceLevelFilter(JobFilter):
         # Fall back to profile preferences
         if min_idx is None and max_idx is None and profile.preferred_job_levels:
             indices = [
-                _LEVEL_ORDER.index(lv) for lv in profile.preferred_job_levels
-                if lv in _LEVEL_ORDER
+                _LEVEL_INDEX_BY_ENUM[lv] for lv in profile.preferred_job_levels
+                if lv in _LEVEL_INDEX_BY_ENUM
             ]
             if indices:
                 min_idx = min(indices)
@@ -303,45 +386,33 @@ class ExperienceLevelFilter(JobFilter):
 
         # No constraints — pass everything
         if min_idx is None and max_idx is None:
-            return jobs, []
+            return _keep_all
 
-        filtered = []
-        reasons = []
+        name = self.get_name()
+        lo = min_idx if min_idx is not None else 0
+        hi = max_idx if max_idx is not None else len(_LEVEL_ORDER) - 1
+        level_index = _LEVEL_INDEX_BY_ENUM
 
-        for job in jobs:
-            # No level info — keep
-            if not job.level:
-                filtered.append(job)
-                continue
-
-            job_idx = _LEVEL_ORDER.index(job.level) if job.level in _LEVEL_ORDER else None
-            if job_idx is None:
-                filtered.append(job)
-                continue
+        def check(job: Job) -> Optional[str]:
+            # No level info (or unknown level) — keep
+            job_idx = level_index.get(job.level, -1)
+            if job_idx == -1 or lo <= job_idx <= hi:
+                return None
 
             # Check minimum
-            if min_idx is not None and job_idx < min_idx:
-                reasons.append(
-                    f"[{self.get_name()}] Removed '{job.title}' at {job.company}: "
-                    f"level '{job.level.value}' below minimum '{_LEVEL_ORDER[min_idx].value}'"
-                )
-                continue
-
-            # Check maximum
-            if max_idx is not None and job_idx > max_idx:
-                reasons.append(
-                    f"[{self.get_name()}] Removed '{job.title}' at {job.company}: "
-                    f"level '{job.level.value}' above maximum '{_LEVEL_ORDER[max_idx].value}'"
+            if job_idx < lo:
+                return (
+                    f"[{name}] Removed '{job.title}' at {job.company}: "
+                    f"level '{job.level.value}' below minimum '{_LEVEL_ORDER[lo].value}'"
                 )
-                continue
-
-            filtered.append(job)
 
-        removed = len(jobs) - len(filtered)
-        if removed:
-            logger.info(f"ExperienceLevelFilter: removed {removed}/{len(jobs)} jobs")
+            # Otherwise it is above the maximum
+            return (
+                f"[{name}] Removed '{job.title}' at {job.company}: "
+                f"level '{job.level.value}' above maximum '{_LEVEL_ORDER[hi].value}'"
+            )
 
-        return filtered, reasons
+        return check
 
     def get_name(self) -> str:
         return "experience_level_filter"
@@ -358,7 +429,7 @@ class ExperienceLevelFilter(JobFilter):
 # Keyword filter
 # ---------------------------------------------------------------------------
 
-class KeywordFilter(JobFilter):
+class KeywordFilter(StreamingJobFilter):
     """
     Filters jobs based on excluded keywords.
 
@@ -375,36 +446,49 @@ class KeywordFilter(JobFilter):
         """
         self.excluded_keywords = [_normalize(kw) for kw in (excluded_keywords or [])]
 
-    def apply(self, jobs: List[Job], profile: UserProfile) -> Tuple[List[Job], List[str]]:
+        # ASCII keywords can be matched against the UTF-8 encoded blob directly,
+        # which lets CPython use its byte-level substring search.
+        self._ascii = all(kw.isascii() for kw in self.excluded_keywords)
+        self._excluded_bytes: List[Tuple[bytes, str]] = (
+            [(kw.encode("ascii"), kw) for kw in self.excluded_keywords]
+            if self._ascii else []
+        )
+
+    def specialize(self, profile: UserProfile) -> Callable[[Job], Optional[str]]:
         """Filter by excluded keywords."""
         if not self.excluded_keywords:
-            return jobs, []
+            return _keep_all
 
-        filtered = []
-        reasons = []
+        name = self.get_name()
 
-        for job in jobs:
-            text = _job_text_blob(job)
-            matched_keyword = None
+        if self._ascii:
+            excluded_bytes = self._excluded_bytes
 
-            for keyword in self.excluded_keywords:
-                if keyword in text:
-                    matched_keyword = keyword
-                    break
+            def find_keyword(text: str) -> Optional[str]:
+                text_b = text.encode("utf-8", "surrogatepass")
+                for keyword_b, keyword in excluded_bytes:
+                    if keyword_b in text_b:
+                        return keyword
+                return None
+        else:
+            excluded = self.excluded_keywords
 
+            def find_keyword(text: str) -> Optional[str]:
+                for keyword in excluded:
+                    if keyword in text:
+                        return keyword
+                return None
+
+        def check(job: Job) -> Optional[str]:
+            matched_keyword = find_keyword(_job_text_blob(job))
             if matched_keyword:
-                reasons.append(
-                    f"[{self.get_name()}] Removed '{job.title}' at {job.company}: "
+                return (
+                    f"[{name}] Removed '{job.title}' at {job.company}: "
                     f"contains excluded keyword '{matched_keyword}'"
                 )
-            else:
-                filtered.append(job)
-
-        removed = len(jobs) - len(filtered)
-        if removed:
-            logger.info(f"KeywordFilter: removed {removed}/{len(jobs)} jobs")
+            return None
 
-        return filtered, reasons
+        return check
 
     def get_name(self) -> str:
         return "keyword_filter"
@@ -441,13 +525,20 @@ class DuplicateFilter(JobFilter):
 
         filtered = []
         reasons = []
-        seen_ids: Set[str] = set()
-        seen_urls: Set[str] = set()
-        seen_signatures: List[str] = []  # normalized "title @ company" strings
+        # Exact-match keys: ("id", job_id) and ("url", clean_url) share one dict
+        seen: Dict[Tuple[str, str], str] = {}
+        # Word sets of kept "title @ company" signatures, plus an inverted
+        # index word -> positions so only postings sharing a title/company word
+        # are compared. The "@" separator is in every signature, so it is kept
+        # for the similarity but never indexed; two postings sharing nothing
+        # else score at most 0.5 (or 1.0 when both are blank, keyed under "").
+        seen_word_sets: List[Set[str]] = []
+        word_index: Dict[str, List[int]] = {}
+        compare_all = self.similarity_threshold <= 0.5
 
         for job in jobs:
             # Check 1: Exact job_id match
-            if job.job_id in seen_ids:
+            if ("id", job.job_id) in seen:
                 reasons.append(
                     f"[{self.get_name()}] Removed duplicate '{job.title}' at {job.company}: "
                     f"same job_id '{job.job_id}'"
@@ -457,21 +548,28 @@ class DuplicateFilter(JobFilter):
             # Check 2: Exact URL match
             if job.url:
                 # Normalize URL: strip query params and trailing slashes
-                clean_url = job.url.split("?")[0].rstrip("/").lower()
-                if clean_url in seen_urls:
+                url_key = ("url", job.url.split("?")[0].rstrip("/").lower())
+                if url_key in seen:
                     reasons.append(
                         f"[{self.get_name()}] Removed duplicate '{job.title}' at {job.company}: "
                         f"same URL"
                     )
                     continue
-                seen_urls.add(clean_url)
+                seen[url_key] = job.job_id
 
             # Check 3: Title + company similarity
-            signature = _normalize(f"{job.title} @ {job.company}")
-            is_duplicate = False
+            words = set(_normalize(f"{job.title} @ {job.company}").split())
+            index_words = (words - {"@"}) or {""}
+            if compare_all:
+                candidates = range(len(seen_word_sets))
+            else:
+                candidates = sorted({
+                    pos for word in index_words for pos in word_index.get(word, ())
+                })
 
-            for existing_sig in seen_signatures:
-                similarity = self._compute_similarity(signature, existing_sig)
+            is_duplicate = False
+            for pos in candidates:
+                similarity = self._jaccard(words, seen_word_sets[pos])
                 if similarity >= self.similarity_threshold:
                     reasons.append(
                         f"[{self.get_name()}] Removed duplicate '{job.title}' at {job.company}: "
@@ -484,8 +582,11 @@ class DuplicateFilter(JobFilter):
                 continue
 
             # Not a duplicate — keep it
-            seen_ids.add(job.job_id)
-            seen_signatures.append(signature)
+            seen[("id", job.job_id)] = job.job_id
+            if not compare_all:
+                for word in index_words:
+                    word_index.setdefault(word, []).append(len(seen_word_sets))
+            seen_word_sets.append(words)
             filtered.append(job)
 
         removed = len(jobs) - len(filtered)
@@ -504,9 +605,11 @@ class DuplicateFilter(JobFilter):
 
         Returns a float between 0.0 (no overlap) and 1.0 (identical).
         """
-        words_a = set(text_a.split())
-        words_b = set(text_b.split())
+        return DuplicateFilter._jaccard(set(text_a.split()), set(text_b.split()))
 
+    @staticmethod
+    def _jaccard(words_a: Set[str], words_b: Set[str]) -> float:
+        """Jaccard similarity between two pre-split word sets."""
         if not words_a and not words_b:
             return 1.0
         if not words_a or not words_b:
@@ -574,23 +677,20 @@ class CompositeJobFilter(JobFilter):
 
     def _apply_or(self, jobs: List[Job], profile: UserProfile) -> Tuple[List[Job], List[str]]:
         """OR: a job is kept if ANY filter accepts it."""
-        all_reasons = []
-        kept_ids: Set[str] = set()
-
+        # OR the per-filter masks together as big integers: one C-level
+        # bitwise op per filter instead of a Python loop over jobs.
+        keep_bits = 0
         for filt in self.filters:
-            passed, reasons = filt.apply(jobs, profile)
-            for job in passed:
-                kept_ids.add(job.job_id)
-            all_reasons.extend(reasons)
-
-        # Keep jobs that passed at least one filter
-        filtered = [job for job in jobs if job.job_id in kept_ids]
+            keep_bits |= int.from_bytes(filt.apply_mask(jobs, profile), "big")
+        keep = keep_bits.to_bytes(len(jobs), "big")
 
-        # Only report reasons for jobs that were removed by ALL filters
-        removed_ids = {job.job_id for job in jobs} - kept_ids
+        filtered = []
         final_reasons = []
-        for job in jobs:
-            if job.job_id in removed_ids:
+        for job, kept in zip(jobs, keep):
+            if kept:
+                filtered.append(job)
+            else:
+                # Only report jobs that were removed by ALL filters
                 final_reasons.append(
                     f"[{self.get_name()}] Removed '{job.title}' at {job.company}: "
                     f"failed all OR filters"
@@ -655,16 +755,28 @@ class JobFilterPipeline:
 
         logger.info(f"FilterPipeline: starting with {len(current_jobs)} jobs")
 
-        for filt in self.filters:
-            before_count = len(current_jobs)
-            current_jobs, reasons = filt.apply(current_jobs, profile)
-            removed_count = before_count - len(current_jobs)
+        # Chain the filters lazily so only the final survivors are materialized.
+        # stage_counts[i] is the number of jobs that entered filter i.
+        stage_counts = [len(current_jobs)] + [0] * len(self.filters)
+        stage_reasons: List[List[str]] = [[] for _ in self.filters]
+        stream: Iterable[Job] = current_jobs
+        for idx, filt in enumerate(self.filters):
+            stream = _count_through(
+                filt.apply_stream(stream, profile, stage_reasons[idx]),
+                stage_counts, idx + 1,
+            )
+        current_jobs = list(stream)
+
+        for idx, filt in enumerate(self.filters):
+            before_count = stage_counts[idx]
+            after_count = stage_counts[idx + 1]
+            removed_count = before_count - after_count
 
             if removed_count > 0:
                 per_filter[filt.get_name()] = removed_count
-                all_reasons.extend(reasons)
+                all_reasons.extend(stage_reasons[idx])
                 logger.info(
-                    f"  {filt.get_name()}: {before_count} -> {len(current_jobs)} "
+                    f"  {filt.get_name()}: {before_count} -> {after_count} "
                     f"({removed_count} removed)"
                 )
 
@@ -2,21 +2,42 @@
 Job fetcher implementations for various sources.
 
 Fetches job postings from LinkedIn and Indeed via web scraping.
-Uses requests + BeautifulSoup with anti-detection measures (UA rotation, rate limiting).
+Uses httpx (HTTP/2 when h2 is installed) + BeautifulSoup with anti-detection measures
+(UA rotation, rate limiting), fetching search-result pages concurrently under a
+bounded semaphore.
 """
 
+import asyncio
 import hashlib
 import logging
 import random
 import re
 import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
-from urllib.parse import quote_plus
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional, Dict, Any, Callable, Set, Tuple, Union
+from urllib.parse import urlencode
 
+import httpx
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import lxml  # noqa: F401  (C-backed tree builder for BeautifulSoup)
+    _HTML_PARSER = "lxml"
+except ImportError:
+    _HTML_PARSER = "html.parser"
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
 
 from models.schemas import Job, Location, Salary
 
@@ -43,20 +64,516 @@ DEFAULT_HEADERS = {
     "Connection": "keep-alive",
 }
 
+# Patterns compiled once at import; used for every card parsed.
+_RE_PAREN = re.compile(r"\s*\(.*\)")
+_RE_REL_DATE = re.compile(r"(\d+)\s*(second|minute|hour|day|week|month)")
+# Amounts and period words in one pass; the period branch is a lookahead so
+# overlapping words ("monthour") are all seen, as with substring checks.
+_RE_SALARY = re.compile(r"[\$]?([\d,]+\.?\d*)|(?=(hour|month|week))", re.IGNORECASE)
+_SALARY_PERIOD_RANK = {"hour": 0, "month": 1, "week": 2}
+_SALARY_PERIODS = ("hourly", "monthly", "weekly", "yearly")
+
+_RE_LI_CARD = re.compile(r"base-card|base-search-card")
+_RE_LI_LIST = re.compile(r"jobs-search")
+_RE_LI_TITLE = re.compile(r"base-search-card__title")
+_RE_LI_SUBTITLE = re.compile(r"base-search-card__subtitle")
+_RE_LI_LOCATION = re.compile(r"job-search-card__location")
+_RE_LI_LINK = re.compile(r"base-card__full-link")
+_RE_LI_VIEW_HREF = re.compile(r"/jobs/view/")
+
+_RE_IND_CARD = re.compile(r"job_seen_beacon|cardOutline")
+_RE_IND_TAP = re.compile(r"tapItem|jcs-JobTitle")
+_RE_IND_TITLE = re.compile(r"jobTitle")
+_RE_IND_JOBTITLE = re.compile(r"jcs-JobTitle")
+_RE_IND_COMPANY = re.compile(r"company")
+_RE_IND_COMPANY_LOC = re.compile(r"company[Ll]ocation")
+_RE_IND_LOCATION = re.compile(r"location")
+_RE_IND_HREF = re.compile(r"/rc/clk|/viewjob")
+_RE_IND_SALARY_SNIPPET = re.compile(r"salary-snippet")
+_RE_IND_SALARY = re.compile(r"salary")
+_RE_IND_METADATA_SALARY = re.compile(r"metadata.*salary")
+_RE_IND_DATE = re.compile(r"date")
+
+# Strainers restrict tree building to the card containers we actually read
+_LI_CARD_STRAINER = SoupStrainer("div", class_=_RE_LI_CARD)
+_LI_LIST_STRAINER = SoupStrainer("li", class_=_RE_LI_LIST)
+_IND_CARD_STRAINER = SoupStrainer("div", class_=_RE_IND_CARD)
+_IND_RESULT_STRAINER = SoupStrainer("td", class_="resultContent")
+_IND_TAP_STRAINER = SoupStrainer("a", class_=_RE_IND_TAP)
+
+# Card fields as (key, tag name, attribute, pattern). A card is walked once and
+# the first descendant matching each entry is kept; the parsers then apply the
+# same fallback order the individual find() calls used.
+_LI_CARD_FIELDS = [
+    ("title", "h3", "class", _RE_LI_TITLE),
+    ("any_h3", "h3", None, None),
+    ("company", "h4", "class", _RE_LI_SUBTITLE),
+    ("any_h4", "h4", None, None),
+    ("location", "span", "class", _RE_LI_LOCATION),
+    ("link", "a", "class", _RE_LI_LINK),
+    ("view_link", "a", "href", _RE_LI_VIEW_HREF),
+    ("time", "time", None, None),
+]
+
+_IND_CARD_FIELDS = [
+    ("title", "h2", "class", _RE_IND_TITLE),
+    ("jobtitle_link", "a", "class", _RE_IND_JOBTITLE),
+    ("any_h2", "h2", None, None),
+    ("company_testid", "span", "data-testid", "company-name"),
+    ("company", "span", "class", _RE_IND_COMPANY),
+    ("company_name", "span", "class", "companyName"),
+    ("location_testid", "div", "data-testid", "text-location"),
+    ("company_location", "div", "class", _RE_IND_COMPANY_LOC),
+    ("location", "span", "class", _RE_IND_LOCATION),
+    ("href_link", "a", "href", _RE_IND_HREF),
+    ("jk_link", "a", "data-jk", True),
+    ("salary_snippet", "div", "class", _RE_IND_SALARY_SNIPPET),
+    ("salary", "span", "class", _RE_IND_SALARY),
+    ("metadata_salary", "div", "class", _RE_IND_METADATA_SALARY),
+    ("date", "span", "class", _RE_IND_DATE),
+]
+
+
+def _group_fields(fields: List[tuple]) -> Dict[str, List[tuple]]:
+    """Bucket (key, tag, attr, pattern) entries by tag name, keeping their order."""
+    grouped: Dict[str, List[tuple]] = {}
+    for key, name, attr, pattern in fields:
+        grouped.setdefault(name, []).append((key, attr, pattern))
+    return grouped
+
+
+_LI_CARD_FIELDS_BY_TAG = _group_fields(_LI_CARD_FIELDS)
+_IND_CARD_FIELDS_BY_TAG = _group_fields(_IND_CARD_FIELDS)
+
+
+# One prebuilt header dict per user-agent; treat these as read-only.
+_UA_HEADERS = tuple({"User-Agent": ua} for ua in USER_AGENTS)
+
 
 def _get_random_headers(referer: Optional[str] = None) -> Dict[str, str]:
-    """Return request headers with a random user-agent."""
-    headers = dict(DEFAULT_HEADERS)
-    headers["User-Agent"] = random.choice(USER_AGENTS)
+    """
+    Return per-request headers with a random user-agent.
+
+    DEFAULT_HEADERS are installed once on each HTTP session, so only the
+    headers that vary per request are built here. Without a referer the
+    returned dict is shared and must not be mutated.
+    """
+    headers = random.choice(_UA_HEADERS)
     if referer:
-        headers["Referer"] = referer
+        return {**headers, "Referer": referer}
     return headers
 
 
-def _rate_limit_delay(min_s: float = 1.0, max_s: float = 3.0) -> None:
-    """Sleep for a random interval to avoid detection."""
-    delay = random.uniform(min_s, max_s)
-    time.sleep(delay)
+def _build_session() -> requests.Session:
+    """
+    Create a requests.Session with a sized, retrying connection pool.
+
+    Keeping one pooled session per fetcher lets TLS connections be reused
+    across calls instead of re-handshaking for every request. 429 and 503 are
+    left to the fetch loop's capped backoff, so urllib3 neither retries them
+    nor sleeps on an unbounded Retry-After.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[500, 502, 504],
+            respect_retry_after_header=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(DEFAULT_HEADERS)
+    return session
+
+
+class PageCache:
+    """
+    Cache of fetched search-result pages keyed by (url, time bucket).
+
+    Responsibility: Lets repeated searches within the same bucket (default one
+    hour) skip the HTTP round-trip. Pages are always kept in memory and, when a
+    cache directory is configured, also written to disk so they survive restarts.
+    Disk files from earlier buckets are deleted on the first write of each bucket.
+    """
+
+    def __init__(self, bucket_seconds: int = 3600, cache_dir: Optional[str] = None):
+        """
+        Initialize page cache.
+
+        Args:
+            bucket_seconds: Width of the time bucket a cached page stays valid for
+            cache_dir: Optional directory for the on-disk layer (None = memory only)
+        """
+        self.bucket_seconds = max(1, int(bucket_seconds))
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._bucket = -1
+        self._pruned_bucket = -1
+        self._memory: Dict[Tuple[str, int], bytes] = {}
+
+    def get(self, url: str) -> Optional[bytes]:
+        """Return the cached page for url in the current bucket, or None."""
+        key = (url, self._current_bucket())
+        html = self._memory.get(key)
+        if html is not None or self.cache_dir is None:
+            return html
+
+        path = self._disk_path(key)
+        try:
+            html = path.read_bytes()
+        except OSError:
+            return None
+        self._memory[key] = html
+        return html
+
+    def put(self, url: str, html: bytes) -> None:
+        """Store a page for url in the current bucket."""
+        key = (url, self._current_bucket())
+        self._memory[key] = html
+        if self.cache_dir is None:
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            if self._pruned_bucket != key[1]:
+                self._prune_disk(key[1])
+            self._disk_path(key).write_bytes(html)
+        except OSError as e:
+            logger.debug(f"PageCache: failed to write {url}: {e}")
+
+    def clear(self) -> None:
+        """Drop all in-memory entries."""
+        self._memory.clear()
+
+    def _current_bucket(self) -> int:
+        bucket = int(time.time() // self.bucket_seconds)
+        if bucket != self._bucket:
+            # Entries from earlier buckets can never be hit again
+            self._memory.clear()
+            self._bucket = bucket
+        return bucket
+
+    def _prune_disk(self, bucket: int) -> None:
+        """Delete on-disk pages written before bucket started; they can't be hit again."""
+        cutoff = bucket * self.bucket_seconds
+        for path in self.cache_dir.glob("*.html"):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except OSError:
+                continue  # removed concurrently, or not ours to delete
+        self._pruned_bucket = bucket
+
+    def _disk_path(self, key: Tuple[str, int]) -> Path:
+        url, bucket = key
+        digest = hashlib.sha256(f"{bucket}:{url}".encode()).hexdigest()
+        return self.cache_dir / f"{digest}.html"
+
+
+_RETRY_STATUSES = (429, 503)
+_MAX_BACKOFF = 60.0
+
+
+def _retry_delay(retry_after: Optional[str], attempt: int) -> float:
+    """Seconds to wait before retry number attempt + 1 (Retry-After wins if given)."""
+    try:
+        base = float(retry_after) if retry_after else 0.0
+    except ValueError:
+        base = 0.0  # HTTP-date form; fall back to exponential backoff
+    if base <= 0:
+        base = min(_MAX_BACKOFF, 2.0 ** attempt)
+    return min(_MAX_BACKOFF, base) + random.uniform(0, 1)
+
+
+async def _fetch_pages(
+    source_label: str,
+    urls: List[str],
+    referer: str,
+    timeout: float,
+    concurrency: int,
+    rate_min: float,
+    rate_max: float,
+    cache: Optional[PageCache] = None,
+    max_retries: int = 3,
+    parse: Optional[Callable[[bytes], Any]] = None,
+) -> List[Optional[Any]]:
+    """
+    Fetch search-result pages concurrently, preserving URL order.
+
+    At most ``concurrency`` requests are in flight; every page after the first
+    waits a random ``rate_min``-``rate_max`` seconds inside the semaphore so the
+    per-host request rate stays bounded. Pages found in ``cache`` are returned
+    without a request, and successful responses are stored in it. A 429 or 503
+    is retried up to ``max_retries`` times with exponential backoff and jitter,
+    honouring a numeric Retry-After header.
+
+    Results are positional, so once a page fails, is blocked or parses to no
+    results, pages after it that have not been requested yet are skipped
+    rather than sent to a host that is already refusing us.
+
+    Bodies are kept as bytes so the HTML parser decodes them once; pages served
+    in another charset are transcoded to UTF-8 up front. When ``parse`` is given
+    each page is handed to it on a worker thread as soon as it arrives, so
+    parsing overlaps the remaining downloads.
+
+    Returns:
+        Per URL, the UTF-8 page HTML (or ``parse(html)`` when parse is given),
+        or None where the request failed, was blocked or was skipped
+
+    Raises:
+        ConnectionError: If the source is unreachable
+    """
+    sem = asyncio.BoundedSemaphore(max(1, concurrency))
+    # Index of the first failed, blocked or empty page; later pages are skipped
+    stop_at = len(urls)
+    limits = httpx.Limits(
+        max_connections=max(1, concurrency), max_keepalive_connections=max(1, concurrency)
+    )
+
+    # With HTTP/2 all pages for the host share one multiplexed connection
+    async with httpx.AsyncClient(
+        http2=_HTTP2_AVAILABLE, limits=limits, timeout=timeout, headers=DEFAULT_HEADERS
+    ) as client:
+
+        async def fetch_page(idx: int, url: str) -> Optional[bytes]:
+            if cache is not None:
+                cached = cache.get(url)
+                if cached is not None:
+                    logger.debug("%s: page %d served from cache", source_label, idx)
+                    return cached
+
+            async with sem:
+                if idx > 0:
+                    await asyncio.sleep(random.uniform(rate_min, rate_max))
+                for attempt in range(max_retries + 1):
+                    if idx > stop_at:
+                        return None
+                    try:
+                        headers = _get_random_headers(referer=referer)
+                        response = await client.get(url, headers=headers)
+                    except httpx.TimeoutException:
+                        logger.warning(f"{source_label}: request timed out on page {idx}")
+                        return None
+                    except httpx.NetworkError as e:
+                        logger.error(f"{source_label}: connection error: {e}")
+                        raise ConnectionError(
+                            f"Failed to connect to {source_label}: {e}"
+                        ) from e
+                    except httpx.HTTPError as e:
+                        logger.error(f"{source_label}: request error: {e}")
+                        return None
+
+                    status = response.status_code
+                    if status in _RETRY_STATUSES and attempt < max_retries:
+                        delay = _retry_delay(response.headers.get("Retry-After"), attempt)
+                        logger.warning(
+                            f"{source_label}: status {status} on page {idx}, "
+                            f"retrying in {delay:.1f}s ({attempt + 1}/{max_retries})"
+                        )
+                    elif status == 429:
+                        logger.warning(f"{source_label}: rate limited (429) on page {idx}")
+                        return None
+                    elif status == 403:
+                        logger.warning(f"{source_label}: access forbidden (403) on page {idx}")
+                        return None
+                    elif status != 200:
+                        logger.warning(f"{source_label}: unexpected status {status}")
+                        return None
+                    else:
+                        html = _to_utf8(response.content, response.charset_encoding)
+                        if cache is not None:
+                            cache.put(url, html)
+                        return html
+
+                    # Back off while holding the slot so the whole source slows down
+                    await asyncio.sleep(delay)
+                return None
+
+        loop = asyncio.get_running_loop()
+        # One parser thread: parsing holds the GIL, so more workers would only
+        # contend; the win is overlapping it with network waits. The thread is
+        # only started if parse is given.
+        with ThreadPoolExecutor(max_workers=1) as parser:
+
+            async def fetch_one(idx: int, url: str) -> Optional[Any]:
+                nonlocal stop_at
+                page = await fetch_page(idx, url)
+                if page is not None and parse is not None:
+                    page = await loop.run_in_executor(parser, parse, page)
+                if not page:
+                    stop_at = min(stop_at, idx)
+                return page
+
+            return await asyncio.gather(
+                *(fetch_one(idx, url) for idx, url in enumerate(urls))
+            )
+
+
+def _in_event_loop() -> bool:
+    """True when called from a running event loop, where asyncio.run() fails."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def _to_utf8(html: bytes, charset: Optional[str]) -> bytes:
+    """
+    Transcode a page body served in charset to UTF-8.
+
+    An unknown charset label falls back to UTF-8 with undecodable bytes replaced.
+    """
+    charset = (charset or "utf-8").lower()
+    if charset in ("utf-8", "utf8"):
+        return html
+    try:
+        text = html.decode(charset, errors="replace")
+    except LookupError:
+        logger.debug(f"Unknown charset '{charset}', decoding as utf-8")
+        text = html.decode("utf-8", errors="replace")
+    return text.encode("utf-8")
+
+
+def _header_charset(content_type: Optional[str]) -> Optional[str]:
+    """The charset parameter of a Content-Type header, or None."""
+    for param in (content_type or "").split(";")[1:]:
+        key, _, value = param.partition("=")
+        if key.strip().lower() == "charset":
+            return value.strip().strip("\"'") or None
+    return None
+
+
+def _fetch_pages_sync(
+    session: requests.Session,
+    source_label: str,
+    urls: List[str],
+    referer: str,
+    timeout: float,
+    rate_min: float,
+    rate_max: float,
+    cache: Optional[PageCache] = None,
+    max_retries: int = 3,
+    parse: Optional[Callable[[bytes], Any]] = None,
+) -> List[Optional[Any]]:
+    """
+    Blocking counterpart of _fetch_pages() over a pooled requests session.
+
+    Pages are fetched one at a time, with the same caching, rate limiting,
+    retry and charset handling. Fetching stops at the first page that fails,
+    is blocked or parses to no results, so the returned list may be shorter
+    than ``urls``. Used when fetch() is called from a running event loop,
+    where the async path cannot be started.
+
+    Returns:
+        Per URL fetched, the UTF-8 page HTML (or ``parse(html)`` when parse is
+        given), or None where the request failed or was blocked
+
+    Raises:
+        ConnectionError: If the source is unreachable
+    """
+
+    def fetch_page(idx: int, url: str) -> Optional[bytes]:
+        if cache is not None:
+            cached = cache.get(url)
+            if cached is not None:
+                logger.debug("%s: page %d served from cache", source_label, idx)
+                return cached
+
+        if idx > 0:
+            time.sleep(random.uniform(rate_min, rate_max))
+        for attempt in range(max_retries + 1):
+            try:
+                response = session.get(
+                    url, headers=_get_random_headers(referer=referer), timeout=timeout
+                )
+            except requests.exceptions.Timeout:
+                logger.warning(f"{source_label}: request timed out on page {idx}")
+                return None
+            except requests.exceptions.ConnectionError as e:
+                logger.error(f"{source_label}: connection error: {e}")
+                raise ConnectionError(f"Failed to connect to {source_label}: {e}") from e
+            except requests.exceptions.RequestException as e:
+                logger.error(f"{source_label}: request error: {e}")
+                return None
+
+            status = response.status_code
+            if status in _RETRY_STATUSES and attempt < max_retries:
+                delay = _retry_delay(response.headers.get("Retry-After"), attempt)
+                logger.warning(
+                    f"{source_label}: status {status} on page {idx}, "
+                    f"retrying in {delay:.1f}s ({attempt + 1}/{max_retries})"
+                )
+                time.sleep(delay)
+            elif status == 429:
+                logger.warning(f"{source_label}: rate limited (429) on page {idx}")
+                return None
+            elif status == 403:
+                logger.warning(f"{source_label}: access forbidden (403) on page {idx}")
+                return None
+            elif status != 200:
+                logger.warning(f"{source_label}: unexpected status {status}")
+                return None
+            else:
+                html = _to_utf8(
+                    response.content, _header_charset(response.headers.get("Content-Type"))
+                )
+                if cache is not None:
+                    cache.put(url, html)
+                return html
+        return None
+
+    pages = []
+    for idx, url in enumerate(urls):
+        html = fetch_page(idx, url)
+        page = parse(html) if parse is not None and html is not None else html
+        pages.append(page)
+        # Results are positional; nothing useful comes after a gap
+        if not page:
+            break
+    return pages
+
+
+def _collect_pages(
+    source_label: str,
+    offsets: List[int],
+    parsed_pages: List[Optional[List[Job]]],
+    max_results: int,
+) -> List[Job]:
+    """Join parsed result pages in offset order, stopping at the first empty page."""
+    jobs = []
+    seen: Set[str] = set()
+    for offset, page_jobs in zip(offsets, parsed_pages):
+        # A blocked or failed page ends pagination, as results are positional
+        if page_jobs is None:
+            break
+
+        if not page_jobs:
+            logger.debug("%s: no more results at offset %d", source_label, offset)
+            break
+
+        # Adjacent offsets often overlap; drop repeats before they go downstream
+        new_jobs = []
+        for job in page_jobs:
+            if job.job_id not in seen:
+                seen.add(job.job_id)
+                new_jobs.append(job)
+
+        if not new_jobs:
+            logger.debug(
+                "%s: page at offset %d only repeated earlier results", source_label, offset
+            )
+            break
+
+        jobs.extend(new_jobs)
+        logger.debug("%s: fetched %d new jobs at offset %d", source_label, len(new_jobs), offset)
+
+    # Trim to max_results
+    jobs = jobs[:max_results]
+    logger.info(f"{source_label}: fetched {len(jobs)} total jobs")
+    return jobs
 
 
 def _generate_job_id(source: str, identifier: str) -> str:
@@ -65,8 +582,69 @@ def _generate_job_id(source: str, identifier: str) -> str:
     return hashlib.md5(raw.encode()).hexdigest()[:12]
 
 
+def _make_soup(html: Union[str, bytes], strainer: SoupStrainer, encoding: str) -> BeautifulSoup:
+    """Parse html restricted to strainer, decoding bytes with the given encoding."""
+    if isinstance(html, bytes):
+        return BeautifulSoup(html, _HTML_PARSER, parse_only=strainer, from_encoding=encoding)
+    return BeautifulSoup(html, _HTML_PARSER, parse_only=strainer)
+
+
+def _attr_matches(tag: Tag, attr: str, pattern: Any) -> bool:
+    """Match one tag attribute the way BeautifulSoup's find() does."""
+    value = tag.get(attr)
+    if value is None:
+        return False
+    if pattern is True:
+        return True
+    if isinstance(value, list):
+        # Multi-valued attribute (class): match any single value or the whole
+        # joined string. The card patterns are unanchored, so a hit on any
+        # single value is also a hit on the joined string; one search suffices.
+        joined = " ".join(value)
+        if isinstance(pattern, str):
+            return pattern in value or joined == pattern
+        return pattern.search(joined) is not None
+    if isinstance(pattern, str):
+        return value == pattern
+    return pattern.search(value) is not None
+
+
+def _index_card(card: Tag, fields_by_tag: Dict[str, List[tuple]]) -> Dict[str, Tag]:
+    """Walk a card's descendants once, keeping the first tag matching each field."""
+    found: Dict[str, Tag] = {}
+    remaining = sum(len(entries) for entries in fields_by_tag.values())
+    for tag in card.descendants:
+        # Strings have no entry here (their name is None), so this also skips them
+        entries = fields_by_tag.get(tag.name)
+        if entries is None:
+            continue
+        for key, attr, pattern in entries:
+            if key in found:
+                continue
+            if attr is None or _attr_matches(tag, attr, pattern):
+                found[key] = tag
+                remaining -= 1
+        if not remaining:
+            break
+    return found
+
+
+# Shared by every card without a location; nothing downstream mutates Location.
+_EMPTY_LOCATION = Location(city="", state="", country="")
+
+
+@lru_cache(maxsize=4096)
 def _parse_location_string(location_str: str) -> Location:
     """Parse a location string like 'San Francisco, CA' into a Location object."""
+    # Location is immutable, so postings with the same string share one instance
+    city, state, country, is_remote = _parse_location_fields(location_str)
+    if is_remote and not city and not state and country == "US":
+        return Location.remote_instance()
+    return Location(city=city, state=state, country=country, remote=is_remote)
+
+
+def _parse_location_fields(location_str: str) -> Tuple[str, str, str, bool]:
+    """Split a location string into (city, state, country, remote)."""
     location_str = location_str.strip()
 
     is_remote = "remote" in location_str.lower()
@@ -79,39 +657,82 @@ def _parse_location_string(location_str: str) -> Location:
     # Clean up common patterns
     if city.lower() in ("remote", "remote in"):
         city = ""
-    state = re.sub(r"\s*\(.*\)", "", state)  # remove parenthetical notes
+    state = _RE_PAREN.sub("", state)  # remove parenthetical notes
 
-    return Location(city=city, state=state, country=country, remote=is_remote)
+    return city, state, country, is_remote
 
 
 def _parse_relative_date(date_text: str) -> Optional[datetime]:
     """Parse relative date strings like '3 days ago', '1 week ago' into datetime."""
+    age = _parse_relative_age(date_text)
+    if age is None:
+        return None
+    return datetime.now() - age
+
+
+@lru_cache(maxsize=1024)
+def _parse_relative_age(date_text: str) -> Optional[timedelta]:
+    """Parse a relative date string into how long ago it was (None if unknown)."""
     date_text = date_text.lower().strip()
-    now = datetime.now()
 
-    match = re.search(r"(\d+)\s*(second|minute|hour|day|week|month)", date_text)
+    match = _RE_REL_DATE.search(date_text)
     if match:
         amount = int(match.group(1))
         unit = match.group(2)
         if unit == "second":
-            return now - timedelta(seconds=amount)
+            return timedelta(seconds=amount)
         elif unit == "minute":
-            return now - timedelta(minutes=amount)
+            return timedelta(minutes=amount)
         elif unit == "hour":
-            return now - timedelta(hours=amount)
+            return timedelta(hours=amount)
         elif unit == "day":
-            return now - timedelta(days=amount)
+            return timedelta(days=amount)
         elif unit == "week":
-            return now - timedelta(weeks=amount)
+            return timedelta(weeks=amount)
         elif unit == "month":
-            return now - timedelta(days=amount * 30)
+            return timedelta(days=amount * 30)
 
     if "just" in date_text or "today" in date_text or "now" in date_text:
-        return now
+        return timedelta(0)
 
     return None
 
 
+JOB_COLUMNS = (
+    "job_id", "title", "company", "url", "source",
+    "city", "state", "country", "remote",
+    "posted_date", "salary_min", "salary_max", "salary_period",
+)
+
+
+def jobs_to_columns(jobs: List[Job]) -> Dict[str, List[Any]]:
+    """
+    Convert jobs to a struct-of-arrays layout keyed by JOB_COLUMNS.
+
+    Location and salary are flattened; missing values become None.
+    """
+    columns: Dict[str, List[Any]] = {name: [] for name in JOB_COLUMNS}
+
+    for job in jobs:
+        loc = job.location
+        sal = job.salary
+        row = (
+            job.job_id, job.title, job.company, job.url, job.source,
+            loc.city if loc else None,
+            loc.state if loc else None,
+            loc.country if loc else None,
+            loc.remote if loc else None,
+            job.posted_date,
+            sal.min_amount if sal else None,
+            sal.max_amount if sal else None,
+            sal.period if sal else None,
+        )
+        for name, value in zip(JOB_COLUMNS, row):
+            columns[name].append(value)
+
+    return columns
+
+
 # ---------------------------------------------------------------------------
 # Abstract base class
 # ---------------------------------------------------------------------------
@@ -134,7 +755,7 @@ class JobFetcher(ABC):
         """
         self.source_name = source_name
         self.config = config or {}
-        self.session = requests.Session()
+        self.session = _build_session()
 
     @abstractmethod
     def fetch(
@@ -162,6 +783,30 @@ class JobFetcher(ABC):
         """
         pass
 
+    def fetch_columns(
+        self,
+        query: str,
+        location: Optional[str] = None,
+        max_results: int = 50,
+        **filters
+    ) -> Dict[str, List[Any]]:
+        """
+        Fetch jobs and return them column-wise instead of as Job objects.
+
+        The result maps each of JOB_COLUMNS to a list with one entry per job,
+        ready for ``pyarrow.table(...)`` or ``pandas.DataFrame(...)``.
+
+        Args:
+            query: Job search query (title, keywords, etc.)
+            location: Optional location filter
+            max_results: Maximum number of results to return
+            **filters: Additional filters specific to the source
+
+        Returns:
+            Dict of column name to list of values
+        """
+        return jobs_to_columns(self.fetch(query, location, max_results, **filters))
+
     @abstractmethod
     def validate_connection(self) -> bool:
         """
@@ -197,8 +842,16 @@ class LinkedInJobFetcher(JobFetcher):
                 - rate_limit_min: min delay between requests (default 1.0)
                 - rate_limit_max: max delay between requests (default 3.0)
                 - timeout: request timeout in seconds (default 15)
+                - concurrency: max concurrent page requests (default 5)
+                - max_retries: retries for a 429/503 page before giving up (default 3)
+                - cache_ttl: seconds a fetched page is reused for (default 3600)
+                - cache_dir: directory for the on-disk page cache (default: memory only)
         """
         super().__init__("linkedin", config)
+        self.page_cache = PageCache(
+            bucket_seconds=self.config.get("cache_ttl", 3600),
+            cache_dir=self.config.get("cache_dir"),
+        )
 
     def fetch(
         self,
@@ -210,6 +863,11 @@ class LinkedInJobFetcher(JobFetcher):
         """
         Fetch jobs from LinkedIn public search pages.
 
+        Synchronous wrapper around fetch_async(). Called from a running event
+        loop (an async web route, Jupyter), where asyncio.run() cannot be used,
+        it fetches the pages one by one on the pooled session instead; async
+        callers should await fetch_async() for concurrent page requests.
+
         Args:
             query: Job title or keywords
             location: Job location
@@ -219,66 +877,68 @@ class LinkedInJobFetcher(JobFetcher):
         Returns:
             List of Job objects from LinkedIn
         """
-        if not query or not query.strip():
-            raise ValueError("Search query cannot be empty")
+        if not _in_event_loop():
+            return asyncio.run(self.fetch_async(query, location, max_results, **filters))
 
-        jobs = []
-        offset = 0
-        timeout = self.config.get("timeout", 15)
-        rate_min = self.config.get("rate_limit_min", 1.0)
-        rate_max = self.config.get("rate_limit_max", 3.0)
-
-        logger.info(
-            f"LinkedIn: fetching jobs for query='{query}', "
-            f"location='{location}', max_results={max_results}"
+        offsets, urls = self._search_pages(query, location, max_results)
+        parsed_pages = _fetch_pages_sync(
+            self.session, "LinkedIn", urls, referer="https://www.linkedin.com/jobs/",
+            **self._page_options(),
         )
+        return _collect_pages("LinkedIn", offsets, parsed_pages, max_results)
 
-        while len(jobs) < max_results:
-            url = self._build_search_url(query, location, offset)
-            headers = _get_random_headers(referer="https://www.linkedin.com/jobs/")
-
-            try:
-                response = self.session.get(url, headers=headers, timeout=timeout)
-
-                if response.status_code == 429:
-                    logger.warning("LinkedIn: rate limited (429). Stopping pagination.")
-                    break
-                if response.status_code == 403:
-                    logger.warning("LinkedIn: access forbidden (403). Stopping pagination.")
-                    break
-                if response.status_code != 200:
-                    logger.warning(f"LinkedIn: unexpected status {response.status_code}")
-                    break
+    async def fetch_async(
+        self,
+        query: str,
+        location: Optional[str] = None,
+        max_results: int = 50,
+        **filters
+    ) -> List[Job]:
+        """
+        Fetch all needed LinkedIn search pages concurrently, then parse them in order.
 
-                page_jobs = self._parse_search_results(response.text)
+        Args:
+            query: Job title or keywords
+            location: Job location
+            max_results: Maximum results
+            **filters: Additional filters (not currently used)
 
-                if not page_jobs:
-                    logger.debug(f"LinkedIn: no more results at offset {offset}")
-                    break
+        Returns:
+            List of Job objects from LinkedIn
+        """
+        offsets, urls = self._search_pages(query, location, max_results)
+        parsed_pages = await _fetch_pages(
+            "LinkedIn", urls, referer="https://www.linkedin.com/jobs/",
+            concurrency=self.config.get("concurrency", 5),
+            **self._page_options(),
+        )
+        return _collect_pages("LinkedIn", offsets, parsed_pages, max_results)
 
-                jobs.extend(page_jobs)
-                logger.debug(f"LinkedIn: fetched {len(page_jobs)} jobs at offset {offset}")
+    def _search_pages(
+        self, query: str, location: Optional[str], max_results: int
+    ) -> Tuple[List[int], List[str]]:
+        """Validate the query and return the result offsets and their page URLs."""
+        if not query or not query.strip():
+            raise ValueError("Search query cannot be empty")
 
-                offset += self.RESULTS_PER_PAGE
-                if len(jobs) < max_results:
-                    _rate_limit_delay(rate_min, rate_max)
+        logger.info(
+            f"LinkedIn: fetching jobs for query='{query}', "
+            f"location='{location}', max_results={max_results}"
+        )
 
-            except requests.exceptions.ConnectionError as e:
-                logger.error(f"LinkedIn: connection error: {e}")
-                raise ConnectionError(
-                    f"Failed to connect to LinkedIn: {e}"
-                ) from e
-            except requests.exceptions.Timeout as e:
-                logger.warning(f"LinkedIn: request timed out at offset {offset}")
-                break
-            except requests.exceptions.RequestException as e:
-                logger.error(f"LinkedIn: request error: {e}")
-                break
+        offsets = list(range(0, max_results, self.RESULTS_PER_PAGE))
+        return offsets, self._build_search_urls(query, location, offsets)
 
-        # Trim to max_results
-        jobs = jobs[:max_results]
-        logger.info(f"LinkedIn: fetched {len(jobs)} total jobs")
-        return jobs
+    def _page_options(self) -> Dict[str, Any]:
+        """Page-fetch settings shared by the async and blocking paths."""
+        return {
+            "timeout": self.config.get("timeout", 15),
+            "rate_min": self.config.get("rate_limit_min", 1.0),
+            "rate_max": self.config.get("rate_limit_max", 3.0),
+            "cache": self.page_cache,
+            "max_retries": self.config.get("max_retries", 3),
+            "parse": self._parse_search_results,
+        }
 
     def validate_connection(self) -> bool:
         """Validate LinkedIn is reachable."""
@@ -303,24 +963,35 @@ class LinkedInJobFetcher(JobFetcher):
         self, query: str, location: Optional[str], offset: int
     ) -> str:
         """Build LinkedIn job search URL with parameters."""
-        params = f"keywords={quote_plus(query)}"
-        if location:
-            params += f"&location={quote_plus(location)}"
-        if offset > 0:
-            params += f"&start={offset}"
-        return f"{self.BASE_URL}?{params}"
+        return self._build_search_urls(query, location, [offset])[0]
 
-    def _parse_search_results(self, html: str) -> List[Job]:
+    def _build_search_urls(
+        self, query: str, location: Optional[str], offsets: List[int]
+    ) -> List[str]:
+        """Build LinkedIn search URLs for each offset, encoding query/location once."""
+        params = [("keywords", query)]
+        if location:
+            params.append(("location", location))
+        prefix = f"{self.BASE_URL}?{urlencode(params)}"
+        return [
+            f"{prefix}&start={offset}" if offset > 0 else prefix
+            for offset in offsets
+        ]
+
+    def _parse_search_results(
+        self, html: Union[str, bytes], encoding: str = "utf-8"
+    ) -> List[Job]:
         """Parse LinkedIn search results HTML into Job objects."""
-        soup = BeautifulSoup(html, "html.parser")
         jobs = []
 
         # LinkedIn public job search uses base-card or base-search-card divs
-        cards = soup.find_all("div", class_=re.compile(r"base-card|base-search-card"))
+        soup = _make_soup(html, _LI_CARD_STRAINER, encoding)
+        cards = soup.find_all("div", class_=_RE_LI_CARD)
 
         if not cards:
             # Fallback: try list items in the job results
-            cards = soup.find_all("li", class_=re.compile(r"jobs-search"))
+            soup = _make_soup(html, _LI_LIST_STRAINER, encoding)
+            cards = soup.find_all("li", class_=_RE_LI_LIST)
 
         for card in cards:
             try:
@@ -328,43 +999,37 @@ class LinkedInJobFetcher(JobFetcher):
                 if job:
                     jobs.append(job)
             except Exception as e:
-                logger.debug(f"LinkedIn: failed to parse job card: {e}")
+                logger.debug("LinkedIn: failed to parse job card: %s", e)
                 continue
 
         return jobs
 
     def _parse_job_card(self, card) -> Optional[Job]:
         """Parse a single LinkedIn job card into a Job object."""
+        found = _index_card(card, _LI_CARD_FIELDS_BY_TAG)
+
         # Title
-        title_elem = card.find("h3", class_=re.compile(r"base-search-card__title"))
-        if not title_elem:
-            title_elem = card.find("h3")
+        title_elem = found.get("title") or found.get("any_h3")
         title = title_elem.get_text(strip=True) if title_elem else None
 
         if not title:
             return None
 
         # Company
-        company_elem = card.find("h4", class_=re.compile(r"base-search-card__subtitle"))
-        if not company_elem:
-            company_elem = card.find("h4")
+        company_elem = found.get("company") or found.get("any_h4")
         company = company_elem.get_text(strip=True) if company_elem else "Unknown"
 
         # Location
-        location_elem = card.find("span", class_=re.compile(r"job-search-card__location"))
+        location_elem = found.get("location")
         location_text = location_elem.get_text(strip=True) if location_elem else ""
-        location = _parse_location_string(location_text) if location_text else Location(
-            city="", state="", country=""
-        )
+        location = _parse_location_string(location_text) if location_text else _EMPTY_LOCATION
 
         # URL
-        link_elem = card.find("a", class_=re.compile(r"base-card__full-link"))
-        if not link_elem:
-            link_elem = card.find("a", href=re.compile(r"/jobs/view/"))
+        link_elem = found.get("link") or found.get("view_link")
         url = link_elem.get("href", "").split("?")[0] if link_elem else None
 
         # Posted date
-        time_elem = card.find("time")
+        time_elem = found.get("time")
         posted_date = None
         if time_elem:
             datetime_attr = time_elem.get("datetime")
@@ -416,8 +1081,16 @@ class IndeedJobFetcher(JobFetcher):
                 - rate_limit_min: min delay between requests (default 1.0)
                 - rate_limit_max: max delay between requests (default 3.0)
                 - timeout: request timeout in seconds (default 15)
+                - concurrency: max concurrent page requests (default 5)
+                - max_retries: retries for a 429/503 page before giving up (default 3)
+                - cache_ttl: seconds a fetched page is reused for (default 3600)
+                - cache_dir: directory for the on-disk page cache (default: memory only)
         """
         super().__init__("indeed", config)
+        self.page_cache = PageCache(
+            bucket_seconds=self.config.get("cache_ttl", 3600),
+            cache_dir=self.config.get("cache_dir"),
+        )
 
     def fetch(
         self,
@@ -429,6 +1102,11 @@ class IndeedJobFetcher(JobFetcher):
         """
         Fetch jobs from Indeed public search pages.
 
+        Synchronous wrapper around fetch_async(). Called from a running event
+        loop (an async web route, Jupyter), where asyncio.run() cannot be used,
+        it fetches the pages one by one on the pooled session instead; async
+        callers should await fetch_async() for concurrent page requests.
+
         Args:
             query: Job title or keywords
             location: Job location
@@ -438,66 +1116,68 @@ class IndeedJobFetcher(JobFetcher):
         Returns:
             List of Job objects from Indeed
         """
-        if not query or not query.strip():
-            raise ValueError("Search query cannot be empty")
-
-        jobs = []
-        offset = 0
-        timeout = self.config.get("timeout", 15)
-        rate_min = self.config.get("rate_limit_min", 1.0)
-        rate_max = self.config.get("rate_limit_max", 3.0)
+        if not _in_event_loop():
+            return asyncio.run(self.fetch_async(query, location, max_results, **filters))
 
-        logger.info(
-            f"Indeed: fetching jobs for query='{query}', "
-            f"location='{location}', max_results={max_results}"
+        offsets, urls = self._search_pages(query, location, max_results)
+        parsed_pages = _fetch_pages_sync(
+            self.session, "Indeed", urls, referer="https://www.indeed.com/",
+            **self._page_options(),
         )
+        return _collect_pages("Indeed", offsets, parsed_pages, max_results)
 
-        while len(jobs) < max_results:
-            url = self._build_search_url(query, location, offset)
-            headers = _get_random_headers(referer="https://www.indeed.com/")
-
-            try:
-                response = self.session.get(url, headers=headers, timeout=timeout)
-
-                if response.status_code == 429:
-                    logger.warning("Indeed: rate limited (429). Stopping pagination.")
-                    break
-                if response.status_code == 403:
-                    logger.warning("Indeed: access forbidden (403). Stopping pagination.")
-                    break
-                if response.status_code != 200:
-                    logger.warning(f"Indeed: unexpected status {response.status_code}")
-                    break
+    async def fetch_async(
+        self,
+        query: str,
+        location: Optional[str] = None,
+        max_results: int = 50,
+        **filters
+    ) -> List[Job]:
+        """
+        Fetch all needed Indeed search pages concurrently, then parse them in order.
 
-                page_jobs = self._parse_search_results(response.text)
+        Args:
+            query: Job title or keywords
+            location: Job location
+            max_results: Maximum results
+            **filters: Additional filters (not currently used)
 
-                if not page_jobs:
-                    logger.debug(f"Indeed: no more results at offset {offset}")
-                    break
+        Returns:
+            List of Job objects from Indeed
+        """
+        offsets, urls = self._search_pages(query, location, max_results)
+        parsed_pages = await _fetch_pages(
+            "Indeed", urls, referer="https://www.indeed.com/",
+            concurrency=self.config.get("concurrency", 5),
+            **self._page_options(),
+        )
+        return _collect_pages("Indeed", offsets, parsed_pages, max_results)
 
-                jobs.extend(page_jobs)
-                logger.debug(f"Indeed: fetched {len(page_jobs)} jobs at offset {offset}")
+    def _search_pages(
+        self, query: str, location: Optional[str], max_results: int
+    ) -> Tuple[List[int], List[str]]:
+        """Validate the query and return the result offsets and their page URLs."""
+        if not query or not query.strip():
+            raise ValueError("Search query cannot be empty")
 
-                offset += self.RESULTS_PER_PAGE
-                if len(jobs) < max_results:
-                    _rate_limit_delay(rate_min, rate_max)
+        logger.info(
+            f"Indeed: fetching jobs for query='{query}', "
+            f"location='{location}', max_results={max_results}"
+        )
 
-            except requests.exceptions.ConnectionError as e:
-                logger.error(f"Indeed: connection error: {e}")
-                raise ConnectionError(
-                    f"Failed to connect to Indeed: {e}"
-                ) from e
-            except requests.exceptions.Timeout as e:
-                logger.warning(f"Indeed: request timed out at offset {offset}")
-                break
-            except requests.exceptions.RequestException as e:
-                logger.error(f"Indeed: request error: {e}")
-                break
+        offsets = list(range(0, max_results, self.RESULTS_PER_PAGE))
+        return offsets, self._build_search_urls(query, location, offsets)
 
-        # Trim to max_results
-        jobs = jobs[:max_results]
-        logger.info(f"Indeed: fetched {len(jobs)} total jobs")
-        return jobs
+    def _page_options(self) -> Dict[str, Any]:
+        """Page-fetch settings shared by the async and blocking paths."""
+        return {
+            "timeout": self.config.get("timeout", 15),
+            "rate_min": self.config.get("rate_limit_min", 1.0),
+            "rate_max": self.config.get("rate_limit_max", 3.0),
+            "cache": self.page_cache,
+            "max_retries": self.config.get("max_retries", 3),
+            "parse": self._parse_search_results,
+        }
 
     def validate_connection(self) -> bool:
         """Validate Indeed is reachable."""
@@ -522,28 +1202,40 @@ class IndeedJobFetcher(JobFetcher):
         self, query: str, location: Optional[str], offset: int
     ) -> str:
         """Build Indeed job search URL with parameters."""
-        params = f"q={quote_plus(query)}"
-        if location:
-            params += f"&l={quote_plus(location)}"
-        if offset > 0:
-            params += f"&start={offset}"
-        return f"{self.BASE_URL}?{params}"
+        return self._build_search_urls(query, location, [offset])[0]
 
-    def _parse_search_results(self, html: str) -> List[Job]:
+    def _build_search_urls(
+        self, query: str, location: Optional[str], offsets: List[int]
+    ) -> List[str]:
+        """Build Indeed search URLs for each offset, encoding query/location once."""
+        params = [("q", query)]
+        if location:
+            params.append(("l", location))
+        prefix = f"{self.BASE_URL}?{urlencode(params)}"
+        return [
+            f"{prefix}&start={offset}" if offset > 0 else prefix
+            for offset in offsets
+        ]
+
+    def _parse_search_results(
+        self, html: Union[str, bytes], encoding: str = "utf-8"
+    ) -> List[Job]:
         """Parse Indeed search results HTML into Job objects."""
-        soup = BeautifulSoup(html, "html.parser")
         jobs = []
 
         # Indeed uses job_seen_beacon divs or cardOutline for job cards
-        cards = soup.find_all("div", class_=re.compile(r"job_seen_beacon|cardOutline"))
+        soup = _make_soup(html, _IND_CARD_STRAINER, encoding)
+        cards = soup.find_all("div", class_=_RE_IND_CARD)
 
         if not cards:
             # Fallback: try result content divs
+            soup = _make_soup(html, _IND_RESULT_STRAINER, encoding)
             cards = soup.find_all("td", class_="resultContent")
 
         if not cards:
             # Another fallback: look for tapItem links
-            cards = soup.find_all("a", class_=re.compile(r"tapItem|jcs-JobTitle"))
+            soup = _make_soup(html, _IND_TAP_STRAINER, encoding)
+            cards = soup.find_all("a", class_=_RE_IND_TAP)
 
         for card in cards:
             try:
@@ -551,18 +1243,20 @@ class IndeedJobFetcher(JobFetcher):
                 if job:
                     jobs.append(job)
             except Exception as e:
-                logger.debug(f"Indeed: failed to parse job card: {e}")
+                logger.debug("Indeed: failed to parse job card: %s", e)
                 continue
 
         return jobs
 
     def _parse_job_card(self, card) -> Optional[Job]:
         """Parse a single Indeed job card into a Job object."""
+        found = _index_card(card, _IND_CARD_FIELDS_BY_TAG)
+
         # Title
         title_elem = (
-            card.find("h2", class_=re.compile(r"jobTitle"))
-            or card.find("a", class_=re.compile(r"jcs-JobTitle"))
-            or card.find("h2")
+            found.get("title")
+            or found.get("jobtitle_link")
+            or found.get("any_h2")
         )
         if title_elem:
             # Indeed sometimes wraps title in a span
@@ -576,28 +1270,26 @@ class IndeedJobFetcher(JobFetcher):
 
         # Company
         company_elem = (
-            card.find("span", attrs={"data-testid": "company-name"})
-            or card.find("span", class_=re.compile(r"company"))
-            or card.find("span", class_="companyName")
+            found.get("company_testid")
+            or found.get("company")
+            or found.get("company_name")
         )
         company = company_elem.get_text(strip=True) if company_elem else "Unknown"
 
         # Location
         location_elem = (
-            card.find("div", attrs={"data-testid": "text-location"})
-            or card.find("div", class_=re.compile(r"company[Ll]ocation"))
-            or card.find("span", class_=re.compile(r"location"))
+            found.get("location_testid")
+            or found.get("company_location")
+            or found.get("location")
         )
         location_text = location_elem.get_text(strip=True) if location_elem else ""
-        location = _parse_location_string(location_text) if location_text else Location(
-            city="", state="", country=""
-        )
+        location = _parse_location_string(location_text) if location_text else _EMPTY_LOCATION
 
         # URL
         link_elem = (
-            card.find("a", class_=re.compile(r"jcs-JobTitle"))
-            or card.find("a", href=re.compile(r"/rc/clk|/viewjob"))
-            or card.find("a", attrs={"data-jk": True})
+            found.get("jobtitle_link")
+            or found.get("href_link")
+            or found.get("jk_link")
         )
         url = None
         if link_elem:
@@ -610,15 +1302,15 @@ class IndeedJobFetcher(JobFetcher):
         # Salary
         salary = None
         salary_elem = (
-            card.find("div", class_=re.compile(r"salary-snippet"))
-            or card.find("span", class_=re.compile(r"salary"))
-            or card.find("div", class_=re.compile(r"metadata.*salary"))
+            found.get("salary_snippet")
+            or found.get("salary")
+            or found.get("metadata_salary")
         )
         if salary_elem:
             salary = self._parse_salary_text(salary_elem.get_text(strip=True))
 
         # Posted date
-        date_elem = card.find("span", class_=re.compile(r"date"))
+        date_elem = found.get("date")
         posted_date = None
         if date_elem:
             posted_date = _parse_relative_date(date_elem.get_text())
@@ -645,22 +1337,19 @@ class IndeedJobFetcher(JobFetcher):
         if not salary_text:
             return None
 
-        # Extract numbers
-        amounts = re.findall(r"[\$]?([\d,]+\.?\d*)", salary_text)
+        # Extract numbers and the period ("hour" beats "month" beats "week")
+        amounts = []
+        period_rank = 3
+        for amount, unit in _RE_SALARY.findall(salary_text):
+            if unit:
+                period_rank = min(period_rank, _SALARY_PERIOD_RANK[unit.lower()])
+            else:
+                amounts.append(amount)
         if not amounts:
             return None
 
         amounts = [float(a.replace(",", "")) for a in amounts]
-
-        # Determine period
-        period = "yearly"
-        text_lower = salary_text.lower()
-        if "hour" in text_lower:
-            period = "hourly"
-        elif "month" in text_lower:
-            period = "monthly"
-        elif "week" in text_lower:
-            period = "weekly"
+        period = _SALARY_PERIODS[period_rank]
 
         min_amount = amounts[0] if len(amounts) >= 1 else None
         max_amount = amounts[1] if len(amounts) >= 2 else None
@@ -724,7 +1413,7 @@ class JobFetcherRegistry:
         max_results_per_source: int = 50
     ) -> List[Job]:
         """
-        Fetch jobs from all registered sources.
+        Fetch jobs from all registered sources concurrently.
 
         Args:
             query: Job search query
@@ -740,19 +1429,28 @@ class JobFetcherRegistry:
 
         all_jobs = []
 
-        for source_name, fetcher in cls._fetchers.items():
-            try:
+        # Sources hit different hosts with independent rate limits, so run
+        # them side by side; results are still combined in registration order.
+        fetchers = dict(cls._fetchers)
+        with ThreadPoolExecutor(max_workers=len(fetchers)) as executor:
+            futures = {}
+            for source_name, fetcher in fetchers.items():
                 logger.info(f"Fetching from {source_name}...")
-                source_jobs = fetcher.fetch(
+                futures[source_name] = executor.submit(
+                    fetcher.fetch,
                     query=query,
                     location=location,
                     max_results=max_results_per_source,
                 )
-                all_jobs.extend(source_jobs)
-                logger.info(f"{source_name}: returned {len(source_jobs)} jobs")
-            except Exception as e:
-                logger.error(f"Failed to fetch from {source_name}: {e}")
-                continue
+
+            for source_name, future in futures.items():
+                try:
+                    source_jobs = future.result()
+                    all_jobs.extend(source_jobs)
+                    logger.info(f"{source_name}: returned {len(source_jobs)} jobs")
+                except Exception as e:
+                    logger.error(f"Failed to fetch from {source_name}: {e}")
+                    continue
 
         logger.info(
             f"Total jobs fetched from {len(cls._fetchers)} sources: {len(all_jobs)}"
@@ -9,9 +9,13 @@ can be demonstrated end-to-end.
 import hashlib
 import logging
 import random
+import re
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import List, Optional, Dict, Any
 
+import numpy as np
+
 from models.schemas import Job, Location, Salary, JobLevel, EmploymentType
 from jobs.fetchers.base import JobFetcher
 
@@ -49,6 +53,26 @@ CITIES = [
     ("Bangalore", "", "IN"),
 ]
 
+# URL path segment per company, e.g. "Goldman Sachs" -> "goldman-sachs"
+_COMPANY_SLUGS = {company: company.lower().replace(" ", "-") for company in COMPANIES}
+
+# CITIES split into parallel columns so a batch of picks is one gather per field
+_CITY_NAMES = np.array([c[0] for c in CITIES], dtype=object)
+_CITY_STATES = np.array([c[1] for c in CITIES], dtype=object)
+_CITY_COUNTRIES = np.array([c[2] for c in CITIES], dtype=object)
+
+# Generated postings are dated within this many days of now
+_MAX_AGE_DAYS = 14
+
+# Title keywords that fix a job's level, checked in order (first hit wins)
+_LEVEL_KEYWORDS = (
+    ("senior", JobLevel.SENIOR),
+    ("lead", JobLevel.LEAD),
+    ("architect", JobLevel.LEAD),
+    ("junior", JobLevel.ENTRY),
+    ("entry", JobLevel.ENTRY),
+)
+
 # Templates keyed by domain keyword → (titles, skills, descriptions)
 JOB_TEMPLATES = {
     "python": {
@@ -175,22 +199,36 @@ SALARY_RANGES = {
 }
 
 
+# Per template, one pattern matching any of its lowercased title words; a
+# search() is the same test as checking each word as a substring of the query.
+_TEMPLATE_TITLE_PATTERNS = {
+    key: re.compile("|".join(
+        re.escape(word)
+        for word in dict.fromkeys(
+            word for title in template["titles"] for word in title.lower().split()
+        )
+    ))
+    for key, template in JOB_TEMPLATES.items()
+    if key != "default"
+}
+
+
 def _match_template(query: str) -> dict:
     """Pick the best job template based on the search query."""
-    query_lower = query.lower()
-    for key, template in JOB_TEMPLATES.items():
-        if key == "default":
-            continue
+    return JOB_TEMPLATES[_match_template_key(query.lower())]
+
+
+@lru_cache(maxsize=256)
+def _match_template_key(query_lower: str) -> str:
+    """Return the JOB_TEMPLATES key for a lowercased query."""
+    for key in _TEMPLATE_TITLE_PATTERNS:
         if key in query_lower:
-            return template
+            return key
     # Check title matches
-    for key, template in JOB_TEMPLATES.items():
-        if key == "default":
-            continue
-        for title in template["titles"]:
-            if any(word in query_lower for word in title.lower().split()):
-                return template
-    return JOB_TEMPLATES["default"]
+    for key, pattern in _TEMPLATE_TITLE_PATTERNS.items():
+        if pattern.search(query_lower):
+            return key
+    return "default"
 
 
 class DemoJobFetcher(JobFetcher):
@@ -216,74 +254,109 @@ class DemoJobFetcher(JobFetcher):
             raise ValueError("Search query cannot be empty")
 
         template = _match_template(query)
-        count = min(max_results, random.randint(8, 20))
+        # Seeded from the stdlib RNG so random.seed() still makes runs reproducible
+        rng = np.random.default_rng(random.getrandbits(64))
+        count = min(max_results, int(rng.integers(8, 21)))
 
         logger.info(
             f"Demo: generating {count} jobs for query='{query}', location='{location}'"
         )
 
-        used_companies = set()
-        jobs: List[Job] = []
+        titles = template["titles"]
+        titles_lower = [title.lower() for title in titles]
+        skills = template["skills"]
+        focus_areas = template["focus_areas"]
+        format_description = template["description_template"].format_map
 
-        for i in range(count):
-            company = random.choice(COMPANIES)
-            while company in used_companies and len(used_companies) < len(COMPANIES):
-                company = random.choice(COMPANIES)
-            used_companies.add(company)
+        # Draw every random value for the batch up front; the loop below only
+        # indexes into these lists.
+        # Distinct companies while they last, then repeats allowed
+        company_idx = rng.permutation(len(COMPANIES))[:count].tolist()
+        if count > len(COMPANIES):
+            company_idx += rng.integers(0, len(COMPANIES), size=count - len(COMPANIES)).tolist()
+        title_idx = rng.integers(0, len(titles), size=count).tolist()
+        city_idx = rng.integers(0, len(CITIES), size=count)
+        city_names = _CITY_NAMES[city_idx].tolist()
+        city_states = _CITY_STATES[city_idx].tolist()
+        city_countries = _CITY_COUNTRIES[city_idx].tolist()
+        focus_idx = rng.integers(0, len(focus_areas), size=count).tolist()
+        num_skills = rng.integers(4, 9, size=count).tolist()
+        raise_k = rng.integers(20, 61, size=count).tolist()
+        age_days = rng.integers(0, _MAX_AGE_DAYS + 1, size=count).tolist()
+        # Row-wise argsort of uniform keys = an independent shuffle per job
+        skill_order = rng.random((count, len(skills))).argsort(axis=1).tolist()
+        desc_order = rng.random((count, 8)).argsort(axis=1).tolist()
+        # Columns: title variant, remote, salary band, salary offset, level
+        u = rng.random((count, 5)).tolist()
 
-            title = random.choice(template["titles"])
+        # Per-query values that do not change between jobs
+        query_words = query.strip().split()
+        query_title = query.strip().title()
+        vary_title = bool(query_words)
+        first_word = query_words[0].lower() if query_words else ""
+        remote_only = bool(location) and "remote" in location.lower()
+        loc_parts = [p.strip() for p in location.split(",")] if location else []
+        now = datetime.now()
+        # datetimes are immutable, so each possible posting age is built once
+        posted_dates = [now - timedelta(days=days) for days in range(_MAX_AGE_DAYS + 1)]
+
+        def build_job(i: int) -> Job:
+            """Assemble job i from the batch draws above."""
+            company = COMPANIES[company_idx[i]]
+            draws = u[i]
+
+            title = titles[title_idx[i]]
+            title_lower = titles_lower[title_idx[i]]
             # Vary the title with the query keyword if not already present
-            query_words = query.strip().split()
-            if query_words and query_words[0].lower() not in title.lower():
-                if random.random() < 0.3:
-                    title = f"{query.strip().title()} — {title}"
+            if vary_title and first_word not in title_lower:
+                if draws[0] < 0.3:
+                    title = f"{query_title} — {title}"
+                    title_lower = title.lower()
 
             # Location
-            if location and "remote" in location.lower():
-                loc = Location(city="", state="", country="US", remote=True)
+            if remote_only:
+                loc = Location.remote_instance()
             elif location:
-                loc_parts = [p.strip() for p in location.split(",")]
                 loc = Location(
                     city=loc_parts[0] if loc_parts else "",
                     state=loc_parts[1] if len(loc_parts) > 1 else "",
                     country=loc_parts[2] if len(loc_parts) > 2 else "US",
-                    remote=random.random() < 0.3,
+                    remote=draws[1] < 0.3,
                 )
             else:
-                city_data = random.choice(CITIES)
                 loc = Location(
-                    city=city_data[0], state=city_data[1], country=city_data[2],
-                    remote=random.random() < 0.4,
+                    city=city_names[i], state=city_states[i], country=city_countries[i],
+                    remote=draws[1] < 0.4,
                 )
 
             # Skills subset for requirements
-            num_skills = random.randint(4, 8)
-            required_skills = random.sample(
-                template["skills"], min(num_skills, len(template["skills"]))
-            )
-            nice_to_haves = random.sample(
-                [s for s in template["skills"] if s not in required_skills],
-                min(3, len(template["skills"]) - len(required_skills)),
-            )
+            order = skill_order[i]
+            n_required = min(num_skills[i], len(skills))
+            required_skills = [skills[j] for j in order[:n_required]]
+            nice_to_haves = [
+                skills[j] for j in order[n_required:n_required + min(3, len(skills) - n_required)]
+            ]
 
             # Description
-            sampled = random.sample(required_skills, min(3, len(required_skills)))
-            description = template["description_template"].format(
-                title=title,
-                focus=random.choice(template["focus_areas"]),
-                skill1=sampled[0] if len(sampled) > 0 else "relevant technologies",
-                skill2=sampled[1] if len(sampled) > 1 else "modern tools",
-                skill3=sampled[2] if len(sampled) > 2 else "best practices",
-            )
+            sampled = [required_skills[j] for j in desc_order[i] if j < n_required][:3]
+            description = format_description({
+                "title": title,
+                "focus": focus_areas[focus_idx[i]],
+                "skill1": sampled[0] if len(sampled) > 0 else "relevant technologies",
+                "skill2": sampled[1] if len(sampled) > 1 else "modern tools",
+                "skill3": sampled[2] if len(sampled) > 2 else "best practices",
+            })
 
             # Salary
-            is_senior = "senior" in title.lower() or "lead" in title.lower()
+            is_senior = "senior" in title_lower or "lead" in title_lower
             if is_senior:
-                sal_range = random.choice([SALARY_RANGES["senior"], SALARY_RANGES["lead"]])
+                sal_range = SALARY_RANGES["senior"] if draws[2] < 0.5 else SALARY_RANGES["lead"]
             else:
-                sal_range = random.choice([SALARY_RANGES["mid"], SALARY_RANGES["senior"]])
-            min_sal = random.randint(sal_range[0] // 1000, (sal_range[0] + 20000) // 1000) * 1000
-            max_sal = min_sal + random.randint(20, 60) * 1000
+                sal_range = SALARY_RANGES["mid"] if draws[2] < 0.5 else SALARY_RANGES["senior"]
+            low_k = sal_range[0] // 1000
+            high_k = (sal_range[0] + 20000) // 1000
+            min_sal = (low_k + int(draws[3] * (high_k - low_k + 1))) * 1000
+            max_sal = min_sal + raise_k[i] * 1000
             salary = Salary(
                 min_amount=float(min_sal),
                 max_amount=float(max_sal),
@@ -292,23 +365,20 @@ class DemoJobFetcher(JobFetcher):
             )
 
             # Level
-            if "senior" in title.lower():
-                level = JobLevel.SENIOR
-            elif "lead" in title.lower() or "architect" in title.lower():
-                level = JobLevel.LEAD
-            elif "junior" in title.lower() or "entry" in title.lower():
-                level = JobLevel.ENTRY
-            else:
-                level = random.choice([JobLevel.MID, JobLevel.SENIOR])
+            level = next(
+                (lvl for keyword, lvl in _LEVEL_KEYWORDS if keyword in title_lower), None
+            )
+            if level is None:
+                level = JobLevel.MID if draws[4] < 0.5 else JobLevel.SENIOR
 
             # Posted date (random within last 14 days)
-            posted_date = datetime.now() - timedelta(days=random.randint(0, 14))
+            posted_date = posted_dates[age_days[i]]
 
             # Job ID
             raw_id = f"demo:{company}:{title}:{i}"
             job_id = hashlib.md5(raw_id.encode()).hexdigest()[:12]
 
-            jobs.append(Job(
+            return Job(
                 job_id=job_id,
                 title=title,
                 company=company,
@@ -319,10 +389,12 @@ class DemoJobFetcher(JobFetcher):
                 level=level,
                 employment_type=EmploymentType.FULL_TIME,
                 salary=salary,
-                url=f"https://careers.example.com/{company.lower().replace(' ', '-')}/{job_id}",
+                url=f"https://careers.example.com/{_COMPANY_SLUGS[company]}/{job_id}",
                 source="demo",
                 posted_date=posted_date,
-            ))
+            )
+
+        jobs = [build_job(i) for i in range(count)]
 
         logger.info(f"Demo: generated {len(jobs)} jobs")
         return jobs
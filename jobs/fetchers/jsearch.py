@@ -9,12 +9,66 @@ Sign up at: https://rapidapi.com/letscrape-6bRBa3QguO5/api/jsearch
 """
 
 import hashlib
+import json
 import logging
 import os
+import time
+from bisect import bisect_left
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from itertools import islice
+from typing import List, Optional, Dict, Any, Tuple, TypedDict
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson  # optional: several times faster than json for API payloads
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    import msgspec  # optional: decodes only the result fields _parse_job reads
+except ImportError:
+    msgspec = None
+
+
+class _JSearchResult(TypedDict, total=False):
+    """The subset of a JSearch result that _parse_job reads."""
+
+    job_id: Any
+    job_title: Any
+    employer_name: Any
+    job_city: Any
+    job_state: Any
+    job_country: Any
+    job_is_remote: Any
+    job_description: Any
+    job_highlights: Any
+    job_required_skills: Any
+    job_min_salary: Any
+    job_max_salary: Any
+    job_salary_currency: Any
+    job_salary_period: Any
+    job_employment_type: Any
+    job_required_experience: Any
+    job_apply_link: Any
+    job_posted_at_timestamp: Any
+
+
+class _JSearchPage(TypedDict, total=False):
+    data: Optional[List[_JSearchResult]]
+
+
+if msgspec is not None:
+    # Results carry ~40 fields; undeclared ones are skipped without building
+    # Python objects. Values are left untyped so _parse_job's checks still apply.
+    _decode_page = msgspec.json.Decoder(_JSearchPage).decode
+else:
+    _decode_page = _json_loads
 
 from models.schemas import Job, Location, Salary, JobLevel, EmploymentType
 from jobs.fetchers.base import JobFetcher
@@ -22,6 +76,27 @@ from jobs.fetchers.base import JobFetcher
 logger = logging.getLogger(__name__)
 
 API_URL = "https://jsearch.p.rapidapi.com/search"
+API_HOST = "jsearch.p.rapidapi.com"
+
+# employment_type filter values → JSearch request values
+_EMP_TYPE_REQUEST_MAP = {
+    "fulltime": "FULLTIME",
+    "parttime": "PARTTIME",
+    "contract": "CONTRACTOR",
+    "intern": "INTERN",
+}
+
+# JSearch job_employment_type → EmploymentType
+_EMP_TYPE_MAP = {
+    "FULLTIME": EmploymentType.FULL_TIME,
+    "PARTTIME": EmploymentType.PART_TIME,
+    "CONTRACTOR": EmploymentType.CONTRACT,
+    "INTERN": EmploymentType.INTERNSHIP,
+}
+
+# Required experience in months: <=12 entry, <=48 mid, <=96 senior, else lead
+_EXP_MONTH_THRESHOLDS = (12, 48, 96)
+_EXP_LEVELS = (JobLevel.ENTRY, JobLevel.MID, JobLevel.SENIOR, JobLevel.LEAD)
 
 
 def _get_api_key() -> Optional[str]:
@@ -29,16 +104,55 @@ def _get_api_key() -> Optional[str]:
     return os.getenv("RAPIDAPI_KEY")
 
 
+def _build_api_session(api_key: Optional[str]) -> requests.Session:
+    """
+    Create a keep-alive session for the JSearch API with auth headers preset.
+
+    Transient 429/5xx responses are retried with backoff; once retries run out
+    the last response is returned so fetch() can report its status.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.headers.update({
+        "X-RapidAPI-Key": api_key or "",
+        "X-RapidAPI-Host": API_HOST,
+    })
+    return session
+
+
 class JSearchFetcher(JobFetcher):
     """
     Fetcher using JSearch API (RapidAPI) for real job listings.
 
     Requires RAPIDAPI_KEY environment variable to be set.
+
+    Config:
+        concurrency: pages requested in parallel (default 1: all pages in one
+            aggregated call). Values above 1 issue one API call per page,
+            which is faster but uses more of the monthly quota.
+        cache_ttl: seconds an identical search is answered from memory
+            (default 300; 0 disables the cache)
     """
 
+    CACHE_MAX_ENTRIES = 64
+
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         super().__init__("jsearch", config)
         self.api_key = _get_api_key()
+        # API calls want JSON and the RapidAPI headers, not the scraper's browser headers
+        self.session = _build_api_session(self.api_key)
+        self.cache_ttl = self.config.get("cache_ttl", 300)
+        self._cache: "OrderedDict[tuple, Tuple[float, List[Job]]]" = OrderedDict()
 
     def fetch(
         self,
@@ -65,10 +179,14 @@ class JSearchFetcher(JobFetcher):
         # Calculate pages needed (10 results per page)
         num_pages = min((max_results + 9) // 10, 5)  # Cap at 5 pages
 
-        headers = {
-            "X-RapidAPI-Key": self.api_key,
-            "X-RapidAPI-Host": "jsearch.p.rapidapi.com",
-        }
+        try:
+            cache_key = (search_query, max_results, frozenset(filters.items()))
+        except TypeError:
+            cache_key = None  # unhashable filter values; skip caching
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            logger.info(f"JSearch: {len(cached)} jobs for query='{search_query}' served from cache")
+            return cached
 
         params = {
             "query": search_query,
@@ -79,13 +197,9 @@ class JSearchFetcher(JobFetcher):
         # Optional filters from **filters kwargs
         employment_type = filters.get("employment_type")
         if employment_type:
-            type_map = {
-                "fulltime": "FULLTIME",
-                "parttime": "PARTTIME",
-                "contract": "CONTRACTOR",
-                "intern": "INTERN",
-            }
-            params["employment_types"] = type_map.get(employment_type.lower(), employment_type.upper())
+            params["employment_types"] = _EMP_TYPE_REQUEST_MAP.get(
+                employment_type.lower(), employment_type.upper()
+            )
 
         date_posted = filters.get("date_posted")
         if date_posted and date_posted != "all":
@@ -100,51 +214,101 @@ class JSearchFetcher(JobFetcher):
             f"num_pages={num_pages}"
         )
 
+        concurrency = self.config.get("concurrency", 1)
+
         try:
-            response = requests.get(
-                API_URL, headers=headers, params=params, timeout=30
-            )
+            if num_pages == 1 or concurrency <= 1:
+                # One request; the API aggregates the pages server-side
+                pages = [self._request_page(params)]
+            else:
+                # One request per page, issued concurrently
+                page_params = [
+                    {**params, "page": str(page), "num_pages": "1"}
+                    for page in range(1, num_pages + 1)
+                ]
+                with ThreadPoolExecutor(max_workers=min(num_pages, concurrency)) as executor:
+                    pages = list(executor.map(self._request_page, page_params))
+        except requests.exceptions.RequestException as e:
+            logger.error(f"JSearch: request failed: {e}")
+            return []
 
-            if response.status_code == 403:
-                logger.error("JSearch: invalid or expired API key (403)")
-                return []
-            if response.status_code == 429:
-                logger.error("JSearch: rate limit exceeded (429)")
-                return []
-            if response.status_code != 200:
-                logger.error(f"JSearch: unexpected status {response.status_code}")
-                return []
+        raw_jobs = []
+        for page_jobs in pages:
+            # Results are positional, so stop at the first failed page
+            if page_jobs is None:
+                break
+            raw_jobs.extend(page_jobs)
 
-            data = response.json()
-            raw_jobs = data.get("data", [])
+        logger.info(f"JSearch: received {len(raw_jobs)} raw results")
 
-            logger.info(f"JSearch: received {len(raw_jobs)} raw results")
+        # Rows without a title parse to None and are dropped
+        parse = self._parse_job
+        jobs = [job for job in map(parse, islice(raw_jobs, max_results)) if job]
 
-            jobs = []
-            for raw in raw_jobs[:max_results]:
-                job = self._parse_job(raw)
-                if job:
-                    jobs.append(job)
+        logger.info(f"JSearch: parsed {len(jobs)} jobs")
+        if jobs:
+            self._cache_put(cache_key, jobs)
+        return jobs
 
-            logger.info(f"JSearch: parsed {len(jobs)} jobs")
-            return jobs
+    def _cache_get(self, key: Optional[tuple]) -> Optional[List[Job]]:
+        """Return a copy of the cached result for key if it is still fresh."""
+        if key is None:
+            return None
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        stored_at, jobs = entry
+        if time.monotonic() - stored_at >= self.cache_ttl:
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return list(jobs)
+
+    def _cache_put(self, key: Optional[tuple], jobs: List[Job]) -> None:
+        """Store a result, evicting the least recently used entry when full."""
+        if key is None or self.cache_ttl <= 0:
+            return
+        self._cache[key] = (time.monotonic(), list(jobs))
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.CACHE_MAX_ENTRIES:
+            self._cache.popitem(last=False)
+
+    def _request_page(self, params: Dict[str, str]) -> Optional[List[dict]]:
+        """
+        Request one search call and return its raw results.
+
+        Returns:
+            The response's "data" list, or None on an error status or bad body
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails
+        """
+        response = self.session.get(API_URL, params=params, timeout=30)
+
+        if response.status_code == 403:
+            logger.error("JSearch: invalid or expired API key (403)")
+            return None
+        if response.status_code == 429:
+            logger.error("JSearch: rate limit exceeded (429)")
+            return None
+        if response.status_code != 200:
+            logger.error(f"JSearch: unexpected status {response.status_code}")
+            return None
 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"JSearch: request failed: {e}")
-            return []
+        try:
+            data = _decode_page(response.content)
+        except ValueError as e:  # json, orjson and msgspec decode errors all subclass it
+            logger.error(f"JSearch: invalid JSON response: {e}")
+            return None
+        return data.get("data", [])
 
     def validate_connection(self) -> bool:
         if not self.api_key:
             logger.warning("JSearch: RAPIDAPI_KEY not set")
             return False
         try:
-            headers = {
-                "X-RapidAPI-Key": self.api_key,
-                "X-RapidAPI-Host": "jsearch.p.rapidapi.com",
-            }
-            response = requests.get(
+            response = self.session.get(
                 API_URL,
-                headers=headers,
                 params={"query": "test", "page": "1", "num_pages": "1"},
                 timeout=10,
             )
@@ -161,79 +325,67 @@ class JSearchFetcher(JobFetcher):
     @staticmethod
     def _parse_job(raw: dict) -> Optional[Job]:
         """Parse a JSearch API result into a domain Job object."""
-        title = raw.get("job_title")
+        get = raw.get
+        title = get("job_title")
         if not title:
             return None
 
-        company = raw.get("employer_name", "Unknown")
+        company = get("employer_name", "Unknown")
 
         # Location
-        city = raw.get("job_city", "") or ""
-        state = raw.get("job_state", "") or ""
-        country = raw.get("job_country", "") or ""
-        is_remote = raw.get("job_is_remote", False)
+        city = get("job_city", "") or ""
+        state = get("job_state", "") or ""
+        country = get("job_country", "") or ""
+        is_remote = get("job_is_remote", False)
         location = Location(
             city=city, state=state, country=country, remote=is_remote
         )
 
         # Description
-        description = raw.get("job_description", "") or ""
+        description = get("job_description", "") or ""
 
         # Requirements from highlights
         requirements = []
-        highlights = raw.get("job_highlights", {})
+        highlights = get("job_highlights", {})
         if highlights:
             qualifications = highlights.get("Qualifications", [])
             requirements = qualifications[:10] if qualifications else []
 
         # Skills
-        required_skills = raw.get("job_required_skills") or []
+        required_skills = get("job_required_skills") or []
 
         # Salary
         salary = None
-        min_sal = raw.get("job_min_salary")
-        max_sal = raw.get("job_max_salary")
+        min_sal = get("job_min_salary")
+        max_sal = get("job_max_salary")
         if min_sal or max_sal:
             salary = Salary(
                 min_amount=float(min_sal) if min_sal else None,
                 max_amount=float(max_sal) if max_sal else None,
-                currency=raw.get("job_salary_currency", "USD") or "USD",
-                period=raw.get("job_salary_period", "yearly") or "yearly",
+                currency=get("job_salary_currency", "USD") or "USD",
+                period=get("job_salary_period", "yearly") or "yearly",
             )
 
         # Employment type
-        emp_type_raw = raw.get("job_employment_type", "")
+        emp_type_raw = get("job_employment_type", "")
         employment_type = None
         if emp_type_raw:
-            type_map = {
-                "FULLTIME": EmploymentType.FULL_TIME,
-                "PARTTIME": EmploymentType.PART_TIME,
-                "CONTRACTOR": EmploymentType.CONTRACT,
-                "INTERN": EmploymentType.INTERNSHIP,
-            }
-            employment_type = type_map.get(emp_type_raw.upper())
+            employment_type = _EMP_TYPE_MAP.get(emp_type_raw.upper())
 
         # Experience level → JobLevel
         level = None
-        exp_data = raw.get("job_required_experience", {})
+        exp_data = get("job_required_experience", {})
         if exp_data:
             exp_months = exp_data.get("required_experience_in_months")
             if exp_months is not None:
-                if exp_months <= 12:
-                    level = JobLevel.ENTRY
-                elif exp_months <= 48:
-                    level = JobLevel.MID
-                elif exp_months <= 96:
-                    level = JobLevel.SENIOR
-                else:
-                    level = JobLevel.LEAD
+                level = _EXP_LEVELS[bisect_left(_EXP_MONTH_THRESHOLDS, exp_months)]
 
         # URL
-        url = raw.get("job_apply_link", "")
+        url = get("job_apply_link", "")
 
         # Posted date
         posted_date = None
-        posted_ts = raw.get("job_posted_at_timestamp")
+        posted_ts = get("job_posted_at_timestamp")
         if posted_ts:
             try:
                 posted_date = datetime.fromtimestamp(posted_ts)
@@ -241,7 +393,7 @@ class JSearchFetcher(JobFetcher):
                 pass
 
         # Job ID
-        job_id_raw = raw.get("job_id", "")
+        job_id_raw = get("job_id", "")
         if job_id_raw:
             job_id = hashlib.md5(job_id_raw.encode()).hexdigest()[:12]
         else:
@@ -4,8 +4,9 @@ Abstract base classes for LLM providers.
 Follows the Dependency Inversion Principle - depends on abstractions, not concrete implementations.
 """
 
+import dataclasses
 from abc import ABC, abstractmethod
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from config.settings import LLMConfig
 
 
@@ -26,6 +27,11 @@ class LLMProvider(ABC):
         """
         self.config = config
 
+    @property
+    def model_id(self) -> str:
+        """Provider and model name, e.g. "ollama:llama3" (used in cache keys)."""
+        return f"{self.config.provider}:{self.config.model}"
+
     @abstractmethod
     def generate(
         self,
@@ -88,6 +94,7 @@ class LLMProviderFactory:
     """
 
     _providers: Dict[str, type] = {}
+    _instances: Dict[Tuple, LLMProvider] = {}
 
     @classmethod
     def register_provider(cls, name: str, provider_class: type) -> None:
@@ -98,13 +105,21 @@ class LLMProviderFactory:
             name: Provider name identifier
             provider_class: Provider class (must inherit from LLMProvider)
         """
-        cls._providers[name.lower()] = provider_class
+        name = name.lower()
+        cls._providers[name] = provider_class
+        # Instances built by a previously registered class are stale now
+        cls._instances = {
+            key: provider for key, provider in cls._instances.items() if key[0] != name
+        }
 
     @classmethod
     def create_provider(cls, config: LLMConfig) -> LLMProvider:
         """
         Create an LLM provider instance based on configuration.
 
+        Providers are cached by configuration values, so repeated calls with an
+        equal config return the same instance instead of repeating client setup.
+
         Args:
             config: LLM configuration
 
@@ -115,8 +130,19 @@ class LLMProviderFactory:
             ValueError: If provider is not registered
         """
         provider_name = config.provider.lower()
-        if provider_name not in cls._providers:
+        provider_class = cls._providers.get(provider_name)
+        if provider_class is None:
             raise ValueError(f"Unknown LLM provider: {config.provider}")
 
-        provider_class = cls._providers[provider_name]
-        return provider_class(config)
+        # The whole config, so instances never carry another caller's settings
+        key = (provider_name, dataclasses.astuple(config))
+        provider = cls._instances.get(key)
+        if provider is None:
+            provider = provider_class(config)
+            cls._instances[key] = provider
+        return provider
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop cached provider instances. Useful for testing."""
+        cls._instances = {}
@@ -0,0 +1,264 @@
+"""
+Async Ollama provider for parallel generation.
+
+Ollama serves several requests at once when started with
+``OLLAMA_NUM_PARALLEL`` (e.g. ``OLLAMA_NUM_PARALLEL=8 ollama serve``).
+AsyncOllamaProvider issues prompts concurrently over a shared httpx.AsyncClient,
+at most OLLAMA_NUM_PARALLEL at a time (like OllamaProvider.generate_many), so
+scoring K prompts takes roughly K / OLLAMA_NUM_PARALLEL generations.
+The synchronous OllamaProvider API keeps working unchanged.
+"""
+
+import asyncio
+import json
+import logging
+from typing import Optional, Dict, Any, List
+
+import httpx
+
+from .ollama_provider import OllamaProvider, _json_loads, _num_parallel
+from config.settings import LLMConfig
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncOllamaProvider(OllamaProvider):
+    """
+    Ollama provider with async, concurrent generation.
+
+    Responsibility: Adds agenerate()/agenerate_many() on top of OllamaProvider,
+    sharing its payload construction, response cache and JSON extraction.
+    """
+
+    MAX_CONNECTIONS = 16
+
+    def __init__(self, config: LLMConfig):
+        """
+        Initialize async Ollama provider.
+
+        Args:
+            config: LLM configuration with Ollama-specific settings
+        """
+        super().__init__(config)
+        self._aclient: Optional[httpx.AsyncClient] = None
+
+    def _get_aclient(self) -> httpx.AsyncClient:
+        """Return the shared async client, creating it on first use."""
+        if self._aclient is None or self._aclient.is_closed:
+            self._aclient = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.config.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.MAX_CONNECTIONS,
+                    max_keepalive_connections=self.MAX_CONNECTIONS,
+                ),
+            )
+        return self._aclient
+
+    async def aclose(self) -> None:
+        """Close the async client. It is recreated on the next call."""
+        if self._aclient is not None:
+            await self._aclient.aclose()
+            self._aclient = None
+
+    async def agenerate(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        **kwargs
+    ) -> str:
+        """
+        Async counterpart of generate().
+
+        Args:
+            prompt: User input prompt
+            system_prompt: Optional system context/instruction to prepend to prompt
+            **kwargs: Same parameters as generate()
+
+        Returns:
+            Generated text response (stripped of whitespace)
+
+        Raises:
+            ConnectionError: If Ollama service is not running
+            ValueError: If prompt is empty
+            RuntimeError: If generation fails or times out
+        """
+        payload = self._build_payload(prompt, system_prompt, kwargs)
+        timeout = kwargs.get("timeout", self.config.timeout)
+
+        cache_key = self._lookup_key(payload, kwargs)
+        if cache_key is not None:
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                logger.debug("Ollama response served from cache")
+                return cached
+
+        try:
+            logger.debug(f"Calling Ollama generate (async) with model={self.config.model}")
+            response = await self._get_aclient().post(
+                "/api/generate",
+                json=payload,
+                timeout=timeout,
+            )
+            response.raise_for_status()
+
+            data = _json_loads(response.content)
+            generated_text = data.get("response", "").strip()
+
+            if not generated_text:
+                raise RuntimeError("Model returned empty response")
+
+            logger.debug(f"Generated {len(generated_text)} characters")
+            if cache_key is not None:
+                self._cache_put(cache_key, generated_text)
+            return generated_text
+
+        except httpx.ConnectError as e:
+            logger.error(f"Failed to connect to Ollama service at {self.base_url}: {e}")
+            raise ConnectionError(
+                f"Ollama service not running at {self.base_url}. "
+                f"Start with: ollama serve"
+            ) from e
+
+        except httpx.TimeoutException as e:
+            logger.error(f"Ollama request timed out after {timeout}s")
+            raise RuntimeError(
+                f"Ollama generation timed out after {timeout} seconds. "
+                f"Try increasing timeout or reducing max_tokens."
+            ) from e
+
+        except httpx.HTTPError as e:
+            logger.error(f"Ollama API error: {e}")
+            raise RuntimeError(f"Ollama API error: {e}") from e
+
+        except (json.JSONDecodeError, KeyError) as e:
+            logger.error(f"Failed to parse Ollama response: {e}")
+            raise RuntimeError(f"Invalid response from Ollama: {e}") from e
+
+    async def agenerate_with_structured_output(
+        self,
+        prompt: str,
+        output_schema: Dict[str, Any],
+        system_prompt: Optional[str] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Async counterpart of generate_with_structured_output().
+
+        Returns:
+            Parsed JSON response as dictionary
+
+        Raises:
+            ValueError: If output doesn't appear to be valid JSON
+            ConnectionError: If Ollama service is not running
+            RuntimeError: If generation fails or response can't be parsed
+        """
+        full_prompt = self._structured_prompt(prompt, output_schema)
+        kwargs.setdefault("format", "json")
+
+        # Slightly higher timeout for structured output
+        timeout = kwargs.pop("timeout", self.config.timeout + 5)
+        response_text = await self.agenerate(
+            full_prompt,
+            system_prompt=system_prompt,
+            timeout=timeout,
+            **kwargs,
+        )
+
+        parsed_json = self._extract_json_from_response(response_text)
+        logger.debug(f"Successfully parsed structured output: {list(parsed_json.keys())}")
+        return parsed_json
+
+    async def agenerate_many(
+        self,
+        prompts: List[str],
+        system_prompt: Optional[str] = None,
+        **kwargs
+    ) -> List[str]:
+        """
+        Generate responses for several prompts concurrently.
+
+        Returns:
+            Responses in the same order as prompts
+
+        Raises:
+            The first error raised by any single generation
+        """
+        return await self._gather_bounded(
+            [self.agenerate(p, system_prompt=system_prompt, **kwargs) for p in prompts]
+        )
+
+    async def agenerate_many_with_structured_output(
+        self,
+        prompts: List[str],
+        output_schema: Dict[str, Any],
+        system_prompt: Optional[str] = None,
+        **kwargs
+    ) -> List[Any]:
+        """
+        Structured generation for several prompts concurrently.
+
+        A prompt that fails yields its exception in place of a dict, so one bad
+        response does not discard the rest of the batch.
+
+        Returns:
+            Parsed dicts (or exceptions) in the same order as prompts
+        """
+        return await self._gather_bounded(
+            [
+                self.agenerate_with_structured_output(
+                    p, output_schema, system_prompt=system_prompt, **kwargs
+                )
+                for p in prompts
+            ],
+            return_exceptions=True,
+        )
+
+    @staticmethod
+    async def _gather_bounded(coros: List[Any], return_exceptions: bool = False) -> List[Any]:
+        """gather() coros with at most OLLAMA_NUM_PARALLEL running at once."""
+        limit = asyncio.Semaphore(_num_parallel())
+
+        async def run(coro):
+            async with limit:
+                return await coro
+
+        return await asyncio.gather(
+            *[run(coro) for coro in coros], return_exceptions=return_exceptions
+        )
+
+    def generate_many(
+        self,
+        prompts: List[str],
+        system_prompt: Optional[str] = None,
+        **kwargs
+    ) -> List[str]:
+        """
+        Blocking wrapper around agenerate_many() for synchronous callers.
+
+        Must not be called from a running event loop; await agenerate_many() there.
+        """
+        return asyncio.run(self._run_and_close(
+            self.agenerate_many(prompts, system_prompt=system_prompt, **kwargs)
+        ))
+
+    def generate_many_with_structured_output(
+        self,
+        prompts: List[str],
+        output_schema: Dict[str, Any],
+        system_prompt: Optional[str] = None,
+        **kwargs
+    ) -> List[Any]:
+        """Blocking wrapper around agenerate_many_with_structured_output()."""
+        return asyncio.run(self._run_and_close(
+            self.agenerate_many_with_structured_output(
+                prompts, output_schema, system_prompt=system_prompt, **kwargs
+            )
+        ))
+
+    async def _run_and_close(self, coro):
+        """Await coro, then close the client bound to this event loop."""
+        try:
+            return await coro
+        finally:
+            await self.aclose()
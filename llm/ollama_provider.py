@@ -5,10 +5,32 @@ Integrates with Ollama for running local language models like Llama 3.
 Handles HTTP communication with Ollama service and includes error handling and health checks.
 """
 
+import hashlib
 import json
 import logging
-from typing import Optional, Dict, Any
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from typing import Optional, Dict, Any, Iterator, List, Tuple
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson  # optional: C-backed, several times faster than json
+    _json_loads = orjson.loads
+
+    def _canonical_json(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+except ImportError:
+    _json_loads = json.loads
+
+    def _canonical_json(obj: Any) -> bytes:
+        return json.dumps(obj, sort_keys=True, separators=(",", ":")).encode("utf-8")
 
 from .base import LLMProvider
 from config.settings import LLMConfig
@@ -16,6 +38,117 @@ from config.settings import LLMConfig
 logger = logging.getLogger(__name__)
 
 
+def _build_session() -> requests.Session:
+    """
+    Create a keep-alive session for the local Ollama API.
+
+    The pool is sized for concurrent callers so connections are reused instead
+    of being dropped past urllib3's default of 10. Restarts (502-504) are retried
+    for idempotent calls such as /api/tags; generate POSTs are never re-sent.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.1,
+            status_forcelist=[502, 503, 504],
+            raise_on_status=False,
+        ),
+    )
+    session.mount("http://", adapter)
+    session.headers.update({
+        "Connection": "keep-alive",
+        "Content-Type": "application/json",
+    })
+    return session
+
+
+# Brackets, or a whole string literal (closing quote optional when truncated)
+_JSON_TOKEN_RE = re.compile(r'[{}\[\]]|"[^"\\]*(?:\\.[^"\\]*)*"?', re.DOTALL)
+
+# Appended to structured-output prompts; {schema} is the compact field list
+_JSON_INSTRUCTION = "\n\nRespond with a JSON object with these fields: {schema}"
+
+# id(schema) -> (schema, instruction). Holding the schema keeps its id from being reused.
+_SCHEMA_INSTRUCTIONS: Dict[int, Tuple[Dict[str, Any], str]] = {}
+_SCHEMA_INSTRUCTIONS_MAX = 32
+
+
+def _schema_instruction(output_schema: Dict[str, Any]) -> str:
+    """
+    Return the JSON instruction for output_schema, serializing it once.
+
+    Schemas are module-level constants in practice, so they are cached by
+    identity; mutate a schema in place and the old instruction is reused.
+    """
+    entry = _SCHEMA_INSTRUCTIONS.get(id(output_schema))
+    if entry is not None and entry[0] is output_schema:
+        return entry[1]
+
+    # format="json" guarantees the syntax; the model still needs the field names
+    instruction = _JSON_INSTRUCTION.format(
+        schema=json.dumps(output_schema, separators=(",", ":"))
+    )
+    if len(_SCHEMA_INSTRUCTIONS) >= _SCHEMA_INSTRUCTIONS_MAX:
+        _SCHEMA_INSTRUCTIONS.clear()
+    _SCHEMA_INSTRUCTIONS[id(output_schema)] = (output_schema, instruction)
+    return instruction
+
+
+def _num_parallel() -> int:
+    """Concurrent requests to send, from OLLAMA_NUM_PARALLEL (default 4)."""
+    try:
+        return max(1, int(os.getenv("OLLAMA_NUM_PARALLEL", "4")))
+    except ValueError:
+        return 4
+
+
+class _JsonObjectScanner:
+    """
+    Finds the first complete top-level JSON object in streamed text.
+
+    Each character is examined once, so feeding a whole response costs O(n)
+    rather than re-parsing the growing buffer after every delta.
+    """
+
+    def __init__(self):
+        self._parts: List[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+
+    def feed(self, text: str) -> Optional[str]:
+        """Consume a delta; return the object's text once its closing brace arrives."""
+        start = 0
+        for i, ch in enumerate(text):
+            if self._depth == 0:
+                if ch == "{":
+                    self._depth = 1
+                    start = i
+                continue
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch == "{":
+                self._depth += 1
+            elif ch == "}":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._parts.append(text[start:i + 1])
+                    return "".join(self._parts)
+        if self._depth:
+            self._parts.append(text[start:])
+        return None
+
+
 class OllamaProvider(LLMProvider):
     """
     Ollama Local LLM provider.
@@ -23,8 +156,16 @@ class OllamaProvider(LLMProvider):
     Responsibility: Implements LLMProvider interface specifically for Ollama's local models,
     enabling support for models like Llama 3 8B Q4, Mistral, and other open-source models.
     Handles communication with local Ollama service via HTTP with production-ready error handling.
+
+    Deterministic calls (temperature <= CACHE_MAX_TEMPERATURE) are answered from an
+    in-process LRU cache when the exact same payload was generated recently.
     """
 
+    CACHE_MAX_ENTRIES = 128
+    CACHE_TTL_SECONDS = 3600
+    CACHE_MAX_TEMPERATURE = 0.01
+    TAGS_TTL_SECONDS = 2.0
+
     def __init__(self, config: LLMConfig):
         """
         Initialize Ollama provider.
@@ -39,7 +180,20 @@ class OllamaProvider(LLMProvider):
         self.generate_endpoint = f"{self.base_url}/api/generate"
         self.tags_endpoint = f"{self.base_url}/api/tags"
         self.pull_endpoint = f"{self.base_url}/api/pull"
-        self.session = requests.Session()
+        self.session = _build_session()
+        self._cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._cache_lock = threading.Lock()  # generate_many() shares the cache across threads
+        self._tags_cache: Optional[Tuple[float, List[str]]] = None
+        # Fields that only change via per-call kwargs; copied by _build_payload.
+        # Ollama reads sampling parameters from "options" only.
+        self._payload_template: Dict[str, Any] = {
+            "model": config.model,
+            "options": {
+                "temperature": config.temperature,
+                "num_predict": config.max_tokens,
+            },
+            "stream": False,
+        }
 
         logger.info(
             f"Initialized OllamaProvider with model={config.model}, "
@@ -62,6 +216,10 @@ class OllamaProvider(LLMProvider):
                 - temperature: Override config temperature (0-1)
                 - max_tokens: Override config max_tokens
                 - top_p: Nucleus sampling parameter
+                - no_cache: Skip the response cache for this call
+                - stream: Receive the response incrementally (same result)
+                - format: Ollama output format, e.g. "json" or a JSON schema dict
+                - keep_alive: How long Ollama keeps the model loaded, e.g. "30m"
 
         Returns:
             Generated text response (stripped of whitespace)
@@ -71,66 +229,51 @@ class OllamaProvider(LLMProvider):
             ValueError: If prompt is empty
             RuntimeError: If generation fails after timeout
         """
-        if not prompt or not prompt.strip():
-            raise ValueError("Prompt cannot be empty")
-
-        # Get temperature and max_tokens from kwargs or config
-        temperature = kwargs.get("temperature", self.config.temperature)
-        max_tokens = kwargs.get("max_tokens", self.config.max_tokens)
+        payload = self._build_payload(prompt, system_prompt, kwargs)
         timeout = kwargs.get("timeout", self.config.timeout)
 
-        # Combine system prompt and user prompt
-        full_prompt = prompt
-        if system_prompt:
-            full_prompt = f"{system_prompt}\n\n{prompt}"
-
-        payload = {
-            "model": self.config.model,
-            "prompt": full_prompt,
-            "temperature": temperature,
-            "num_predict": max_tokens,
-            "stream": False,
-        }
-
-        try:
-            logger.debug(f"Calling Ollama generate with model={self.config.model}")
-            response = self.session.post(
-                self.generate_endpoint,
-                json=payload,
-                timeout=timeout,
-            )
-            response.raise_for_status()
+        cache_key = self._lookup_key(payload, kwargs)
+        if cache_key is not None:
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                logger.debug("Ollama response served from cache")
+                return cached
 
-            data = response.json()
-            generated_text = data.get("response", "").strip()
+        if kwargs.get("stream"):
+            generated_text = "".join(self._stream_deltas(payload, timeout)).strip()
+        else:
+            generated_text = self._post_generate(payload, timeout)
 
-            if not generated_text:
-                raise RuntimeError("Model returned empty response")
+        if not generated_text:
+            raise RuntimeError("Model returned empty response")
 
-            logger.debug(f"Generated {len(generated_text)} characters")
-            return generated_text
+        logger.debug(f"Generated {len(generated_text)} characters")
+        if cache_key is not None:
+            self._cache_put(cache_key, generated_text)
+        return generated_text
 
-        except requests.exceptions.ConnectionError as e:
-            logger.error(f"Failed to connect to Ollama service at {self.base_url}: {e}")
-            raise ConnectionError(
-                f"Ollama service not running at {self.base_url}. "
-                f"Start with: ollama serve"
-            ) from e
+    def generate_stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        **kwargs
+    ) -> Iterator[str]:
+        """
+        Stream generated text from Ollama as it is produced.
 
-        except requests.exceptions.Timeout as e:
-            logger.error(f"Ollama request timed out after {timeout}s")
-            raise RuntimeError(
-                f"Ollama generation timed out after {timeout} seconds. "
-                f"Try increasing timeout or reducing max_tokens."
-            ) from e
+        Takes the same arguments as generate(); responses are never cached.
 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Ollama API error: {e}")
-            raise RuntimeError(f"Ollama API error: {e}") from e
+        Yields:
+            Text deltas in generation order
 
-        except (json.JSONDecodeError, KeyError) as e:
-            logger.error(f"Failed to parse Ollama response: {e}")
-            raise RuntimeError(f"Invalid response from Ollama: {e}") from e
+        Raises:
+            ConnectionError: If Ollama service is not running
+            ValueError: If prompt is empty
+            RuntimeError: If generation fails or times out
+        """
+        payload = self._build_payload(prompt, system_prompt, kwargs)
+        timeout = kwargs.get("timeout", self.config.timeout)
+        return self._stream_deltas(payload, timeout)
 
     def generate_with_structured_output(
         self,
@@ -151,7 +294,8 @@ class OllamaProvider(LLMProvider):
                           Used to guide model and for basic validation.
                           Example: {"task": "string", "score": "float", "reasoning": "string"}
             system_prompt: Optional system context
-            **kwargs: Additional parameters (temperature, timeout, etc.)
+            **kwargs: Additional parameters (temperature, timeout, etc.).
+                     With stream=True, generation stops once the JSON object closes.
 
         Returns:
             Parsed JSON response as dictionary
@@ -161,30 +305,22 @@ class OllamaProvider(LLMProvider):
             ConnectionError: If Ollama service is not running
             RuntimeError: If generation fails or response can't be parsed
         """
-        if not output_schema or not isinstance(output_schema, dict):
-            raise ValueError("output_schema must be a non-empty dictionary")
-
-        # Build schema description for the model
-        schema_description = json.dumps(output_schema, indent=2)
-
-        # Create instruction to force JSON output
-        json_instruction = (
-            f"\n\nYou MUST respond with ONLY valid JSON matching this schema:\n"
-            f"{schema_description}\n\n"
-            f"Respond with JSON object only, no other text."
-        )
-
-        full_prompt = prompt + json_instruction
+        full_prompt = self._structured_prompt(prompt, output_schema)
+        # Constrain decoding so the model can only emit JSON
+        kwargs.setdefault("format", "json")
 
         try:
             # Generate text with slightly higher timeout for structured output
             timeout = kwargs.get("timeout", self.config.timeout + 5)
-            response_text = self.generate(
-                full_prompt,
-                system_prompt=system_prompt,
-                timeout=timeout,
-                **{k: v for k, v in kwargs.items() if k not in ["timeout"]},
-            )
+            if kwargs.get("stream"):
+                response_text = self._stream_json_text(full_prompt, system_prompt, timeout, kwargs)
+            else:
+                response_text = self.generate(
+                    full_prompt,
+                    system_prompt=system_prompt,
+                    timeout=timeout,
+                    **{k: v for k, v in kwargs.items() if k not in ["timeout"]},
+                )
 
             # Extract JSON from response (handle cases where model adds extra text)
             parsed_json = self._extract_json_from_response(response_text)
@@ -198,6 +334,61 @@ class OllamaProvider(LLMProvider):
             logger.error(f"Failed to generate structured output: {e}")
             raise
 
+    def generate_many(
+        self,
+        prompts: List[str],
+        system_prompt: Optional[str] = None,
+        **kwargs
+    ) -> List[str]:
+        """
+        Generate responses for several prompts in parallel.
+
+        Requests are issued from a thread pool sized by OLLAMA_NUM_PARALLEL, the
+        same variable that lets the server run them concurrently
+        (e.g. ``OLLAMA_NUM_PARALLEL=4 ollama serve``).
+
+        Returns:
+            Responses in the same order as prompts
+
+        Raises:
+            The first error raised by any single generation
+        """
+        if len(prompts) < 2:
+            return [self.generate(p, system_prompt=system_prompt, **kwargs) for p in prompts]
+
+        with ThreadPoolExecutor(max_workers=min(len(prompts), _num_parallel())) as executor:
+            return list(executor.map(
+                lambda p: self.generate(p, system_prompt=system_prompt, **kwargs),
+                prompts,
+            ))
+
+    def generate_many_with_structured_output(
+        self,
+        prompts: List[str],
+        output_schema: Dict[str, Any],
+        system_prompt: Optional[str] = None,
+        **kwargs
+    ) -> List[Any]:
+        """
+        Structured generation for several prompts in parallel.
+
+        A prompt that fails yields its exception in place of a dict, so one bad
+        response does not discard the rest of the batch.
+
+        Returns:
+            Parsed dicts (or exceptions) in the same order as prompts
+        """
+        def run(prompt: str) -> Any:
+            try:
+                return self.generate_with_structured_output(
+                    prompt, output_schema, system_prompt=system_prompt, **kwargs
+                )
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=max(1, min(len(prompts), _num_parallel()))) as executor:
+            return list(executor.map(run, prompts))
+
     def validate_credentials(self) -> bool:
         """
         Validate Ollama service is running and model is available.
@@ -213,19 +404,9 @@ class OllamaProvider(LLMProvider):
         """
         try:
             # Check if Ollama service is running
-            response = self.session.get(self.tags_endpoint, timeout=5)
-            response.raise_for_status()
-
-            data = response.json()
-            models = data.get("models", [])
+            available_models = self._get_tags()
 
-            # Extract model names
-            available_models = [m.get("name", "").split(":")[0] for m in models]
-
-            # Check if our configured model is available
-            model_name = self.config.model.split(":")[0]  # Handle version tags
-
-            if any(m.startswith(model_name) for m in available_models):
+            if self._model_available(available_models, self.config.model):
                 logger.info(f"✓ Ollama service verified with model {self.config.model}")
                 return True
             else:
@@ -278,20 +459,11 @@ class OllamaProvider(LLMProvider):
         }
 
         try:
-            response = self.session.get(self.tags_endpoint, timeout=5)
-            response.raise_for_status()
-
-            data = response.json()
-            models = data.get("models", [])
-            health["available_models"] = [m.get("name", "") for m in models]
+            health["available_models"] = self._get_tags()
             health["service_running"] = True
-
-            # Check if our model is available
-            model_name = self.config.model.split(":")[0]
-            for model in health["available_models"]:
-                if model.startswith(model_name):
-                    health["model_available"] = True
-                    break
+            health["model_available"] = self._model_available(
+                health["available_models"], self.config.model
+            )
 
         except requests.exceptions.ConnectionError as e:
             health["error"] = f"Cannot connect to Ollama at {self.base_url}"
@@ -307,6 +479,35 @@ class OllamaProvider(LLMProvider):
 
         return health
 
+    def _get_tags(self, ttl: float = TAGS_TTL_SECONDS) -> List[str]:
+        """
+        Return the names of locally available models from /api/tags.
+
+        A successful probe is reused for ttl seconds, so startup validation
+        followed by a health check costs a single round-trip.
+
+        Raises:
+            requests.exceptions.RequestException: If the service can't be reached
+        """
+        if self._tags_cache is not None:
+            fetched_at, names = self._tags_cache
+            if time.monotonic() - fetched_at < ttl:
+                return list(names)
+
+        response = self.session.get(self.tags_endpoint, timeout=5)
+        response.raise_for_status()
+
+        data = response.json()
+        names = [m.get("name", "") for m in data.get("models", [])]
+        self._tags_cache = (time.monotonic(), names)
+        return list(names)
+
+    @staticmethod
+    def _model_available(available_models: List[str], model: str) -> bool:
+        """Check whether model is among available_models, ignoring version tags."""
+        model_name = model.split(":")[0]
+        return any(m.split(":")[0].startswith(model_name) for m in available_models)
+
     def pull_model(self, model_name: str) -> bool:
         """
         Download/pull a model from Ollama library if not present.
@@ -337,6 +538,7 @@ class OllamaProvider(LLMProvider):
                 timeout=30,
             )
             response.raise_for_status()
+            self._tags_cache = None  # the model list is about to change
 
             logger.info(f"Successfully initiated pull for {model_name}")
             return True
@@ -345,15 +547,195 @@ class OllamaProvider(LLMProvider):
             logger.error(f"Failed to pull model {model_name}: {e}")
             return False
 
+    def _stream_json_text(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        timeout: float,
+        kwargs: Dict[str, Any],
+    ) -> str:
+        """
+        Stream a generation and stop as soon as a complete JSON object arrives.
+
+        Returns:
+            The object's text, or everything generated if no object closed
+            (so truncated output can still be repaired by the caller)
+        """
+        payload = self._build_payload(prompt, system_prompt, kwargs)
+        scanner = _JsonObjectScanner()
+        parts = []
+        with closing(self._stream_deltas(payload, timeout)) as deltas:
+            for delta in deltas:
+                parts.append(delta)
+                json_text = scanner.feed(delta)
+                if json_text is not None:
+                    return json_text
+        return "".join(parts)
+
+    def _post_generate(self, payload: Dict[str, Any], timeout: float) -> str:
+        """Send a non-streaming generate request and return the raw response text."""
+        try:
+            logger.debug(f"Calling Ollama generate with model={self.config.model}")
+            response = self.session.post(
+                self.generate_endpoint,
+                json=payload,
+                timeout=timeout,
+            )
+            response.raise_for_status()
+
+            data = _json_loads(response.content)
+            return data.get("response", "").strip()
+
+        except (requests.exceptions.RequestException, json.JSONDecodeError, KeyError) as e:
+            raise self._translate_error(e, timeout) from e
+
+    def _stream_deltas(self, payload: Dict[str, Any], timeout: float) -> Iterator[str]:
+        """
+        Send a streaming generate request and yield each response delta.
+
+        Ollama streams one JSON object per line; iter_lines() buffers partial
+        lines across network chunks, so every line handed to the decoder is whole.
+        """
+        try:
+            logger.debug(f"Streaming Ollama generate with model={self.config.model}")
+            with self.session.post(
+                self.generate_endpoint,
+                json={**payload, "stream": True},
+                timeout=timeout,
+                stream=True,
+            ) as response:
+                response.raise_for_status()
+                for line in response.iter_lines(chunk_size=8192):
+                    if not line:
+                        continue
+                    chunk = _json_loads(line)
+                    if "error" in chunk:
+                        raise RuntimeError(f"Ollama API error: {chunk['error']}")
+                    delta = chunk.get("response")
+                    if delta:
+                        yield delta
+                    if chunk.get("done"):
+                        break
+
+        except (requests.exceptions.RequestException, json.JSONDecodeError) as e:
+            raise self._translate_error(e, timeout) from e
+
+    def _translate_error(self, error: Exception, timeout: float) -> Exception:
+        """Map a requests/JSON failure to the exception generate() raises."""
+        if isinstance(error, requests.exceptions.ConnectionError):
+            logger.error(f"Failed to connect to Ollama service at {self.base_url}: {error}")
+            return ConnectionError(
+                f"Ollama service not running at {self.base_url}. "
+                f"Start with: ollama serve"
+            )
+
+        if isinstance(error, requests.exceptions.Timeout):
+            logger.error(f"Ollama request timed out after {timeout}s")
+            return RuntimeError(
+                f"Ollama generation timed out after {timeout} seconds. "
+                f"Try increasing timeout or reducing max_tokens."
+            )
+
+        if isinstance(error, requests.exceptions.RequestException):
+            logger.error(f"Ollama API error: {error}")
+            return RuntimeError(f"Ollama API error: {error}")
+
+        logger.error(f"Failed to parse Ollama response: {error}")
+        return RuntimeError(f"Invalid response from Ollama: {error}")
+
+    def _build_payload(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        kwargs: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """
+        Build the /api/generate request body.
+
+        Raises:
+            ValueError: If prompt is empty
+        """
+        if not prompt or not prompt.strip():
+            raise ValueError("Prompt cannot be empty")
+
+        payload = self._payload_template.copy()
+        options = payload["options"] = payload["options"].copy()
+
+        # Combine system prompt and user prompt
+        payload["prompt"] = f"{system_prompt}\n\n{prompt}" if system_prompt else prompt
+
+        # Override config temperature and max_tokens only when asked to
+        if "temperature" in kwargs:
+            options["temperature"] = kwargs["temperature"]
+        if "max_tokens" in kwargs:
+            options["num_predict"] = kwargs["max_tokens"]
+        if kwargs.get("format"):
+            payload["format"] = kwargs["format"]
+        if kwargs.get("keep_alive") is not None:
+            payload["keep_alive"] = kwargs["keep_alive"]
+        return payload
+
+    @staticmethod
+    def _structured_prompt(prompt: str, output_schema: Dict[str, Any]) -> str:
+        """
+        Append JSON-only instructions for output_schema to prompt.
+
+        Raises:
+            ValueError: If output_schema is not a non-empty dict
+        """
+        if not output_schema or not isinstance(output_schema, dict):
+            raise ValueError("output_schema must be a non-empty dictionary")
+
+        return prompt + _schema_instruction(output_schema)
+
+    def _lookup_key(self, payload: Dict[str, Any], kwargs: Dict[str, Any]) -> Optional[str]:
+        """Return the cache key for payload, or None if it must not be cached."""
+        # Only deterministic generations are safe to replay
+        if payload["options"]["temperature"] > self.CACHE_MAX_TEMPERATURE or kwargs.get("no_cache"):
+            return None
+        return self._cache_key(payload)
+
+    def clear_cache(self) -> None:
+        """Drop all cached responses."""
+        with self._cache_lock:
+            self._cache.clear()
+
+    @staticmethod
+    def _cache_key(payload: Dict[str, Any]) -> str:
+        """Hash the canonical JSON form of a generate payload."""
+        return hashlib.sha256(_canonical_json(payload)).hexdigest()
+
+    def _cache_get(self, key: str) -> Optional[str]:
+        """Return a cached response if present and not expired."""
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            stored_at, text = entry
+            if time.monotonic() - stored_at >= self.CACHE_TTL_SECONDS:
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+            return text
+
+    def _cache_put(self, key: str, text: str) -> None:
+        """Store a response, evicting the least recently used entry when full."""
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic(), text)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.CACHE_MAX_ENTRIES:
+                self._cache.popitem(last=False)
+
     @staticmethod
     def _extract_json_from_response(response_text: str) -> Dict[str, Any]:
         """
         Extract and parse JSON from model response text.
 
-        Models sometimes add extra text before/after JSON. This method:
-        1. Tries direct JSON parsing
-        2. If that fails, looks for JSON-like patterns (text between { and })
-        3. Handles various edge cases
+        Responses generated with format="json" parse directly. Otherwise models
+        sometimes add extra text before/after JSON, so this method:
+        1. Scans once from the first { or [ to its balanced closing bracket
+        2. Parses just that span (arrays are wrapped as {"results": [...]})
+        3. Repairs objects truncated by max_tokens
 
         Args:
             response_text: Raw text from model
@@ -363,51 +745,48 @@ class OllamaProvider(LLMProvider):
 
         Raises:
             ValueError: If no valid JSON can be extracted
-            json.JSONDecodeError: If extracted text is not valid JSON
         """
         if not response_text or not response_text.strip():
             raise ValueError("Response text is empty")
 
         response_text = response_text.strip()
 
-        # Try direct parsing first
+        # Constrained (format="json") output parses directly
         try:
-            return json.loads(response_text)
+            parsed = _json_loads(response_text)
+            if isinstance(parsed, dict):
+                return parsed
         except json.JSONDecodeError:
             pass
 
-        # Try to find JSON object (text between { and })
-        start_idx = response_text.find("{")
-        end_idx = response_text.rfind("}")
-
-        if start_idx != -1 and end_idx != -1 and start_idx < end_idx:
-            try:
-                json_str = response_text[start_idx : end_idx + 1]
-                return json.loads(json_str)
-            except json.JSONDecodeError:
-                pass
+        # Objects win unless the whole response is an array
+        obj_idx = response_text.find("{")
+        arr_idx = response_text.find("[")
+        if arr_idx == 0:
+            starts = (arr_idx, obj_idx)
+        else:
+            starts = (obj_idx, arr_idx)
 
-        # Try to repair truncated JSON (LLM response cut off by max_tokens)
-        if start_idx != -1:
-            json_str = response_text[start_idx:]
-            repaired = OllamaProvider._repair_truncated_json(json_str)
-            if repaired is not None:
-                return repaired
-
-        # Try to find JSON array (text between [ and ])
-        start_idx = response_text.find("[")
-        end_idx = response_text.rfind("]")
+        for start_idx in starts:
+            if start_idx == -1:
+                continue
 
-        if start_idx != -1 and end_idx != -1 and start_idx < end_idx:
-            try:
-                json_str = response_text[start_idx : end_idx + 1]
-                parsed = json.loads(json_str)
-                # Wrap array in object if needed
-                if isinstance(parsed, list):
-                    return {"results": parsed}
-                return parsed
-            except json.JSONDecodeError:
-                pass
+            end_idx = OllamaProvider._scan_json_end(response_text, start_idx)
+            if end_idx is not None:
+                try:
+                    parsed = _json_loads(response_text[start_idx:end_idx])
+                    # Wrap array in object if needed
+                    if isinstance(parsed, list):
+                        return {"results": parsed}
+                    return parsed
+                except json.JSONDecodeError:
+                    pass
+
+            # Try to repair truncated JSON (LLM response cut off by max_tokens)
+            if response_text[start_idx] == "{":
+                repaired = OllamaProvider._repair_truncated_json(response_text[start_idx:])
+                if repaired is not None:
+                    return repaired
 
         # If all else fails, raise error with the problematic text
         raise ValueError(
@@ -415,6 +794,30 @@ class OllamaProvider(LLMProvider):
             f"First 200 chars: {response_text[:200]}"
         )
 
+    @staticmethod
+    def _scan_json_end(text: str, start: int) -> Optional[int]:
+        """
+        Find where the JSON value opening at text[start] closes.
+
+        Single left-to-right pass tracking bracket depth. The regex hops over
+        whole string literals and plain text in C, so Python only sees brackets.
+
+        Returns:
+            Index just past the closing bracket, or None if it never closes
+        """
+        depth = 0
+        for match in _JSON_TOKEN_RE.finditer(text, start):
+            token = match.group()
+            if token == "{" or token == "[":
+                depth += 1
+            elif token == "}" or token == "]":
+                depth -= 1
+                if depth == 0:
+                    return match.end()
+            # else: a string literal, skipped whole
+
+        return None
+
     @staticmethod
     def _repair_truncated_json(json_str: str) -> Optional[Dict[str, Any]]:
         """
@@ -459,7 +862,7 @@ class OllamaProvider(LLMProvider):
         suffix += '}' * max(0, open_braces)
 
         try:
-            return json.loads(text + suffix)
+            return _json_loads(text + suffix)
         except json.JSONDecodeError:
             pass
 
@@ -509,7 +912,7 @@ class OllamaProvider(LLMProvider):
 
             close = ']' * max(0, obk) + '}' * max(0, ob)
             try:
-                return json.loads(truncated + close)
+                return _json_loads(truncated + close)
             except json.JSONDecodeError:
                 pass
 
@@ -9,14 +9,13 @@ Example usage:
 import argparse
 import sys
 import logging
-from typing import Optional
-from config.settings import AppSettings, LLMConfig
-from core.agent import JobHuntingAgent, AgentBuilder
-from jobs.fetchers.base import LinkedInJobFetcher, IndeedJobFetcher
-from filters.job_filters import (
-    SalaryFilter, LocationFilter, ExperienceLevelFilter,
-    KeywordFilter, DuplicateFilter,
-)
+from typing import TYPE_CHECKING
+
+# The agent stack (fetchers, numpy, httpx, LLM clients) is imported inside the
+# functions that need it, so `--help` and argument errors return immediately.
+if TYPE_CHECKING:
+    from config.settings import AppSettings
+    from core.agent import JobHuntingAgent
 
 
 def setup_logging(debug: bool = False, log_level: str = "INFO") -> None:
@@ -34,7 +33,7 @@ def setup_logging(debug: bool = False, log_level: str = "INFO") -> None:
     )
 
 
-def build_agent(settings: AppSettings, args: argparse.Namespace) -> JobHuntingAgent:
+def build_agent(settings: "AppSettings", args: argparse.Namespace) -> "JobHuntingAgent":
     """
     Build the job hunting agent with configured components.
 
@@ -45,6 +44,11 @@ def build_agent(settings: AppSettings, args: argparse.Namespace) -> JobHuntingAg
     Returns:
         Configured JobHuntingAgent
     """
+    from core.agent import AgentBuilder
+    from filters.job_filters import (
+        SalaryFilter, ExperienceLevelFilter, KeywordFilter, DuplicateFilter,
+    )
+
     builder = AgentBuilder(settings)
 
     # Try to set up LLM provider (optional — needed for PDF/text parsing and LLM matching)
@@ -67,14 +71,16 @@ def build_agent(settings: AppSettings, args: argparse.Namespace) -> JobHuntingAg
     return builder.build()
 
 
-def _try_setup_llm(settings: AppSettings):
+def _try_setup_llm(settings: "AppSettings"):
     """Try to initialize the LLM provider. Returns None if unavailable."""
     logger = logging.getLogger(__name__)
 
     if settings.llm.provider.lower() == "ollama":
         try:
-            from llm.ollama_provider import OllamaProvider
-            provider = OllamaProvider(settings.llm)
+            # Async variant lets the LLM matcher score jobs concurrently;
+            # run `OLLAMA_NUM_PARALLEL=8 ollama serve` to benefit from it
+            from llm.ollama_async_provider import AsyncOllamaProvider
+            provider = AsyncOllamaProvider(settings.llm)
             if provider.validate_credentials():
                 logger.info("Ollama LLM provider connected")
                 return provider
@@ -171,6 +177,7 @@ def main() -> int:
         logger.info("Initializing AI Job Hunting Agent...")
 
         # Load settings from environment
+        from config.settings import AppSettings
         settings = AppSettings.from_env()
         settings.debug = args.debug
         settings.relevance.min_relevance_score = args.min_score
@@ -0,0 +1,231 @@
+"""
+Columnar views of jobs and profiles for vectorised scoring.
+
+JobTable encodes a batch of Job objects once into contiguous NumPy arrays
+(salary bounds, level codes, remote flags, lowercase city/state, and packed
+skill bitsets) so matchers can score a whole batch with array operations
+instead of per-job attribute access. The original Job objects are kept for
+display and are returned by to_job().
+
+ScoreTable does the same for a batch of RelevanceScores, quantising the six
+0-1 scores to uint8 for compact storage and ranking.
+"""
+
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from models.schemas import Job, RelevanceScore, UserProfile
+
+# RelevanceScore fields in ScoreTable.scores column order
+SCORE_FIELDS = (
+    "overall_score", "skills_score", "experience_score",
+    "location_score", "salary_score", "level_score",
+)
+
+# Level codes are JobLevel.rank, so `table.level_code >= JobLevel.SENIOR.rank` works
+NO_LEVEL = -1
+
+
+def _norm_skill(skill: str) -> str:
+    """Normalise a skill string the way the matchers compare them."""
+    return " ".join(skill.lower().split())
+
+
+def _pack_bits(indices: Sequence[int], words: int) -> np.ndarray:
+    """Pack vocabulary indices into a row of uint64 words."""
+    row = np.zeros(words, dtype=np.uint64)
+    for idx in indices:
+        row[idx >> 6] |= np.uint64(1) << np.uint64(idx & 63)
+    return row
+
+
+class JobTable:
+    """
+    Struct-of-arrays view over a batch of jobs.
+
+    Columns (length N = number of jobs):
+        salary_min, salary_max: float64, NaN where absent
+        level_code: int8, JobLevel.rank or NO_LEVEL
+        has_location, remote: bool
+        city, state: lowercase, stripped strings ("" when absent)
+        skills_bitset: uint64 (N, words), requirement + nice-to-have skills
+            over the table's vocabulary
+    """
+
+    def __init__(
+        self,
+        jobs: List[Job],
+        salary_min: np.ndarray,
+        salary_max: np.ndarray,
+        level_code: np.ndarray,
+        has_location: np.ndarray,
+        remote: np.ndarray,
+        city: np.ndarray,
+        state: np.ndarray,
+        skills_bitset: np.ndarray,
+        vocabulary: Dict[str, int],
+    ):
+        self.jobs = jobs
+        self.salary_min = salary_min
+        self.salary_max = salary_max
+        self.level_code = level_code
+        self.has_location = has_location
+        self.remote = remote
+        self.city = city
+        self.state = state
+        self.skills_bitset = skills_bitset
+        self.vocabulary = vocabulary
+
+    @classmethod
+    def from_jobs(cls, jobs: List[Job]) -> "JobTable":
+        """Encode jobs into columns in a single pass."""
+        n = len(jobs)
+        salary_min = np.full(n, np.nan)
+        salary_max = np.full(n, np.nan)
+        level_code = np.full(n, NO_LEVEL, dtype=np.int8)
+        has_location = np.zeros(n, dtype=bool)
+        remote = np.zeros(n, dtype=bool)
+        city = np.full(n, "", dtype=object)
+        state = np.full(n, "", dtype=object)
+
+        vocabulary: Dict[str, int] = {}
+        job_skill_ids: List[List[int]] = []
+
+        for i, job in enumerate(jobs):
+            sal = job.salary
+            if sal is not None:
+                if sal.min_amount is not None:
+                    salary_min[i] = sal.min_amount
+                if sal.max_amount is not None:
+                    salary_max[i] = sal.max_amount
+            if job.level is not None:
+                level_code[i] = job.level.rank
+            loc = job.location
+            if loc is not None:
+                has_location[i] = True
+                remote[i] = loc.remote
+                city[i] = loc.city.lower().strip()
+                state[i] = loc.state.lower().strip()
+
+            ids = []
+            for skill in (*job.requirements, *job.nice_to_haves):
+                key = _norm_skill(skill)
+                if key:
+                    ids.append(vocabulary.setdefault(key, len(vocabulary)))
+            job_skill_ids.append(ids)
+
+        words = max(1, (len(vocabulary) + 63) // 64)
+        skills_bitset = np.zeros((n, words), dtype=np.uint64)
+        for i, ids in enumerate(job_skill_ids):
+            if ids:
+                skills_bitset[i] = _pack_bits(ids, words)
+
+        return cls(
+            jobs, salary_min, salary_max, level_code, has_location, remote,
+            city, state, skills_bitset, vocabulary,
+        )
+
+    def __len__(self) -> int:
+        return len(self.jobs)
+
+    def to_job(self, i: int) -> Job:
+        """Return the Job a row was encoded from."""
+        return self.jobs[i]
+
+
+class ProfileVector:
+    """
+    A profile's skills encoded against a JobTable's vocabulary.
+
+    Attributes:
+        skills_bitset: uint64 (words,) row comparable with JobTable.skills_bitset
+        unknown_skills: normalised profile skills no job in the table lists
+    """
+
+    def __init__(self, skills_bitset: np.ndarray, unknown_skills: List[str]):
+        self.skills_bitset = skills_bitset
+        self.unknown_skills = unknown_skills
+
+    @classmethod
+    def from_profile(cls, profile: UserProfile, table: JobTable) -> "ProfileVector":
+        """Encode profile skills using table's vocabulary."""
+        ids = []
+        unknown = []
+        for skill in profile.skills:
+            key = _norm_skill(skill)
+            if not key:
+                continue
+            idx: Optional[int] = table.vocabulary.get(key)
+            if idx is None:
+                unknown.append(key)
+            else:
+                ids.append(idx)
+        return cls(_pack_bits(ids, table.skills_bitset.shape[1]), unknown)
+
+    def matched_skill_counts(self, table: JobTable) -> np.ndarray:
+        """Number of each job's listed skills that the profile has (int64, length N)."""
+        overlap = table.skills_bitset & self.skills_bitset
+        bits = np.unpackbits(overlap.view(np.uint8), axis=1)
+        return bits.sum(axis=1, dtype=np.int64)
+
+
+def score_matrix(items: Sequence[RelevanceScore]) -> np.ndarray:
+    """SCORE_FIELDS of each score as rows of a float64 (N, 6) array."""
+    return np.array(
+        [[getattr(s, name) for name in SCORE_FIELDS] for s in items],
+        dtype=np.float64,
+    ).reshape(len(items), len(SCORE_FIELDS))
+
+
+class ScoreTable:
+    """
+    Quantised columnar view over a batch of relevance scores.
+
+    Columns (length N = number of scores):
+        scores: uint8 (N, 6), SCORE_FIELDS scaled to 0-255
+        overall: uint16, overall_score scaled to 0-65535 (the ranking key;
+            finer than the 3-decimal scores we display)
+
+    The RelevanceScore objects are kept for display and returned by get().
+    """
+
+    def __init__(self, items: List[RelevanceScore], scores: np.ndarray, overall: np.ndarray):
+        self.items = items
+        self.scores = scores
+        self.overall = overall
+
+    @classmethod
+    def from_scores(cls, items: List[RelevanceScore]) -> "ScoreTable":
+        """Quantise scores, clipping anything outside 0-1."""
+        raw = np.clip(score_matrix(items), 0.0, 1.0)
+        scores = np.rint(raw * 255).astype(np.uint8)
+        overall = np.rint(raw[:, 0] * 65535).astype(np.uint16)
+        return cls(items, scores, overall)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def get(self, i: int) -> RelevanceScore:
+        """Return the RelevanceScore a row was encoded from."""
+        return self.items[i]
+
+    def ranking(self) -> np.ndarray:
+        """Row indices by overall score, highest first; ties keep input order."""
+        return np.argsort(-self.overall.astype(np.int32), kind="stable")
+
+    def top_k(self, k: int) -> np.ndarray:
+        """Indices of the k best rows, highest first."""
+        n = len(self.items)
+        if k >= n:
+            return self.ranking()
+        if k <= 0:
+            return np.empty(0, dtype=np.intp)
+        key = -self.overall.astype(np.int32)
+        cutoff = key[np.argpartition(key, k - 1)[k - 1]]
+        # Everything strictly better than the k-th score, then the earliest
+        # rows tied with it, so ties resolve as in ranking()
+        above = np.flatnonzero(key < cutoff)
+        tied = np.flatnonzero(key == cutoff)[:k - len(above)]
+        best = np.concatenate((above, tied))
+        return best[np.lexsort((best, key[best]))]
@@ -5,14 +5,73 @@ Defines the domain models used throughout the application following the
 Single Responsibility Principle - each model represents a single concept.
 """
 
+import sys
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from typing import Optional, Any, Dict, Tuple, Sequence
 from datetime import datetime
 from enum import Enum
+from functools import total_ordering
 
 
+def _intern(value: Any) -> Any:
+    """sys.intern() strings, pass anything else (e.g. None) through."""
+    return sys.intern(value) if type(value) is str else value
+
+
+# Shared read-only default for sequence fields; callers replace rather than mutate them
+_EMPTY: tuple = ()
+
+
+# Dicts handed out by shared_metadata(), by id. Holding them here keeps the
+# ids unique for the life of the process.
+_SHARED_METADATA: Dict[int, Dict[str, Any]] = {}
+
+
+def shared_metadata(**items: Any) -> Dict[str, Any]:
+    """
+    Metadata dict for many instances to share (e.g. one per matcher).
+
+    It is a plain dict so asdict()/deepcopy()/json work on the models, but it
+    must not be mutated: set_meta() copies it before the first write. Meant
+    for a small number of long-lived mappings, as each one is kept alive.
+    """
+    meta = {sys.intern(k): v for k, v in items.items()}
+    _SHARED_METADATA[id(meta)] = meta
+    return meta
+
+
+class _MetaMixin:
+    """
+    get_meta()/set_meta() over a lazily allocated, copy-on-write `metadata`.
+
+    `metadata` is None until first written, and may be a dict shared through
+    shared_metadata(); only a dict the instance owns is written in place.
+    """
+
+    __slots__ = ()
+
+    def get_meta(self, key: str, default: Any = None) -> Any:
+        """Return metadata[key], or default if unset."""
+        if self.metadata is None:
+            return default
+        return self.metadata.get(key, default)
+
+    def set_meta(self, key: str, value: Any) -> None:
+        """Set metadata[key], copying or allocating the dict if not owned."""
+        meta = self.metadata
+        if meta is None or id(meta) in _SHARED_METADATA:
+            meta = self.metadata = dict(meta) if meta is not None else {}
+        meta[sys.intern(key)] = value
+
+
+@total_ordering
 class JobLevel(Enum):
-    """Job seniority levels."""
+    """
+    Job seniority levels, ordered from ENTRY to EXECUTIVE.
+
+    Values stay strings (they are persisted and serialised); `rank` gives the
+    small-int ordinal used for comparisons and columnar level codes.
+    """
 
     ENTRY = "entry"
     JUNIOR = "junior"
@@ -21,6 +80,14 @@ class JobLevel(Enum):
     LEAD = "lead"
     EXECUTIVE = "executive"
 
+    def __init__(self, value: str):
+        self.rank = len(type(self).__members__)
+
+    def __lt__(self, other):
+        if type(other) is JobLevel:
+            return self.rank < other.rank
+        return NotImplemented
+
 
 class EmploymentType(Enum):
     """Types of employment."""
@@ -32,33 +99,51 @@ class EmploymentType(Enum):
     INTERNSHIP = "internship"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Location:
-    """Represents a geographic location."""
+    """Represents a geographic location (immutable, so instances can be shared)."""
 
     city: str
     state: str
     country: str
     remote: bool = False
 
+    def __post_init__(self):
+        # Few distinct values across a scrape; share one string object each
+        object.__setattr__(self, "city", _intern(self.city))
+        object.__setattr__(self, "state", _intern(self.state))
+        object.__setattr__(self, "country", _intern(self.country))
+
     def __str__(self) -> str:
         if self.remote:
             return "Remote"
         return f"{self.city}, {self.state}, {self.country}"
 
+    @classmethod
+    def remote_instance(cls) -> "Location":
+        """The shared Location for a fully remote US posting."""
+        return _REMOTE_LOCATION
+
+
+_REMOTE_LOCATION = Location(city="", state="", country="US", remote=True)
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class Salary:
-    """Represents a salary range."""
+    """Represents a salary range (immutable, so instances can be shared)."""
 
     min_amount: Optional[float] = None
     max_amount: Optional[float] = None
     currency: str = "USD"
     period: str = "yearly"  # yearly, hourly, etc.
 
+    def __post_init__(self):
+        object.__setattr__(self, "currency", _intern(self.currency))
+        object.__setattr__(self, "period", _intern(self.period))
+
 
-@dataclass
-class Job:
+@dataclass(slots=True, eq=False)
+class Job(_MetaMixin):
     """
     Represents a job posting.
 
@@ -70,8 +155,8 @@ class Job:
     company: str
     description: str
     location: Location
-    requirements: List[str]
-    nice_to_haves: List[str] = field(default_factory=list)
+    requirements: Tuple[str, ...]
+    nice_to_haves: Tuple[str, ...] = _EMPTY
     level: Optional[JobLevel] = None
     employment_type: Optional[EmploymentType] = None
     salary: Optional[Salary] = None
@@ -79,10 +164,27 @@ class Job:
     source: str = "unknown"  # 'linkedin', 'indeed', 'builtin', etc.
     posted_date: Optional[datetime] = None
     application_deadline: Optional[datetime] = None
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    metadata: Optional[Dict[str, Any]] = None
 
+    def __post_init__(self):
+        # Categorical strings repeat across postings; title/description do not
+        self.company = _intern(self.company)
+        self.source = _intern(self.source)
+        # Read-only after construction; tuple() is a no-op for tuples
+        self.requirements = tuple(self.requirements)
+        self.nice_to_haves = tuple(self.nice_to_haves)
 
-@dataclass
+    # Identity is the posting ID, so jobs can key sets and caches cheaply
+    def __eq__(self, other):
+        if not isinstance(other, Job):
+            return NotImplemented
+        return self.job_id == other.job_id
+
+    def __hash__(self) -> int:
+        return hash(self.job_id)
+
+
+@dataclass(slots=True)
 class WorkExperience:
     """Represents professional work experience."""
 
@@ -91,11 +193,11 @@ class WorkExperience:
     start_date: datetime
     end_date: Optional[datetime] = None
     description: str = ""
-    skills: List[str] = field(default_factory=list)
+    skills: Sequence[str] = _EMPTY
     is_current: bool = False
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Education:
     """Represents educational background."""
 
@@ -107,8 +209,8 @@ class Education:
     honors: str = ""
 
 
-@dataclass
-class UserProfile:
+@dataclass(slots=True, eq=False)
+class UserProfile(_MetaMixin):
     """
     Represents a user's professional profile.
 
@@ -121,25 +223,40 @@ class UserProfile:
     phone: Optional[str] = None
     summary: str = ""
     location: Optional[Location] = None
-    skills: List[str] = field(default_factory=list)
-    work_experience: List[WorkExperience] = field(default_factory=list)
-    education: List[Education] = field(default_factory=list)
-    certifications: List[str] = field(default_factory=list)
-    preferred_job_levels: List[JobLevel] = field(default_factory=list)
-    preferred_locations: List[Location] = field(default_factory=list)
+    skills: Tuple[str, ...] = _EMPTY
+    work_experience: Sequence[WorkExperience] = _EMPTY
+    education: Sequence[Education] = _EMPTY
+    certifications: Tuple[str, ...] = _EMPTY
+    preferred_job_levels: Sequence[JobLevel] = _EMPTY
+    preferred_locations: Sequence[Location] = _EMPTY
     preferred_salary_range: Optional[Salary] = None
     willing_to_relocate: bool = False
     remote_preference: str = "flexible"  # 'required', 'preferred', 'flexible', 'not_interested'
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    metadata: Optional[Dict[str, Any]] = None
+
+    def __post_init__(self):
+        self.skills = tuple(self.skills)
+        self.certifications = tuple(self.certifications)
+        self.remote_preference = _intern(self.remote_preference)
+
+    # Identity is the user ID (see Job.__eq__)
+    def __eq__(self, other):
+        if not isinstance(other, UserProfile):
+            return NotImplemented
+        return self.user_id == other.user_id
+
+    def __hash__(self) -> int:
+        return hash(self.user_id)
 
     def get_years_of_experience(self) -> float:
         """Calculate total years of professional experience."""
         if not self.work_experience:
             return 0.0
 
+        now = datetime.now()
         total_days = 0
         for exp in self.work_experience:
-            end = exp.end_date if exp.end_date and not exp.is_current else datetime.now()
+            end = exp.end_date if exp.end_date and not exp.is_current else now
             duration = (end - exp.start_date).days
             if duration > 0:
                 total_days += duration
@@ -147,8 +264,8 @@ class UserProfile:
         return round(total_days / 365.25, 1)
 
 
-@dataclass
-class RelevanceScore:
+@dataclass(slots=True)
+class RelevanceScore(_MetaMixin):
     """
     Represents relevance matching results between a job and profile.
 
@@ -161,13 +278,13 @@ class RelevanceScore:
     location_score: float
     salary_score: float
     level_score: float
-    matching_skills: List[str] = field(default_factory=list)
-    missing_skills: List[str] = field(default_factory=list)
+    matching_skills: Sequence[str] = _EMPTY
+    missing_skills: Sequence[str] = _EMPTY
     reasoning: str = ""
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    metadata: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class JobMatch:
     """
     Represents a matched job opportunity with relevance scores.
@@ -178,13 +295,13 @@ class JobMatch:
     job: Job
     relevance_score: RelevanceScore
     passed_filters: bool = True
-    filter_reasons: List[str] = field(default_factory=list)
+    filter_reasons: Sequence[str] = _EMPTY
     recommendation_text: str = ""
     created_at: datetime = field(default_factory=datetime.now)
 
 
-@dataclass
-class ApplicationRecord:
+@dataclass(slots=True, eq=False)
+class ApplicationRecord(_MetaMixin):
     """
     Tracks a job application.
 
@@ -199,4 +316,17 @@ class ApplicationRecord:
     applied_date: datetime
     status: str = "pending"  # pending, accepted, rejected, interview, offer
     notes: str = ""
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    metadata: Optional[Dict[str, Any]] = None
+
+    def __post_init__(self):
+        self.company = _intern(self.company)
+        self.status = _intern(self.status)
+
+    # Identity is the application ID (see Job.__eq__)
+    def __eq__(self, other):
+        if not isinstance(other, ApplicationRecord):
+            return NotImplemented
+        return self.application_id == other.application_id
+
+    def __hash__(self) -> int:
+        return hash(self.application_id)
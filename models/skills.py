@@ -0,0 +1,62 @@
+"""
+Batch-local skill vocabulary for bitset skill matching.
+
+Every distinct normalised skill string seen while scoring a batch gets a bit
+position, so a list of skills becomes a Python int and overlap between two
+lists is a single ``a & b`` followed by ``int.bit_count()`` instead of
+building string sets. Like JobTable.vocabulary, a vocabulary lives only as
+long as the batch it encodes, so a long-running process does not keep every
+skill string it has ever seen.
+"""
+
+from typing import Dict, Iterable, Optional
+
+
+def normalize_skill(skill: str) -> str:
+    """Lowercase, strip, collapse whitespace (same rule the matchers use)."""
+    return " ".join(skill.lower().split())
+
+
+class SkillVocab:
+    """
+    Maps skills to single-bit ints.
+
+    Bits are assigned on first sight, so bitsets encoded by the same
+    vocabulary are comparable. Not thread-safe: use one per batch, copying a
+    shared seed with SkillVocab(seed).
+    """
+
+    def __init__(self, seed: Optional["SkillVocab"] = None):
+        """
+        Initialize vocabulary.
+
+        Args:
+            seed: Vocabulary whose bit assignments to start from (not modified)
+        """
+        self._index: Dict[str, int] = dict(seed._index) if seed is not None else {}
+        self._bits: Dict[str, int] = dict(seed._bits) if seed is not None else {}  # raw skill -> bit
+
+    def bit(self, skill: str) -> int:
+        """Return the bit for skill, or 0 for a blank string."""
+        cached = self._bits.get(skill)
+        if cached is not None:
+            return cached
+
+        key = normalize_skill(skill)
+        if not key:
+            bit = 0
+        else:
+            bit = 1 << self._index.setdefault(key, len(self._index))
+        self._bits[skill] = bit
+        return bit
+
+    def encode(self, skills: Iterable[str]) -> int:
+        """OR together the bits of skills."""
+        bits = 0
+        bit = self.bit
+        for skill in skills:
+            bits |= bit(skill)
+        return bits
+
+    def __len__(self) -> int:
+        return len(self._index)
@@ -6,14 +6,33 @@ Supports PDF, JSON (UserProfile, JSON Resume, LinkedIn export), and plain text f
 PDF and text parsing use LLM-based extraction via any LLMProvider implementation.
 """
 
+import hashlib
 import json
 import logging
+import os
+import threading
 import uuid
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 
+from dateutil import parser as _date_parser
+
+try:
+    import pypdfium2 as pdfium  # optional: C++ PDFium text extraction, far faster than pdfplumber
+except ImportError:
+    pdfium = None
+
+try:
+    import orjson  # optional: faster loads for large LinkedIn exports
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 from models.schemas import (
     UserProfile, Location, Salary, WorkExperience, Education, JobLevel
 )
@@ -43,7 +62,8 @@ RESUME_EXTRACTION_SCHEMA = {
             "position": "string",
             "start_date": "string - ISO format YYYY-MM-DD or YYYY-MM-01",
             "end_date": "string or null - ISO format, null if current",
-            "description": "string",
+            "description_lines": "[int, int] - inclusive range of the numbered resume lines describing this role",
+            "description": "string or null - role description, only if description_lines cannot be given",
             "skills": ["string - skills used in this role"],
             "is_current": "boolean"
         }
@@ -61,16 +81,50 @@ RESUME_EXTRACTION_SCHEMA = {
     "certifications": ["string - list of certifications"]
 }
 
+# Bump whenever RESUME_EXTRACTION_SCHEMA or the prompts change, so cached
+# extractions made with the old schema are not reused
+SCHEMA_VERSION = "5"
+
+# Extractions hold personal data, so they are only written to disk when this
+# is set (e.g. RESUME_CACHE_DIR=~/.cache/job-hunt-agent/resume_llm)
+RESUME_CACHE_DIR_ENV = "RESUME_CACHE_DIR"
+
 RESUME_SYSTEM_PROMPT = (
     "You are an expert resume parser. Extract structured data from the following "
     "resume text. Be precise and extract all available information. If a field is "
     "not found in the resume, use null or empty string as appropriate. For dates, "
     "use ISO format (YYYY-MM-DD or YYYY-MM-01 if only month/year is available). "
     "For skills, extract both explicitly listed skills and skills mentioned in "
-    "work experience descriptions."
+    "work experience descriptions. The resume lines are numbered; for a role's "
+    "description give the line numbers it spans instead of copying the text."
 )
 
 
+# Parallel extraction: each section of the schema gets its own narrower prompt
+_SECTION_FIELDS = {
+    "basics": ("full_name", "email", "phone", "summary", "location"),
+    "work": ("work_experience",),
+    "education": ("skills", "education", "certifications"),
+}
+
+RESUME_SECTION_SCHEMAS = {
+    section: {name: RESUME_EXTRACTION_SCHEMA[name] for name in fields}
+    for section, fields in _SECTION_FIELDS.items()
+}
+
+# Section instructions go at the END of the user prompt: the system prompt and
+# resume text then form an identical prefix across the section calls, which
+# backends with prompt/KV caching (Ollama, llama.cpp, vLLM) evaluate only once.
+RESUME_SECTION_PROMPTS = {
+    "basics": (
+        "Extract only the candidate's name, contact details, location and "
+        "professional summary."
+    ),
+    "work": "Extract only the work history, one entry per role, most recent first.",
+    "education": "Extract only skills, education and certifications.",
+}
+
+
 # ---------------------------------------------------------------------------
 # Helper functions
 # ---------------------------------------------------------------------------
@@ -82,10 +136,24 @@ def _parse_date(date_str: Optional[str]) -> Optional[datetime]:
     date_str = date_str.strip()
     if date_str.lower() in ("null", "none", "present", "current", ""):
         return None
-    from dateutil import parser as date_parser
+    return _parse_date_cached(date_str)
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_cached(date_str: str) -> Optional[datetime]:
+    """Parse a non-empty, stripped date string (see _parse_date)."""
+    # Fast path for YYYY-MM-DD, the format the extraction prompt asks for
+    if (
+        len(date_str) == 10 and date_str[4] == "-" and date_str[7] == "-"
+        and date_str[:4].isdigit() and date_str[5:7].isdigit() and date_str[8:].isdigit()
+    ):
+        try:
+            return datetime(int(date_str[:4]), int(date_str[5:7]), int(date_str[8:]))
+        except ValueError:
+            pass
     try:
-        return date_parser.parse(date_str)
-    except (ValueError, TypeError):
+        return _date_parser.parse(date_str)
+    except (ValueError, TypeError, OverflowError):
         logger.warning(f"Could not parse date: {date_str}")
         return None
 
@@ -105,12 +173,41 @@ def _parse_linkedin_date(date_dict: Optional[Dict]) -> Optional[datetime]:
     return None
 
 
-def _dict_to_user_profile(data: Dict[str, Any]) -> UserProfile:
+def _number_lines(lines: List[str]) -> str:
+    """Prefix each line with its index, e.g. "0007 | text", for pointer extraction."""
+    return "\n".join(f"{i:04d} | {line}" for i, line in enumerate(lines))
+
+
+def _description_from_lines(line_range: Any, source_lines: List[str]) -> Optional[str]:
+    """
+    Slice the original text for an LLM-returned [start, end] line range.
+
+    Returns None when the range is missing or malformed.
+    """
+    if not isinstance(line_range, (list, tuple)) or len(line_range) != 2:
+        return None
+    try:
+        start, end = int(line_range[0]), int(line_range[1])
+    except (TypeError, ValueError):
+        return None
+    start = max(start, 0)
+    end = min(end, len(source_lines) - 1)
+    if start > end:
+        return None
+    return "\n".join(line.strip() for line in source_lines[start:end + 1]).strip()
+
+
+def _dict_to_user_profile(
+    data: Dict[str, Any],
+    source_lines: Optional[List[str]] = None,
+) -> UserProfile:
     """
     Convert a raw dictionary into a UserProfile dataclass.
 
     Handles type construction for nested objects (Location, WorkExperience, Education).
-    Defensive against missing or malformed fields.
+    Defensive against missing or malformed fields. When source_lines is given,
+    work entries may carry "description_lines" pointers into it instead of a
+    "description" string.
     """
     full_name = data.get("full_name", "").strip()
     email = data.get("email", "").strip()
@@ -143,12 +240,24 @@ def _dict_to_user_profile(data: Dict[str, Any]) -> UserProfile:
                 f"no valid start_date"
             )
             continue
+        description = None
+        if source_lines is not None:
+            line_range = exp_data.get("description_lines")
+            description = _description_from_lines(line_range, source_lines)
+            if description is None and line_range is not None:
+                logger.warning(
+                    f"Invalid description_lines {line_range!r} for "
+                    f"{exp_data.get('company', 'unknown')} ({len(source_lines)} lines); "
+                    f"falling back to the description field"
+                )
+        if description is None:
+            description = exp_data.get("description") or ""
         work_experience.append(WorkExperience(
             company=exp_data.get("company", ""),
             position=exp_data.get("position", ""),
             start_date=start_date,
             end_date=_parse_date(exp_data.get("end_date")),
-            description=exp_data.get("description", ""),
+            description=description,
             skills=exp_data.get("skills", []) if isinstance(exp_data.get("skills"), list) else [],
             is_current=bool(exp_data.get("is_current", False)),
         ))
@@ -169,9 +278,14 @@ def _dict_to_user_profile(data: Dict[str, Any]) -> UserProfile:
 
     # Parse skills (deduplicate)
     raw_skills = data.get("skills", [])
-    skills = list(dict.fromkeys(
-        s.strip() for s in raw_skills if isinstance(s, str) and s.strip()
-    ))
+    seen = set()
+    skills = []
+    for raw in raw_skills:
+        if isinstance(raw, str):
+            skill = raw.strip()  # strip once, not once to test and once to keep
+            if skill and skill not in seen:
+                seen.add(skill)
+                skills.append(skill)
 
     # Parse certifications
     raw_certs = data.get("certifications", [])
@@ -195,7 +309,7 @@ def _dict_to_user_profile(data: Dict[str, Any]) -> UserProfile:
         preferred_salary_range=_parse_salary(data.get("preferred_salary_range")),
         willing_to_relocate=bool(data.get("willing_to_relocate", False)),
         remote_preference=data.get("remote_preference", "flexible"),
-        metadata=data.get("metadata", {}),
+        metadata=data.get("metadata") or None,
     )
 
 
@@ -209,6 +323,10 @@ def _safe_float(value) -> Optional[float]:
         return None
 
 
+# value -> member, so unknown levels are a dict miss rather than a raised ValueError
+_JOB_LEVELS = {level.value: level for level in JobLevel}
+
+
 def _parse_job_levels(levels: list) -> List[JobLevel]:
     """Parse a list of job level strings into JobLevel enums."""
     if not isinstance(levels, list):
@@ -216,9 +334,10 @@ def _parse_job_levels(levels: list) -> List[JobLevel]:
     result = []
     for level in levels:
         if isinstance(level, str):
-            try:
-                result.append(JobLevel(level.lower()))
-            except ValueError:
+            member = _JOB_LEVELS.get(level.lower())
+            if member is not None:
+                result.append(member)
+            else:
                 logger.warning(f"Unknown job level: {level}")
     return result
 
@@ -251,13 +370,169 @@ def _parse_salary(salary_data) -> Optional[Salary]:
     )
 
 
-def _extract_profile_from_text(raw_text: str, llm_provider: LLMProvider) -> UserProfile:
+class ResumeExtractionCache:
+    """
+    Content-addressed cache of LLM resume extractions.
+
+    Responsibility: Stores the raw dict the LLM returned for a resume, keyed by
+    sha256 of (model, SCHEMA_VERSION, resume text), so re-parsing the same
+    resume skips the LLM call. The most recent MAX_ENTRIES entries are kept in
+    memory; only when a cache directory is configured are they also written to
+    disk as JSON so they survive restarts.
+    """
+
+    MAX_ENTRIES = 64
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        Initialize extraction cache.
+
+        Args:
+            cache_dir: Directory for the on-disk layer (None = memory only)
+        """
+        self.cache_dir = Path(cache_dir).expanduser() if cache_dir else None
+        # Serialised JSON, so every get() hands out a fresh dict; LRU order
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(raw_text: str, model_id: str) -> str:
+        """Return the cache key for a resume extracted by model_id."""
+        return hashlib.sha256(
+            f"{model_id}|{SCHEMA_VERSION}|{raw_text}".encode("utf-8")
+        ).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached extraction for key, or None."""
+        with self._lock:
+            text = self._memory.get(key)
+            if text is not None:
+                self._memory.move_to_end(key)
+        if text is None and self.cache_dir is not None:
+            try:
+                text = self._disk_path(key).read_text(encoding="utf-8")
+            except OSError:
+                return None
+        if text is None:
+            return None
+
+        try:
+            data = json.loads(text)
+        except ValueError:
+            return None
+        if not isinstance(data, dict):
+            return None
+        self._remember(key, text)
+        return data
+
+    def put(self, key: str, data: Dict[str, Any]) -> None:
+        """Store an extraction under key."""
+        try:
+            text = json.dumps(data)
+        except (TypeError, ValueError) as e:
+            logger.debug(f"ResumeExtractionCache: cannot serialise {key}: {e}")
+            return
+        self._remember(key, text)
+        if self.cache_dir is None:
+            return
+        path = self._disk_path(key)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(text, encoding="utf-8")
+            # Atomic, so concurrent readers never see a partial file
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.debug(f"ResumeExtractionCache: failed to write {key}: {e}")
+
+    def clear(self) -> None:
+        """Drop all in-memory entries."""
+        with self._lock:
+            self._memory.clear()
+
+    def _remember(self, key: str, text: str) -> None:
+        """Store text in memory, evicting the least recently used entries."""
+        with self._lock:
+            self._memory[key] = text
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.MAX_ENTRIES:
+                self._memory.popitem(last=False)
+
+    def _disk_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+
+_extraction_cache = ResumeExtractionCache(os.getenv(RESUME_CACHE_DIR_ENV) or None)
+
+
+def _extract_pdf_pages_pdfium(file_path: str) -> List[str]:
+    """Extract each page's plain text with PDFium (no layout model)."""
+    pdf = pdfium.PdfDocument(file_path)
+    try:
+        texts = []
+        for page in pdf:
+            textpage = page.get_textpage()
+            try:
+                # PDFium separates lines with CRLF
+                texts.append(textpage.get_text_range().replace("\r\n", "\n"))
+            finally:
+                textpage.close()
+                page.close()
+        return texts
+    finally:
+        pdf.close()
+
+
+def _extract_pdf_pages(file_path: str, start: int, stop: int) -> List[Optional[str]]:
+    """Extract the text of pages[start:stop]; module-level so worker processes can run it."""
+    import pdfplumber
+
+    with pdfplumber.open(file_path) as pdf:
+        return [page.extract_text() for page in pdf.pages[start:stop]]
+
+
+def _extract_sections_in_parallel(prompt: str, llm_provider: LLMProvider) -> Dict[str, Any]:
+    """
+    Run one structured-output call per RESUME_SECTION_SCHEMAS entry concurrently
+    and merge the results into a single extraction dict.
+
+    Raises:
+        Whatever the first failing section call raised
+    """
+    with ThreadPoolExecutor(max_workers=len(RESUME_SECTION_SCHEMAS)) as executor:
+        futures = {
+            section: executor.submit(
+                llm_provider.generate_with_structured_output,
+                prompt=f"{prompt} {RESUME_SECTION_PROMPTS[section]}",
+                output_schema=schema,
+                system_prompt=RESUME_SYSTEM_PROMPT,
+            )
+            for section, schema in RESUME_SECTION_SCHEMAS.items()
+        }
+        results = {section: future.result() for section, future in futures.items()}
+
+    # Each call may echo extra keys; keep only the fields its section owns
+    merged: Dict[str, Any] = {}
+    for section, fields in _SECTION_FIELDS.items():
+        part = results[section]
+        for name in fields:
+            if name in part:
+                merged[name] = part[name]
+    return merged
+
+
+def _extract_profile_from_text(
+    raw_text: str,
+    llm_provider: LLMProvider,
+    cache: Optional[ResumeExtractionCache] = None,
+) -> UserProfile:
     """
     Use an LLM provider to extract structured profile data from raw resume text.
 
     Args:
         raw_text: The raw text content of the resume.
         llm_provider: An LLMProvider instance to use for extraction.
+        cache: Extraction cache to consult (default: the shared on-disk cache).
 
     Returns:
         A UserProfile dataclass populated with extracted data.
@@ -266,21 +541,41 @@ def _extract_profile_from_text(raw_text: str, llm_provider: LLMProvider) -> User
         ValueError: If extraction or parsing fails.
         ConnectionError: If the LLM service is unreachable.
     """
+    if cache is None:
+        cache = _extraction_cache
+    model_id = getattr(llm_provider, "model_id", type(llm_provider).__name__)
+    key = cache.make_key(raw_text, str(model_id))
+
+    # Descriptions come back as line ranges into these lines (pointer extraction)
+    source_lines = raw_text.splitlines()
+
+    data = cache.get(key)
+    if data is not None:
+        logger.info("Resume extraction served from cache")
+        return _dict_to_user_profile(data, source_lines)
+
     prompt = (
         "Parse the following resume and extract structured information:\n\n"
         "---BEGIN RESUME---\n"
-        f"{raw_text}\n"
+        f"{_number_lines(source_lines)}\n"
         "---END RESUME---\n\n"
         "Extract all available fields according to the schema provided."
     )
 
-    data = llm_provider.generate_with_structured_output(
-        prompt=prompt,
-        output_schema=RESUME_EXTRACTION_SCHEMA,
-        system_prompt=RESUME_SYSTEM_PROMPT,
-    )
+    config = getattr(llm_provider, "config", None)
+    if getattr(config, "parallel_extraction", False):
+        data = _extract_sections_in_parallel(prompt, llm_provider)
+    else:
+        data = llm_provider.generate_with_structured_output(
+            prompt=prompt,
+            output_schema=RESUME_EXTRACTION_SCHEMA,
+            system_prompt=RESUME_SYSTEM_PROMPT,
+        )
 
-    return _dict_to_user_profile(data)
+    # Parse before caching so a response that fails to convert is not stored
+    profile = _dict_to_user_profile(data, source_lines)
+    cache.put(key, data)
+    return profile
 
 
 # ---------------------------------------------------------------------------
@@ -331,10 +626,18 @@ class PDFProfileParser(ProfileParser):
     """
     Parser for PDF resumes.
 
-    Responsibility: Extracts text from PDF resume documents using pdfplumber,
-    then sends the text to an LLM for structured data extraction.
+    Responsibility: Extracts text from PDF resume documents using pypdfium2
+    (falling back to pdfplumber), then sends the text to an LLM for structured
+    data extraction.
     """
 
+    SUPPORTED_EXTS = frozenset({".pdf"})
+
+    # pdfplumber fallback: pdfminer is pure Python and pages share one document
+    # parser, so long PDFs are split across processes (each opening the file)
+    PARALLEL_MIN_PAGES = 8
+    MAX_WORKERS = 8
+
     def __init__(self, llm_provider: Optional[LLMProvider] = None):
         self.llm_provider = llm_provider
 
@@ -363,19 +666,26 @@ class PDFProfileParser(ProfileParser):
                 "Pass an LLMProvider instance to PDFProfileParser constructor."
             )
 
-        import pdfplumber
+        if pdfium is None:
+            import pdfplumber
 
-        text_content = ""
         try:
-            with pdfplumber.open(file_path) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_content += page_text + "\n"
+            if pdfium is not None:
+                page_texts = _extract_pdf_pages_pdfium(file_path)
+            else:
+                with pdfplumber.open(file_path) as pdf:
+                    n_pages = len(pdf.pages)
+                    if n_pages < self.PARALLEL_MIN_PAGES:
+                        page_texts = [page.extract_text() for page in pdf.pages]
+                if n_pages >= self.PARALLEL_MIN_PAGES:
+                    page_texts = self._extract_pages_in_parallel(file_path, n_pages)
         except Exception as e:
             logger.error(f"Failed to extract text from PDF {file_path}: {e}")
             raise ValueError(f"Failed to read PDF file: {e}") from e
 
+        # Every page ends with a newline, as before (the extraction cache keys on this text)
+        text_content = "".join(f"{text}\n" for text in page_texts if text)
+
         if not text_content.strip():
             raise ValueError(f"No text could be extracted from PDF: {file_path}")
 
@@ -391,7 +701,23 @@ class PDFProfileParser(ProfileParser):
 
     def supports_format(self, file_path: str) -> bool:
         """Check if file is PDF format."""
-        return Path(file_path).suffix.lower() == ".pdf"
+        return os.path.splitext(file_path)[1].lower() in self.SUPPORTED_EXTS
+
+    def _extract_pages_in_parallel(self, file_path: str, n_pages: int) -> List[Optional[str]]:
+        """Extract page text in contiguous page ranges across worker processes, in order."""
+        workers = max(1, min(self.MAX_WORKERS, os.cpu_count() or 1, n_pages))
+        if workers == 1:
+            return _extract_pdf_pages(file_path, 0, n_pages)
+        step = -(-n_pages // workers)  # ceil division
+        starts = range(0, n_pages, step)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunks = executor.map(
+                _extract_pdf_pages,
+                [file_path] * len(starts),
+                starts,
+                [start + step for start in starts],
+            )
+            return [text for chunk in chunks for text in chunk]
 
 
 class JSONProfileParser(ProfileParser):
@@ -403,6 +729,8 @@ class JSONProfileParser(ProfileParser):
     and LinkedIn JSON export.
     """
 
+    SUPPORTED_EXTS = frozenset({".json"})
+
     def parse(self, file_path: str) -> UserProfile:
         """
         Parse JSON profile file.
@@ -424,9 +752,8 @@ class JSONProfileParser(ProfileParser):
             raise ValueError(f"Not a JSON file: {file_path}")
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-        except json.JSONDecodeError as e:
+            data = _json_loads(path.read_bytes())
+        except json.JSONDecodeError as e:  # orjson's decode error subclasses it
             raise ValueError(f"Invalid JSON in {file_path}: {e}") from e
         except Exception as e:
             raise ValueError(f"Failed to read JSON file: {e}") from e
@@ -451,7 +778,7 @@ class JSONProfileParser(ProfileParser):
 
     def supports_format(self, file_path: str) -> bool:
         """Check if file is JSON format."""
-        return Path(file_path).suffix.lower() == ".json"
+        return os.path.splitext(file_path)[1].lower() in self.SUPPORTED_EXTS
 
     def _detect_json_format(self, data: Dict[str, Any]) -> str:
         """Detect the JSON format based on key signatures."""
@@ -508,7 +835,8 @@ class JSONProfileParser(ProfileParser):
             description = work.get("summary", "")
             highlights = work.get("highlights", [])
             if highlights and isinstance(highlights, list):
-                description += "\n" + "\n".join(f"- {h}" for h in highlights)
+                # One join over summary + bullets, no intermediate bullet string
+                description = "\n".join([description, *[f"- {h}" for h in highlights]])
 
             has_end = bool(work.get("endDate"))
             work_experience.append({
@@ -601,32 +929,33 @@ class JSONProfileParser(ProfileParser):
                 "country": parts[2] if len(parts) > 2 else "US",
             }
 
-        # Parse work experience
+        # Parse work experience. Dates are handed on as YYYY-MM-DD, which
+        # _dict_to_user_profile parses without going through dateutil.
+        parse_date = _parse_linkedin_date
         work_experience = []
         positions = data.get("positions", {})
         position_values = positions.get("values", []) if isinstance(positions, dict) else []
         for pos in position_values:
             if not isinstance(pos, dict):
                 continue
-            company_data = pos.get("company", {})
+            get = pos.get
+            company_data = get("company", {})
             company_name = company_data.get("name", "") if isinstance(company_data, dict) else str(company_data)
 
-            start = _parse_linkedin_date(pos.get("startDate"))
-            end = _parse_linkedin_date(pos.get("endDate"))
-            is_current = bool(pos.get("isCurrent", False))
-
+            start = parse_date(get("startDate"))
             if not start:
                 logger.warning(f"Skipping LinkedIn position at {company_name}: no start date")
                 continue
+            end = parse_date(get("endDate"))
 
             work_experience.append({
                 "company": company_name,
-                "position": pos.get("title", ""),
-                "start_date": start.isoformat() if start else None,
-                "end_date": end.isoformat() if end else None,
-                "description": pos.get("summary", ""),
+                "position": get("title", ""),
+                "start_date": start.date().isoformat(),
+                "end_date": end.date().isoformat() if end else None,
+                "description": get("summary", ""),
                 "skills": [],
-                "is_current": is_current,
+                "is_current": bool(get("isCurrent", False)),
             })
 
         # Parse education
@@ -636,12 +965,12 @@ class JSONProfileParser(ProfileParser):
         for edu in edu_values:
             if not isinstance(edu, dict):
                 continue
-            grad_date = _parse_linkedin_date(edu.get("endDate"))
+            grad_date = parse_date(edu.get("endDate"))
             education.append({
                 "institution": edu.get("schoolName", ""),
                 "degree": edu.get("degree", ""),
                 "field": edu.get("fieldOfStudy", ""),
-                "graduation_date": grad_date.isoformat() if grad_date else None,
+                "graduation_date": grad_date.date().isoformat() if grad_date else None,
                 "gpa": edu.get("grade"),
                 "honors": edu.get("activities", ""),
             })
@@ -699,6 +1028,8 @@ class TextProfileParser(ProfileParser):
     structured profile data.
     """
 
+    SUPPORTED_EXTS = frozenset({".txt", ".text", ".md", ".rst"})
+
     def __init__(self, llm_provider: Optional[LLMProvider] = None):
         self.llm_provider = llm_provider
 
@@ -728,13 +1059,20 @@ class TextProfileParser(ProfileParser):
             )
 
         try:
-            text_content = path.read_text(encoding="utf-8")
-        except UnicodeDecodeError:
-            text_content = path.read_text(encoding="latin-1")
+            raw = path.read_bytes()
         except Exception as e:
             logger.error(f"Failed to read text file {file_path}: {e}")
             raise ValueError(f"Failed to read text file: {e}") from e
 
+        # One read, then decode; latin-1 accepts any bytes
+        try:
+            text_content = raw.decode("utf-8")
+        except UnicodeDecodeError:
+            text_content = raw.decode("latin-1")
+        # Universal newlines, as read_text() gave
+        if "\r" in text_content:
+            text_content = text_content.replace("\r\n", "\n").replace("\r", "\n")
+
         if not text_content.strip():
             raise ValueError(f"Text file is empty: {file_path}")
 
@@ -750,7 +1088,7 @@ class TextProfileParser(ProfileParser):
 
     def supports_format(self, file_path: str) -> bool:
         """Check if file is text format."""
-        return Path(file_path).suffix.lower() in (".txt", ".text", ".md", ".rst")
+        return os.path.splitext(file_path)[1].lower() in self.SUPPORTED_EXTS
 
 
 class ProfileParserFactory:
@@ -762,11 +1100,16 @@ class ProfileParserFactory:
     """
 
     _parsers: list = []
+    # extension -> (position in _parsers, parser), for parsers declaring SUPPORTED_EXTS
+    _by_ext: Dict[str, tuple] = {}
+    # (position, parser) for parsers that only implement supports_format()
+    _unindexed: list = []
 
     @classmethod
     def register_parser(cls, parser: ProfileParser) -> None:
         """Register a profile parser."""
         cls._parsers.append(parser)
+        cls._rebuild_index()
 
     @classmethod
     def create_with_llm(cls, llm_provider: LLMProvider) -> None:
@@ -784,6 +1127,7 @@ class ProfileParserFactory:
             PDFProfileParser(llm_provider=llm_provider),
             TextProfileParser(llm_provider=llm_provider),
         ]
+        cls._rebuild_index()
         logger.info("Registered all parsers with LLM provider")
 
     @classmethod
@@ -814,13 +1158,68 @@ class ProfileParserFactory:
         logger.info(f"Using {type(parser).__name__} for {file_path}")
         return parser.parse(file_path)
 
+    @classmethod
+    def parse_profiles_batch(
+        cls, file_paths: List[str], max_workers: int = 8
+    ) -> List[Any]:
+        """
+        Parse many profile files concurrently (bulk onboarding).
+
+        File reads and LLM extraction calls both block outside the GIL, so a
+        thread pool overlaps them across files. A file that fails yields its
+        exception in place of a profile, so one bad resume does not discard
+        the rest of the batch.
+
+        Args:
+            file_paths: Paths to profile files
+            max_workers: Upper bound on concurrent parses
+
+        Returns:
+            UserProfiles (or exceptions) in the same order as file_paths
+        """
+        if not file_paths:
+            return []
+        if not cls._parsers:
+            cls._register_defaults()
+
+        def parse_one(file_path: str) -> Any:
+            try:
+                return cls.parse_profile(file_path)
+            except Exception as e:
+                logger.warning(f"Failed to parse profile {file_path}: {e}")
+                return e
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(file_paths)))) as executor:
+            return list(executor.map(parse_one, file_paths))
+
     @classmethod
     def get_parser(cls, file_path: str) -> Optional[ProfileParser]:
-        """Get appropriate parser for file."""
-        for parser in cls._parsers:
-            if parser.supports_format(file_path):
-                return parser
-        return None
+        """Get appropriate parser for file (the first registered one that supports it)."""
+        position, parser = cls._by_ext.get(
+            os.path.splitext(file_path)[1].lower(), (len(cls._parsers), None)
+        )
+        # A parser without SUPPORTED_EXTS registered ahead of the match still wins
+        for other_position, other in cls._unindexed:
+            if other_position > position:
+                break
+            if other.supports_format(file_path):
+                return other
+        return parser
+
+    @classmethod
+    def _rebuild_index(cls) -> None:
+        """Rebuild the extension lookup from _parsers."""
+        by_ext: Dict[str, tuple] = {}
+        unindexed = []
+        for position, parser in enumerate(cls._parsers):
+            exts = getattr(parser, "SUPPORTED_EXTS", None)
+            if exts is None:
+                unindexed.append((position, parser))
+                continue
+            for ext in exts:
+                by_ext.setdefault(ext, (position, parser))
+        cls._by_ext = by_ext
+        cls._unindexed = unindexed
 
     @classmethod
     def _register_defaults(cls) -> None:
@@ -830,11 +1229,13 @@ class ProfileParserFactory:
             PDFProfileParser(),
             TextProfileParser(),
         ]
+        cls._rebuild_index()
 
     @classmethod
     def reset(cls) -> None:
         """Clear all registered parsers. Useful for testing."""
         cls._parsers = []
+        cls._rebuild_index()
 
 
 class ProfileValidator:
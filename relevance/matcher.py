@@ -6,12 +6,26 @@ skill overlap, experience alignment, LLM semantic analysis, and hybrid
 weighted combinations.
 """
 
+import hashlib
 import logging
-import re
+import threading
 from abc import ABC, abstractmethod
-from typing import Optional, List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import chain
+from typing import Optional, List, Dict, Any, Mapping, Sequence, Tuple
 
-from models.schemas import Job, UserProfile, RelevanceScore, JobLevel
+import numpy as np
+
+try:
+    import ahocorasick  # optional (pyahocorasick): one-pass multi-skill text scan
+except ImportError:
+    ahocorasick = None
+
+from models.job_table import SCORE_FIELDS, JobTable, score_matrix
+from models.schemas import Job, UserProfile, RelevanceScore, JobLevel, shared_metadata
+from models.skills import SkillVocab
 
 logger = logging.getLogger(__name__)
 
@@ -32,24 +46,100 @@ LEVEL_YEAR_RANGES: Dict[JobLevel, tuple] = {
 
 def _normalize(text: str) -> str:
     """Lowercase, strip, collapse whitespace."""
-    return re.sub(r"\s+", " ", text.lower().strip())
+    # str.split() splits on exactly the characters \s matches, so this equals
+    # re.sub(r"\s+", " ", text.lower().strip()) without the regex engine
+    return " ".join(text.lower().split())
 
 
-def _extract_skills_from_text(text: str, known_skills: List[str]) -> List[str]:
-    """Find which known skills appear in a block of text."""
-    text_lower = _normalize(text)
-    found = []
-    for skill in known_skills:
-        skill_lower = _normalize(skill)
-        if skill_lower and skill_lower in text_lower:
-            found.append(skill)
-    return found
+class _SkillScanner:
+    """
+    Finds which of a fixed list of skills occur in normalised text.
+
+    Skills are normalised once. With pyahocorasick installed, all of them are
+    matched in a single pass over the text; otherwise each is a substring test.
+
+    The skills are encoded first into `vocab`; a batch copies it with
+    batch_vocab(), so the profile's bits (`user_skills`, `user_bits`) and the
+    scan results are valid in every batch without re-encoding the profile.
+    """
+
+    def __init__(self, skills: Tuple[str, ...]):
+        self.skills = skills
+        self.vocab = SkillVocab()
+        self.user_skills = self.vocab.encode(skills)
+        self.user_bits: List[Tuple[str, int]] = [(s, self.vocab.bit(s)) for s in skills]
+        self._pattern_bits: Dict[str, int] = {}  # pattern -> vocab bits of its skills
+        for skill, bit in self.user_bits:
+            pattern = _normalize(skill)
+            if pattern:
+                self._pattern_bits[pattern] = self._pattern_bits.get(pattern, 0) | bit
+        self._automaton = None
+        if ahocorasick is not None and self._pattern_bits:
+            automaton = ahocorasick.Automaton()
+            for pattern, bits in self._pattern_bits.items():
+                automaton.add_word(pattern, bits)
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    def batch_vocab(self) -> SkillVocab:
+        """A fresh vocabulary for one batch, starting from the profile's bits."""
+        return SkillVocab(self.vocab)
+
+    def find_bits(self, text_lower: str) -> int:
+        """Bitset of the skills whose normalised form occurs in text_lower."""
+        bits = 0
+        if self._automaton is None:
+            for pattern, pattern_bits in self._pattern_bits.items():
+                if pattern in text_lower:
+                    bits |= pattern_bits
+            return bits
+        for _, pattern_bits in self._automaton.iter(text_lower):
+            bits |= pattern_bits
+        return bits
+
+
+@lru_cache(maxsize=256)
+def _skill_scanner(skills: Tuple[str, ...]) -> _SkillScanner:
+    """Scanner for a profile's skills, built once per distinct skill tuple."""
+    return _SkillScanner(skills)
+
+
+def _clamp_unit(val: Any, default: float = 0.5) -> float:
+    """val as a float clamped to 0-1, or default if it is not a number."""
+    if type(val) is not float:
+        # Well-formed LLM JSON gives floats; anything else goes through float()
+        try:
+            val = float(val)
+        except (TypeError, ValueError):
+            return default
+    # Same results as max(0.0, min(1.0, val)), including NaN -> 1.0 and -0.0 -> 0.0
+    val = val if val < 1.0 else 1.0
+    return val if val > 0.0 else 0.0
+
+
+def _failed_score(reason: Any) -> RelevanceScore:
+    """All-zero score standing in for a job that could not be scored."""
+    return RelevanceScore(
+        overall_score=0.0,
+        skills_score=0.0,
+        experience_score=0.0,
+        location_score=0.0,
+        salary_score=0.0,
+        level_score=0.0,
+        reasoning=f"Scoring failed: {reason}",
+    )
 
 
 # ---------------------------------------------------------------------------
 # Abstract base
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=None)
+def _matcher_metadata(name: str) -> Mapping[str, Any]:
+    """One shared read-only metadata mapping per matcher name."""
+    return shared_metadata(matcher=name)
+
+
 class RelevanceMatcher(ABC):
     """
     Abstract base class for relevance matching algorithms.
@@ -58,6 +148,10 @@ class RelevanceMatcher(ABC):
     to produce relevance scores. Implements Strategy Pattern for different matching approaches.
     """
 
+    # True for matchers that call out to a service (HybridMatcher overlaps
+    # them with the local matchers and can skip them for rejected jobs)
+    expensive = False
+
     @abstractmethod
     def match(self, profile: UserProfile, job: Job) -> RelevanceScore:
         """
@@ -80,6 +174,19 @@ class RelevanceMatcher(ABC):
         """Get name/identifier for this matcher."""
         pass
 
+    def _score_metadata(self) -> Mapping[str, Any]:
+        """Metadata tagging scores with this matcher, shared by all of them."""
+        return _matcher_metadata(self.get_name())
+
+    def match_many(self, profile: UserProfile, jobs: List[Job]) -> List[RelevanceScore]:
+        """
+        Score several jobs, in order. Matchers that can batch work override this.
+
+        Raises:
+            Whatever match() raises for the first failing job
+        """
+        return [self.match(profile, job) for job in jobs]
+
 
 # ---------------------------------------------------------------------------
 # Skill-based matcher
@@ -93,6 +200,24 @@ class SkillBasedMatcher(RelevanceMatcher):
     calculating score based on match percentage and weight.
     """
 
+    # When to count profile skills mentioned in the job description as required
+    SCAN_DESCRIPTION_POLICIES = ("always", "when_unlisted", "never")
+
+    def __init__(self, scan_description: str = "always"):
+        """
+        Initialize skill-based matcher.
+
+        Args:
+            scan_description: "always" scans every description; "when_unlisted"
+                only jobs that list no skills; "never" skips the scan
+        """
+        if scan_description not in self.SCAN_DESCRIPTION_POLICIES:
+            raise ValueError(
+                f"scan_description must be one of {self.SCAN_DESCRIPTION_POLICIES}, "
+                f"got {scan_description!r}"
+            )
+        self.scan_description = scan_description
+
     def match(self, profile: UserProfile, job: Job) -> RelevanceScore:
         """
         Match based on skill alignment.
@@ -101,59 +226,135 @@ class SkillBasedMatcher(RelevanceMatcher):
         Requirements matched count fully; nice-to-haves count at 50% weight.
         Also scans the job description for skill mentions.
         """
-        user_skills = {_normalize(s) for s in profile.skills if s.strip()}
+        # Skill sets are bitsets over a per-call vocabulary: & is intersection,
+        # bit_count() is size
+        scanner = _skill_scanner(tuple(profile.skills))
+        vocab = scanner.batch_vocab()
+        user_skills = scanner.user_skills
+        required, nice_to_have = self._job_skill_bits(job, scanner, vocab)
 
-        # Collect all job-side skills
-        required = {_normalize(r) for r in job.requirements if r.strip()}
-        nice_to_have = {_normalize(n) for n in job.nice_to_haves if n.strip()}
-
-        # Also look for user skills mentioned in the job description
-        desc_skills = {
-            _normalize(s)
-            for s in _extract_skills_from_text(job.description, profile.skills)
-        }
-        # Merge description-found skills into required if not already there
-        required = required | (desc_skills - nice_to_have)
-
-        all_job_skills = required | nice_to_have
-
-        if not all_job_skills:
-            return RelevanceScore(
-                overall_score=0.5,
-                skills_score=0.5,
-                experience_score=0.0,
-                location_score=0.0,
-                salary_score=0.0,
-                level_score=0.0,
-                matching_skills=list(user_skills)[:10],
-                missing_skills=[],
-                reasoning="No specific skills listed in job posting; neutral score assigned.",
-                metadata={"matcher": self.get_name()},
-            )
+        if not (required | nice_to_have):
+            return self._neutral_score(profile)
 
         # Matching
-        matched_required = user_skills & required
-        matched_nice = user_skills & nice_to_have
-        missing = (required | nice_to_have) - user_skills
+        matched_required = (user_skills & required).bit_count()
+        matched_nice = (user_skills & nice_to_have).bit_count()
+        n_required = required.bit_count()
+        n_nice = nice_to_have.bit_count()
 
         # Score: required matches count 100%, nice-to-have at 50%
-        total_weight = len(required) + len(nice_to_have) * 0.5
-        matched_weight = len(matched_required) + len(matched_nice) * 0.5
+        total_weight = n_required + n_nice * 0.5
+        matched_weight = matched_required + matched_nice * 0.5
         skills_score = matched_weight / total_weight if total_weight > 0 else 0.0
         skills_score = min(skills_score, 1.0)
 
-        # Restore original casing for output
-        matching_skills_original = [
-            s for s in profile.skills if _normalize(s) in (matched_required | matched_nice)
+        return self._build_score(
+            job, vocab, user_skills, scanner.user_bits, required, nice_to_have,
+            (matched_required, n_required, matched_nice, n_nice), skills_score,
+        )
+
+    def match_many(self, profile: UserProfile, jobs: List[Job]) -> List[RelevanceScore]:
+        """
+        Score a batch, doing the per-profile work once and the score
+        arithmetic as array operations.
+
+        Gives the same scores as calling match() per job.
+        """
+        if len(jobs) < 2:
+            return super().match_many(profile, jobs)
+
+        scanner = _skill_scanner(tuple(profile.skills))
+        vocab = scanner.batch_vocab()
+        user_skills = scanner.user_skills
+        user_bits = scanner.user_bits
+
+        job_bits = [self._job_skill_bits(job, scanner, vocab) for job in jobs]
+        # Columns: matched required, required, matched nice-to-have, nice-to-have
+        counts = np.array(
+            [
+                (
+                    (user_skills & required).bit_count(), required.bit_count(),
+                    (user_skills & nice).bit_count(), nice.bit_count(),
+                )
+                for required, nice in job_bits
+            ],
+            dtype=np.int64,
+        ).reshape(len(jobs), 4)
+        total_weight = counts[:, 1] + counts[:, 3] * 0.5
+        matched_weight = counts[:, 0] + counts[:, 2] * 0.5
+        skills_scores = np.minimum(
+            matched_weight / np.where(total_weight > 0, total_weight, 1.0), 1.0
+        )
+
+        return [
+            self._build_score(
+                job, vocab, user_skills, user_bits, required, nice, tuple(row), skills_score,
+            )
+            if required | nice else self._neutral_score(profile)
+            for job, (required, nice), row, skills_score
+            in zip(jobs, job_bits, counts.tolist(), skills_scores.tolist())
         ]
+
+    def _job_skill_bits(
+        self, job: Job, scanner: _SkillScanner, vocab: SkillVocab
+    ) -> Tuple[int, int]:
+        """
+        (required, nice_to_have) bitsets for job over vocab, with profile skills
+        mentioned in the description merged into required per scan_description.
+        """
+        required = vocab.encode(job.requirements)
+        nice_to_have = vocab.encode(job.nice_to_haves)
+        policy = self.scan_description
+        if policy == "never" or not job.description:
+            return required, nice_to_have
+        if policy == "when_unlisted" and (required or nice_to_have):
+            return required, nice_to_have
+        desc_skills = scanner.find_bits(_normalize(job.description))
+        return required | (desc_skills & ~nice_to_have), nice_to_have
+
+    def _neutral_score(self, profile: UserProfile) -> RelevanceScore:
+        """Score for a job that lists no skills at all."""
+        return RelevanceScore(
+            overall_score=0.5,
+            skills_score=0.5,
+            experience_score=0.0,
+            location_score=0.0,
+            salary_score=0.0,
+            level_score=0.0,
+            matching_skills=list({_normalize(s) for s in profile.skills if s.strip()})[:10],
+            missing_skills=[],
+            reasoning="No specific skills listed in job posting; neutral score assigned.",
+            metadata=self._score_metadata(),
+        )
+
+    def _build_score(
+        self,
+        job: Job,
+        vocab: SkillVocab,
+        user_skills: int,
+        user_bits: List[Tuple[str, int]],
+        required: int,
+        nice_to_have: int,
+        counts: Tuple[int, int, int, int],
+        skills_score: float,
+    ) -> RelevanceScore:
+        """RelevanceScore for one job from its bitsets and match counts."""
+        matched_required, n_required, matched_nice, n_nice = counts
+        all_job_skills = required | nice_to_have
+        matched = user_skills & all_job_skills
+        missing = all_job_skills & ~user_skills
+
+        # Restore original casing for output
+        bit = vocab.bit
+        matching_skills_original = [s for s, b in user_bits if b & matched]
         missing_skills_original = [
-            s for s in (list(job.requirements) + list(job.nice_to_haves))
-            if _normalize(s) in missing
+            s for s in (*job.requirements, *job.nice_to_haves)
+            if bit(s) & missing
         ]
 
         reasoning = (
-            f"Matched {len(matched_required)}/{len(required)} required skills"
-            f" and {len(matched_nice)}/{len(nice_to_have)} nice-to-haves."
+            f"Matched {matched_required}/{n_required} required skills"
+            f" and {matched_nice}/{n_nice} nice-to-haves."
         )
 
         return RelevanceScore(
@@ -166,7 +367,7 @@ class SkillBasedMatcher(RelevanceMatcher):
             matching_skills=matching_skills_original,
             missing_skills=missing_skills_original,
             reasoning=reasoning,
-            metadata={"matcher": self.get_name()},
+            metadata=self._score_metadata(),
         )
 
     def get_name(self) -> str:
@@ -189,11 +390,52 @@ class ExperienceMatcher(RelevanceMatcher):
         """
         Match based on experience, level, location, and salary alignment.
         """
-        experience_score = self._score_experience(profile, job)
-        level_score = self._score_level(profile, job)
-        location_score = self._score_location(profile, job)
-        salary_score = self._score_salary(profile, job)
+        return self._build_score(
+            self._score_experience(profile, job),
+            self._score_level(profile, job),
+            self._score_location(profile, job),
+            self._score_salary(profile, job),
+        )
+
+    def match_many(self, profile: UserProfile, jobs: List[Job]) -> List[RelevanceScore]:
+        """
+        Score a batch with array operations over a JobTable.
+
+        Gives the same scores as calling match() per job.
+        """
+        if len(jobs) < 2:
+            return super().match_many(profile, jobs)
+
+        table = JobTable.from_jobs(jobs)
+
+        # Experience and level depend only on the job level: score each level once
+        years = profile.get_years_of_experience()
+        codes = table.level_code.astype(np.intp) + 1  # NO_LEVEL -> 0
+        levels = [None, *JobLevel]
+        experience = np.array([self._experience_for_level(years, lvl) for lvl in levels])[codes]
+        level = np.array(
+            [self._level_for_preferences(lvl, profile.preferred_job_levels) for lvl in levels]
+        )[codes]
+
+        location = self._score_location_many(profile, table)
+        salary = self._score_salary_many(profile, table)
+
+        return [
+            self._build_score(*row)
+            for row in zip(experience.tolist(), level.tolist(), location.tolist(), salary.tolist())
+        ]
 
+    def get_name(self) -> str:
+        return "experience"
+
+    def _build_score(
+        self,
+        experience_score: float,
+        level_score: float,
+        location_score: float,
+        salary_score: float,
+    ) -> RelevanceScore:
+        """Combine component scores into a RelevanceScore."""
         # Weighted average for overall
         overall = (
             experience_score * 0.35
@@ -223,20 +465,23 @@ class ExperienceMatcher(RelevanceMatcher):
             matching_skills=[],
             missing_skills=[],
             reasoning=reasoning,
-            metadata={"matcher": self.get_name()},
+            metadata=self._score_metadata(),
         )
 
-    def get_name(self) -> str:
-        return "experience"
-
     @staticmethod
     def _score_experience(profile: UserProfile, job: Job) -> float:
         """Score how well user's years of experience fit the job level."""
-        years = profile.get_years_of_experience()
-        if not job.level:
+        return ExperienceMatcher._experience_for_level(
+            profile.get_years_of_experience(), job.level
+        )
+
+    @staticmethod
+    def _experience_for_level(years: float, job_level: Optional[JobLevel]) -> float:
+        """Experience score for a candidate with `years` applying at job_level."""
+        if not job_level:
             return 0.5 if years > 0 else 0.3
 
-        expected = LEVEL_YEAR_RANGES.get(job.level, (0, 30))
+        expected = LEVEL_YEAR_RANGES.get(job_level, (0, 30))
         min_y, max_y = expected
 
         if min_y <= years <= max_y:
@@ -251,19 +496,23 @@ class ExperienceMatcher(RelevanceMatcher):
     @staticmethod
     def _score_level(profile: UserProfile, job: Job) -> float:
         """Score job level match against user's preferred levels."""
-        if not job.level:
+        return ExperienceMatcher._level_for_preferences(job.level, profile.preferred_job_levels)
+
+    @staticmethod
+    def _level_for_preferences(
+        job_level: Optional[JobLevel], preferred: List[JobLevel]
+    ) -> float:
+        """Level score for job_level given the candidate's preferred levels."""
+        if not job_level:
             return 0.5
-        if not profile.preferred_job_levels:
+        if not preferred:
             return 0.5
 
-        if job.level in profile.preferred_job_levels:
+        if job_level in preferred:
             return 1.0
 
-        all_levels = list(JobLevel)
-        job_idx = all_levels.index(job.level)
-        for pref in profile.preferred_job_levels:
-            pref_idx = all_levels.index(pref)
-            distance = abs(job_idx - pref_idx)
+        for pref in preferred:
+            distance = abs(job_level.rank - pref.rank)
             if distance == 1:
                 return 0.7
             if distance == 2:
@@ -330,6 +579,60 @@ class ExperienceMatcher(RelevanceMatcher):
         else:
             return 1.0
 
+    @staticmethod
+    def _score_location_many(profile: UserProfile, table: JobTable) -> np.ndarray:
+        """Vectorised _score_location over every row of table."""
+        if profile.remote_preference in ("required", "preferred"):
+            remote_score = 1.0
+        elif profile.remote_preference == "flexible":
+            remote_score = 0.8
+        else:
+            remote_score = 0.5
+
+        # On-site: the first preferred location matching city (1.0) or state (0.7)
+        # wins, so apply preferences last-to-first and let earlier ones overwrite
+        if not profile.preferred_locations:
+            onsite = np.full(len(table), 0.6 if profile.willing_to_relocate else 0.4)
+        else:
+            onsite = np.full(len(table), 0.4 if profile.willing_to_relocate else 0.1)
+            for pref_loc in reversed(profile.preferred_locations):
+                state_hit = table.state == pref_loc.state.lower().strip()
+                city_hit = table.city == pref_loc.city.lower().strip()
+                onsite = np.where(state_hit, 0.7, onsite)
+                onsite = np.where(city_hit, 1.0, onsite)
+
+        scores = np.where(table.remote, remote_score, onsite)
+        return np.where(table.has_location, scores, 0.5)
+
+    @staticmethod
+    def _score_salary_many(profile: UserProfile, table: JobTable) -> np.ndarray:
+        """Vectorised _score_salary over every row of table."""
+        n = len(table)
+        pref = profile.preferred_salary_range
+        if not pref or (not pref.min_amount and not pref.max_amount):
+            return np.full(n, 0.5)
+
+        pref_min = pref.min_amount or 0
+        pref_max = pref.max_amount or float("inf")
+
+        # None and 0 both count as "not given", like the truthiness test in _score_salary
+        has_min = ~np.isnan(table.salary_min) & (table.salary_min != 0)
+        has_max = ~np.isnan(table.salary_max) & (table.salary_max != 0)
+        job_min = np.where(has_min, table.salary_min, 0.0)
+        job_max = np.where(has_max, table.salary_max, np.inf)
+
+        if pref_min > 0:
+            with np.errstate(invalid="ignore"):
+                below = np.maximum(0.0, 1.0 - (pref_min - job_max) / pref_min * 2)
+        else:
+            below = np.ones(n)
+
+        scores = np.ones(n)
+        if pref_max != float("inf"):
+            scores = np.where(job_min > pref_max, 0.9, scores)
+        scores = np.where(job_max < pref_min, below, scores)
+        return np.where(has_min | has_max, scores, 0.5)
+
 
 # ---------------------------------------------------------------------------
 # LLM-based matcher
@@ -343,6 +646,8 @@ class LLMBasedMatcher(RelevanceMatcher):
     context, transferable skills, growth potential, and non-obvious connections.
     """
 
+    expensive = True
+
     SCORING_SCHEMA = {
         "overall_score": "float 0.0-1.0 - overall match quality",
         "skills_score": "float 0.0-1.0 - technical skill alignment",
@@ -363,14 +668,34 @@ class LLMBasedMatcher(RelevanceMatcher):
         "All scores must be between 0.0 and 1.0."
     )
 
-    def __init__(self, llm_provider):
+    # Multi-job prompts answer with one SCORING_SCHEMA entry per job
+    BATCH_SCORING_SCHEMA = {
+        "results": [{"job": "int - job number from its heading", **SCORING_SCHEMA}],
+    }
+
+    # Parsed responses keyed by model + prompt, shared by all instances so a
+    # re-run in the same process skips jobs it has already scored. Like
+    # OllamaProvider's cache, only deterministic (temperature ~0) providers are
+    # cached; replaying one sampled answer forever would hide the variance.
+    CACHE_MAX_ENTRIES = 2048
+    CACHE_MAX_TEMPERATURE = 0.01
+    _response_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+    _cache_lock = threading.Lock()
+
+    def __init__(self, llm_provider, max_workers: int = 8, batch_size: int = 1):
         """
         Initialize LLM-based matcher.
 
         Args:
             llm_provider: LLM provider instance for scoring
+            max_workers: Concurrent requests when the provider has no batched
+                generation of its own
+            batch_size: Jobs scored per prompt by match_many(); 1 sends one
+                prompt per job
         """
         self.llm_provider = llm_provider
+        self.max_workers = max_workers
+        self.batch_size = max(1, batch_size)
 
     def match(self, profile: UserProfile, job: Job) -> RelevanceScore:
         """
@@ -379,6 +704,13 @@ class LLMBasedMatcher(RelevanceMatcher):
         Sends profile summary and job details to the LLM for nuanced scoring.
         """
         prompt = self._build_prompt(profile, job)
+        return self._score_prompt(prompt, self._cache_key(prompt))
+
+    def _score_prompt(self, prompt: str, key: Optional[str]) -> RelevanceScore:
+        """Score one single-job prompt, from the cache when possible."""
+        data = self._cache_get(key)
+        if data is not None:
+            return self._parse_response(data)
 
         try:
             data = self.llm_provider.generate_with_structured_output(
@@ -386,38 +718,274 @@ class LLMBasedMatcher(RelevanceMatcher):
                 output_schema=self.SCORING_SCHEMA,
                 system_prompt=self.SYSTEM_PROMPT,
             )
-            return self._parse_response(data)
+            score = self._parse_response(data)
+            self._cache_put(key, data)
+            return score
         except (ConnectionError, RuntimeError, ValueError) as e:
             logger.error(f"LLM matching failed: {e}")
-            return RelevanceScore(
-                overall_score=0.5,
-                skills_score=0.5,
-                experience_score=0.5,
-                location_score=0.5,
-                salary_score=0.5,
-                level_score=0.5,
-                reasoning=f"LLM analysis unavailable: {e}",
-                metadata={"matcher": self.get_name(), "error": str(e)},
+            return self._fallback_score(e)
+
+    def match_many(self, profile: UserProfile, jobs: List[Job]) -> List[RelevanceScore]:
+        """
+        Score several jobs, skipping any already in the response cache.
+
+        With batch_size > 1 the remaining jobs are scored batch_size at a time,
+        one prompt per batch. Otherwise each job gets its own prompt, all sent
+        at once when the provider supports batched generation (OllamaProvider
+        and AsyncOllamaProvider) and from a thread pool when it does not.
+        """
+        # The candidate block is the same for every job: format it once
+        head = self._profile_section(profile)
+        prompts = [self._build_prompt(profile, job, head) for job in jobs]
+        keys = [self._cache_key(prompt) for prompt in prompts]
+        cached = [self._cache_get(key) for key in keys]
+        pending = [i for i, data in enumerate(cached) if data is None]
+
+        scores: List[Optional[RelevanceScore]] = [
+            None if data is None else self._parse_response(data) for data in cached
+        ]
+        if not pending:
+            return scores
+
+        pending_prompts = [prompts[i] for i in pending]
+        pending_keys = [keys[i] for i in pending]
+        if self.batch_size > 1 and len(pending) > 1:
+            fresh = self._match_in_batches(
+                head, [jobs[i] for i in pending], pending_prompts, pending_keys
             )
+        else:
+            fresh = self._match_each(pending_prompts, pending_keys)
+        for i, score in zip(pending, fresh):
+            scores[i] = score
+        return scores
+
+    def _match_each(self, prompts: List[str], keys: List[Optional[str]]) -> List[RelevanceScore]:
+        """Score single-job prompts, caching successful responses."""
+        generate_many = getattr(self.llm_provider, "generate_many_with_structured_output", None)
+        if generate_many is None or len(prompts) < 2:
+            return self._match_concurrently(prompts, keys)
+
+        try:
+            results = generate_many(
+                prompts,
+                output_schema=self.SCORING_SCHEMA,
+                system_prompt=self.SYSTEM_PROMPT,
+            )
+        except (ConnectionError, RuntimeError, ValueError) as e:
+            logger.warning(f"LLM batch matching failed, scoring individually: {e}")
+            return self._match_concurrently(prompts, keys)
+
+        scores = []
+        for key, data in zip(keys, results):
+            if isinstance(data, Exception):
+                logger.error(f"LLM matching failed: {data}")
+                scores.append(self._fallback_score(data))
+            else:
+                scores.append(self._parse_response(data))
+                self._cache_put(key, data)
+        return scores
+
+    def _match_in_batches(
+        self,
+        head: str,
+        jobs: List[Job],
+        single_prompts: List[str],
+        keys: List[Optional[str]],
+    ) -> List[RelevanceScore]:
+        """
+        Score jobs batch_size per prompt.
+
+        Each job's entry is cached under its single-job key, so later calls
+        reuse it either way. Jobs a batch response leaves out are rescored
+        one prompt each.
+        """
+        chunks = [
+            range(start, min(start + self.batch_size, len(jobs)))
+            for start in range(0, len(jobs), self.batch_size)
+        ]
+        prompts = [self._build_batch_prompt(head, [jobs[i] for i in chunk]) for chunk in chunks]
+
+        generate_many = getattr(self.llm_provider, "generate_many_with_structured_output", None)
+        if generate_many is not None and len(prompts) > 1:
+            try:
+                responses = generate_many(
+                    prompts,
+                    output_schema=self.BATCH_SCORING_SCHEMA,
+                    system_prompt=self.SYSTEM_PROMPT,
+                )
+            except (ConnectionError, RuntimeError, ValueError) as e:
+                responses = [e] * len(prompts)
+        else:
+            workers = max(1, min(len(prompts), self.max_workers))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                responses = list(executor.map(self._generate_batch, prompts))
+
+        scores: List[Optional[RelevanceScore]] = [None] * len(jobs)
+        for chunk, data in zip(chunks, responses):
+            if isinstance(data, Exception):
+                logger.warning(f"LLM batch matching failed: {data}")
+                continue
+            for i, entry in zip(chunk, self._batch_entries(data, len(chunk))):
+                if entry is not None:
+                    scores[i] = self._parse_response(entry)
+                    self._cache_put(keys[i], entry)
+
+        missing = [i for i, score in enumerate(scores) if score is None]
+        if missing:
+            logger.warning(f"Scoring {len(missing)} job(s) individually after batch matching")
+            rescored = self._match_concurrently(
+                [single_prompts[i] for i in missing], [keys[i] for i in missing]
+            )
+            for i, score in zip(missing, rescored):
+                scores[i] = score
+        return scores
+
+    def _generate_batch(self, prompt: str) -> Any:
+        """One multi-job request; errors are returned rather than raised."""
+        try:
+            return self.llm_provider.generate_with_structured_output(
+                prompt=prompt,
+                output_schema=self.BATCH_SCORING_SCHEMA,
+                system_prompt=self.SYSTEM_PROMPT,
+            )
+        except (ConnectionError, RuntimeError, ValueError) as e:
+            return e
+
+    @staticmethod
+    def _batch_entries(data: Any, n: int) -> List[Optional[Dict[str, Any]]]:
+        """Line up a batch response's results with its n jobs (None where absent)."""
+        entries: List[Optional[Dict[str, Any]]] = [None] * n
+        results = data.get("results") if isinstance(data, dict) else None
+        if not isinstance(results, list):
+            return entries
+        for pos, entry in enumerate(results):
+            if not isinstance(entry, dict):
+                continue
+            try:
+                idx = int(entry.get("job", pos + 1)) - 1
+            except (TypeError, ValueError):
+                idx = pos
+            if 0 <= idx < n and entries[idx] is None:
+                entries[idx] = entry
+        return entries
 
     def get_name(self) -> str:
         return "llm_based"
 
-    def _build_prompt(self, profile: UserProfile, job: Job) -> str:
-        """Build the matching prompt for the LLM."""
+    def _cache_key(self, prompt: str) -> Optional[str]:
+        """
+        Hash the prompt together with the model that will answer it.
+
+        Returns None (not cached) unless the provider's configured temperature
+        is at most CACHE_MAX_TEMPERATURE.
+        """
+        temperature = getattr(getattr(self.llm_provider, "config", None), "temperature", None)
+        if temperature is None or temperature > self.CACHE_MAX_TEMPERATURE:
+            return None
+        model_id = getattr(self.llm_provider, "model_id", type(self.llm_provider).__name__)
+        return hashlib.sha256(f"{model_id}\0{prompt}".encode()).hexdigest()
+
+    @classmethod
+    def _cache_get(cls, key: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Return the parsed response cached under key, if any."""
+        if key is None:
+            return None
+        with cls._cache_lock:
+            data = cls._response_cache.get(key)
+            if data is not None:
+                cls._response_cache.move_to_end(key)
+            return data
+
+    @classmethod
+    def _cache_put(cls, key: Optional[str], data: Dict[str, Any]) -> None:
+        """Store a parsed response, evicting the least recently used entry when full."""
+        if key is None:
+            return
+        with cls._cache_lock:
+            cls._response_cache[key] = data
+            cls._response_cache.move_to_end(key)
+            while len(cls._response_cache) > cls.CACHE_MAX_ENTRIES:
+                cls._response_cache.popitem(last=False)
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all cached responses."""
+        with cls._cache_lock:
+            cls._response_cache.clear()
+
+    def _match_concurrently(self, prompts: List[str], keys: List[Optional[str]]) -> List[RelevanceScore]:
+        """Score single-job prompts one request each, overlapping the round-trips."""
+        workers = min(len(prompts), self.max_workers)
+        if workers < 2:
+            return [self._score_prompt(prompt, key) for prompt, key in zip(prompts, keys)]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self._score_prompt, prompts, keys))
+
+    def _fallback_score(self, error: Exception) -> RelevanceScore:
+        """Neutral score used when the LLM could not be consulted."""
+        return RelevanceScore(
+            overall_score=0.5,
+            skills_score=0.5,
+            experience_score=0.5,
+            location_score=0.5,
+            salary_score=0.5,
+            level_score=0.5,
+            reasoning=f"LLM analysis unavailable: {error}",
+            metadata={"matcher": self.get_name(), "error": str(error)},
+        )
+
+    def _build_prompt(self, profile: UserProfile, job: Job, head: Optional[str] = None) -> str:
+        """
+        Build the matching prompt for the LLM.
+
+        head is _profile_section(profile), for callers that already have it.
+        """
+        if head is None:
+            head = self._profile_section(profile)
+        return (
+            f"{head}## Job Posting\n{self._job_section(job)}"
+            f"Rate how well this candidate matches this job."
+        )
+
+    def _build_batch_prompt(self, head: str, jobs: Sequence[Job]) -> str:
+        """Build one prompt that lists the profile (head) once and numbers the jobs."""
+        parts = [head]
+        for n, job in enumerate(jobs, 1):
+            parts.append(f"## Job {n}\n")
+            parts.append(self._job_section(job))
+        parts.append(
+            "Rate how well this candidate matches each job, "
+            "returning one result per job with its job number."
+        )
+        return "".join(parts)
+
+    @staticmethod
+    def _profile_section(profile: UserProfile) -> str:
+        """Candidate block shared by single and batch prompts."""
         skills_str = ", ".join(profile.skills[:20]) if profile.skills else "None listed"
         years = profile.get_years_of_experience()
 
-        exp_lines = []
-        for exp in profile.work_experience[:5]:
-            exp_lines.append(f"- {exp.position} at {exp.company}")
-        exp_str = "\n".join(exp_lines) if exp_lines else "No work experience listed"
+        exp_str = "\n".join(
+            f"- {exp.position} at {exp.company}" for exp in profile.work_experience[:5]
+        ) or "No work experience listed"
+        edu_str = "\n".join(
+            f"- {edu.degree} in {edu.field} from {edu.institution}"
+            for edu in profile.education[:3]
+        ) or "No education listed"
 
-        edu_lines = []
-        for edu in profile.education[:3]:
-            edu_lines.append(f"- {edu.degree} in {edu.field} from {edu.institution}")
-        edu_str = "\n".join(edu_lines) if edu_lines else "No education listed"
+        return (
+            f"## Candidate Profile\n"
+            f"Name: {profile.full_name}\n"
+            f"Summary: {profile.summary or 'N/A'}\n"
+            f"Skills: {skills_str}\n"
+            f"Years of Experience: {years}\n"
+            f"Work History:\n{exp_str}\n"
+            f"Education:\n{edu_str}\n\n"
+        )
 
+    @staticmethod
+    def _job_section(job: Job) -> str:
+        """Job details following a job heading."""
         reqs_str = ", ".join(job.requirements[:15]) if job.requirements else "Not specified"
         location_str = str(job.location) if job.location else "Not specified"
         level_str = job.level.value if job.level else "Not specified"
@@ -432,14 +1000,6 @@ class LLMBasedMatcher(RelevanceMatcher):
                 salary_str = " - ".join(parts) + f" {job.salary.period}"
 
         return (
-            f"## Candidate Profile\n"
-            f"Name: {profile.full_name}\n"
-            f"Summary: {profile.summary or 'N/A'}\n"
-            f"Skills: {skills_str}\n"
-            f"Years of Experience: {years}\n"
-            f"Work History:\n{exp_str}\n"
-            f"Education:\n{edu_str}\n\n"
-            f"## Job Posting\n"
             f"Title: {job.title}\n"
             f"Company: {job.company}\n"
             f"Location: {location_str}\n"
@@ -447,20 +1007,11 @@ class LLMBasedMatcher(RelevanceMatcher):
             f"Salary: {salary_str}\n"
             f"Requirements: {reqs_str}\n"
             f"Description: {job.description[:500] if job.description else 'N/A'}\n\n"
-            f"Rate how well this candidate matches this job."
         )
 
     @staticmethod
     def _parse_response(data: Dict[str, Any]) -> RelevanceScore:
         """Parse LLM response dict into RelevanceScore."""
-
-        def _clamp(val, default=0.5) -> float:
-            try:
-                v = float(val)
-                return max(0.0, min(1.0, v))
-            except (TypeError, ValueError):
-                return default
-
         matching = data.get("matching_skills", [])
         if not isinstance(matching, list):
             matching = []
@@ -469,16 +1020,16 @@ class LLMBasedMatcher(RelevanceMatcher):
             missing = []
 
         return RelevanceScore(
-            overall_score=_clamp(data.get("overall_score", 0.5)),
-            skills_score=_clamp(data.get("skills_score", 0.5)),
-            experience_score=_clamp(data.get("experience_score", 0.5)),
-            location_score=_clamp(data.get("location_score", 0.5)),
-            salary_score=_clamp(data.get("salary_score", 0.5)),
-            level_score=_clamp(data.get("level_score", 0.5)),
+            overall_score=_clamp_unit(data.get("overall_score", 0.5)),
+            skills_score=_clamp_unit(data.get("skills_score", 0.5)),
+            experience_score=_clamp_unit(data.get("experience_score", 0.5)),
+            location_score=_clamp_unit(data.get("location_score", 0.5)),
+            salary_score=_clamp_unit(data.get("salary_score", 0.5)),
+            level_score=_clamp_unit(data.get("level_score", 0.5)),
             matching_skills=[str(s) for s in matching if s],
             missing_skills=[str(s) for s in missing if s],
             reasoning=str(data.get("reasoning", "")),
-            metadata={"matcher": "llm_based"},
+            metadata=_matcher_metadata("llm_based"),
         )
 
 
@@ -497,7 +1048,8 @@ class HybridMatcher(RelevanceMatcher):
     def __init__(
         self,
         matchers: Optional[list] = None,
-        weights: Optional[dict] = None
+        weights: Optional[dict] = None,
+        early_reject_threshold: Optional[float] = None,
     ):
         """
         Initialize hybrid matcher.
@@ -505,9 +1057,13 @@ class HybridMatcher(RelevanceMatcher):
         Args:
             matchers: List of RelevanceMatcher instances to combine
             weights: Weights keyed by matcher.get_name(). Defaults to equal weights.
+            early_reject_threshold: If set, expensive matchers (e.g. the LLM) only
+                score jobs whose weighted overall score from the cheap matchers
+                reaches this value; the rest are combined from cheap scores alone
         """
         self.matchers: List[RelevanceMatcher] = matchers or []
         self.weights: Dict[str, float] = weights or {}
+        self.early_reject_threshold = early_reject_threshold
 
     def match(self, profile: UserProfile, job: Job) -> RelevanceScore:
         """
@@ -516,29 +1072,153 @@ class HybridMatcher(RelevanceMatcher):
         if not self.matchers:
             raise ValueError("HybridMatcher has no matchers. Call add_matcher() first.")
 
-        results: List[tuple] = []  # (weight, RelevanceScore)
-
-        for matcher in self.matchers:
+        def run(matcher: RelevanceMatcher, batch: List[Job]) -> List[Optional[RelevanceScore]]:
+            if not batch:
+                return []
             try:
-                score = matcher.match(profile, job)
-                weight = self.weights.get(matcher.get_name(), 1.0)
-                results.append((weight, score))
-                logger.debug(
-                    f"  {matcher.get_name()}: overall={score.overall_score:.3f} "
-                    f"(weight={weight})"
-                )
+                return [matcher.match(profile, job)]
             except Exception as e:
                 logger.warning(f"Matcher {matcher.get_name()} failed: {e}")
+                return [None]
+
+        results: List[tuple] = []  # (weight, RelevanceScore)
+
+        for matcher, (score,) in zip(self.matchers, self._run_matchers(run, [job])):
+            if score is None:
                 continue
+            weight = self.weights.get(matcher.get_name(), 1.0)
+            results.append((weight, score))
+            logger.debug(
+                f"  {matcher.get_name()}: overall={score.overall_score:.3f} "
+                f"(weight={weight})"
+            )
 
         if not results:
             raise RuntimeError("All matchers failed")
 
         return self._combine_scores(results)
 
+    def match_many(self, profile: UserProfile, jobs: List[Job]) -> List[RelevanceScore]:
+        """
+        Score several jobs, letting each child matcher batch its own work.
+
+        A job that every matcher failed on gets a zero score saying so, so the
+        rest of the batch (and the LLM calls already made for it) is kept.
+        """
+        if not self.matchers:
+            raise ValueError("HybridMatcher has no matchers. Call add_matcher() first.")
+
+        def run(matcher: RelevanceMatcher, batch: List[Job]) -> List[Optional[RelevanceScore]]:
+            if not batch:
+                return []
+            try:
+                return matcher.match_many(profile, batch)
+            except Exception:
+                # Fall back to one job at a time so only the failing jobs lose it
+                child_scores = []
+                for job in batch:
+                    try:
+                        child_scores.append(matcher.match(profile, job))
+                    except Exception as e:
+                        logger.warning(f"Matcher {matcher.get_name()} failed: {e}")
+                        child_scores.append(None)
+                return child_scores
+
+        per_job: List[List[tuple]] = [[] for _ in jobs]  # (weight, RelevanceScore)
+        # Weighted sums for the whole batch at once: (N, 6) over SCORE_FIELDS
+        totals = np.zeros(len(jobs))
+        sums = np.zeros((len(jobs), len(SCORE_FIELDS)))
+
+        for matcher, child_scores in zip(self.matchers, self._run_matchers(run, jobs)):
+            weight = self.weights.get(matcher.get_name(), 1.0)
+            scored = [i for i, score in enumerate(child_scores) if score is not None]
+            if not scored:
+                continue
+            for i in scored:
+                per_job[i].append((weight, child_scores[i]))
+            idx = np.array(scored, dtype=np.intp)
+            totals[idx] += weight
+            sums[idx] += weight * score_matrix([child_scores[i] for i in scored])
+
+        for job, results in zip(jobs, per_job):
+            if not results:
+                logger.warning(f"All matchers failed for '{job.title}' at {job.company}")
+
+        totals[totals == 0] = 1.0
+        averages = (sums / totals[:, None]).tolist()
+
+        return [
+            self._build_combined(results, [round(v, 3) for v in avg])
+            if results else _failed_score("all matchers failed")
+            for results, avg in zip(per_job, averages)
+        ]
+
     def get_name(self) -> str:
         return "hybrid"
 
+    def _run_matchers(self, run, jobs: List[Job]) -> list:
+        """
+        Return [run(m, jobs) for m in self.matchers], in matcher order.
+
+        run(matcher, batch) returns one score (or None) per job in batch.
+        Expensive children are started on worker threads first so their
+        network I/O overlaps the local matchers, which run inline. With an
+        early_reject_threshold they run after the local ones instead, on the
+        jobs that survive.
+        """
+        if self.early_reject_threshold is not None:
+            return self._run_tiered(run, jobs)
+
+        remote = [i for i, m in enumerate(self.matchers) if m.expensive]
+        if not remote or len(self.matchers) < 2:
+            return [run(m, jobs) for m in self.matchers]
+
+        with ThreadPoolExecutor(max_workers=len(remote)) as executor:
+            futures = {i: executor.submit(run, self.matchers[i], jobs) for i in remote}
+            outputs = [
+                None if i in futures else run(m, jobs) for i, m in enumerate(self.matchers)
+            ]
+            for i, future in futures.items():
+                outputs[i] = future.result()
+        return outputs
+
+    def _run_tiered(self, run, jobs: List[Job]) -> list:
+        """_run_matchers() with expensive children skipped for rejected jobs."""
+        outputs: List[Optional[list]] = [
+            None if m.expensive else run(m, jobs) for m in self.matchers
+        ]
+
+        # Provisional overall score per job from the cheap children
+        totals = [0.0] * len(jobs)
+        sums = [0.0] * len(jobs)
+        for matcher, child_scores in zip(self.matchers, outputs):
+            if child_scores is None:
+                continue
+            weight = self.weights.get(matcher.get_name(), 1.0)
+            for i, score in enumerate(child_scores):
+                if score is not None:
+                    totals[i] += weight
+                    sums[i] += weight * score.overall_score
+        keep = [
+            i for i in range(len(jobs))
+            if totals[i] <= 0 or sums[i] / totals[i] >= self.early_reject_threshold
+        ]
+        if len(keep) < len(jobs):
+            (logger.info if len(jobs) > 1 else logger.debug)(
+                f"Early reject: {len(jobs) - len(keep)} of {len(jobs)} jobs scored "
+                f"below {self.early_reject_threshold}, skipping expensive matchers"
+            )
+
+        kept_jobs = [jobs[i] for i in keep]
+        for m_idx, matcher in enumerate(self.matchers):
+            if outputs[m_idx] is not None:
+                continue
+            child_scores: List[Optional[RelevanceScore]] = [None] * len(jobs)
+            for i, score in zip(keep, run(matcher, kept_jobs)):
+                child_scores[i] = score
+            outputs[m_idx] = child_scores
+        return outputs
+
     def add_matcher(self, matcher: RelevanceMatcher, weight: float = 1.0) -> None:
         """Add a matcher to the hybrid matcher."""
         self.matchers.append(matcher)
@@ -547,50 +1227,55 @@ class HybridMatcher(RelevanceMatcher):
     @staticmethod
     def _combine_scores(results: List[tuple]) -> RelevanceScore:
         """Combine multiple weighted RelevanceScores into one."""
-        total_weight = sum(w for w, _ in results)
+        total_weight = 0
+        overall = skills = experience = location = salary = level = 0.0
+        for w, score in results:
+            total_weight += w
+            overall += w * score.overall_score
+            skills += w * score.skills_score
+            experience += w * score.experience_score
+            location += w * score.location_score
+            salary += w * score.salary_score
+            level += w * score.level_score
+
         if total_weight == 0:
             total_weight = 1.0
 
-        def _wavg(attr: str) -> float:
-            val = sum(w * getattr(s, attr) for w, s in results) / total_weight
-            return round(val, 3)
-
-        # Merge skills lists (deduplicated, preserving order)
-        matching = []
-        seen_m = set()
-        missing = []
-        seen_x = set()
-        reasoning_parts = []
-
-        for _, score in results:
-            for s in score.matching_skills:
-                if s not in seen_m:
-                    matching.append(s)
-                    seen_m.add(s)
-            for s in score.missing_skills:
-                if s not in seen_x:
-                    missing.append(s)
-                    seen_x.add(s)
-            if score.reasoning:
-                reasoning_parts.append(score.reasoning)
-
-        # Remove from missing anything that appeared in matching
-        missing = [s for s in missing if s not in seen_m]
+        return HybridMatcher._build_combined(results, [
+            round(overall / total_weight, 3),
+            round(skills / total_weight, 3),
+            round(experience / total_weight, 3),
+            round(location / total_weight, 3),
+            round(salary / total_weight, 3),
+            round(level / total_weight, 3),
+        ])
+
+    @staticmethod
+    def _build_combined(results: List[tuple], averages: List[float]) -> RelevanceScore:
+        """
+        RelevanceScore from weighted averages (in SCORE_FIELDS order) and the
+        children's merged skill lists and reasoning.
+        """
+        # Merge skills lists (deduplicated, preserving order); dict keys double
+        # as the seen-set for the matching list
+        matching = dict.fromkeys(chain.from_iterable(s.matching_skills for _, s in results))
+        # Drop from missing anything that appeared in matching
+        missing = [
+            skill
+            for skill in dict.fromkeys(chain.from_iterable(s.missing_skills for _, s in results))
+            if skill not in matching
+        ]
+        reasoning = " | ".join(s.reasoning for _, s in results if s.reasoning)
 
         return RelevanceScore(
-            overall_score=_wavg("overall_score"),
-            skills_score=_wavg("skills_score"),
-            experience_score=_wavg("experience_score"),
-            location_score=_wavg("location_score"),
-            salary_score=_wavg("salary_score"),
-            level_score=_wavg("level_score"),
-            matching_skills=matching,
+            *averages,
+            matching_skills=list(matching),
             missing_skills=missing,
-            reasoning=" | ".join(reasoning_parts),
+            reasoning=reasoning,
             metadata={
                 "matcher": "hybrid",
                 "sub_matchers": [
-                    score.metadata.get("matcher", "unknown")
+                    score.get_meta("matcher", "unknown")
                     for _, score in results
                 ],
             },
@@ -651,21 +1336,26 @@ class RelevanceScorer:
         Returns:
             List of RelevanceScores (one per job)
         """
+        if len(jobs) > 1:
+            try:
+                scores = self.matcher.match_many(profile, jobs)
+                for job, score in zip(jobs, scores):
+                    logger.info(
+                        f"Scored '{job.title}' at {job.company}: "
+                        f"overall={score.overall_score:.3f}"
+                    )
+                return scores
+            except (ConnectionError, RuntimeError, ValueError) as e:
+                # Retry job by job so one bad posting doesn't sink the batch
+                logger.warning(f"Batch scoring failed, scoring individually: {e}")
+
         scores = []
         for job in jobs:
             try:
                 scores.append(self.score_job(profile, job))
             except Exception as e:
                 logger.warning(f"Skipping job '{job.title}': {e}")
-                scores.append(RelevanceScore(
-                    overall_score=0.0,
-                    skills_score=0.0,
-                    experience_score=0.0,
-                    location_score=0.0,
-                    salary_score=0.0,
-                    level_score=0.0,
-                    reasoning=f"Scoring failed: {e}",
-                ))
+                scores.append(_failed_score(e))
         return scores
 
     def set_matcher(self, matcher: RelevanceMatcher) -> None:
@@ -0,0 +1,24 @@
+"""
+Shared pytest fixtures.
+"""
+
+import pytest
+
+from config.settings import LLMConfig
+from llm.ollama_provider import OllamaProvider
+
+
+@pytest.fixture(scope="module")
+def _shared_ollama_provider():
+    """One default-config OllamaProvider per test module."""
+    provider = OllamaProvider(LLMConfig(provider="ollama", model="llama3"))
+    yield provider
+    provider.session.close()
+
+
+@pytest.fixture
+def ollama_provider(_shared_ollama_provider):
+    """The module's OllamaProvider with its response and tags caches emptied."""
+    _shared_ollama_provider.clear_cache()
+    _shared_ollama_provider._tags_cache = None
+    return _shared_ollama_provider
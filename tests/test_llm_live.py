@@ -10,122 +10,184 @@ Usage:
 
     OR
 
-    pytest tests/test_llm_live.py -v -s
+    pytest tests/test_llm_live.py -m live -v -s
 
 Note: This connects to actual Ollama service (not mocked).
+
+When run as a script, the four generation tests are sent concurrently. Start
+Ollama with parallel slots to overlap them (e.g. OLLAMA_NUM_PARALLEL=4 ollama
+serve); otherwise the server queues them and they take as long as before.
+
+Set LLM_TEST_CACHE=1 to replay generations from tests/_llm_cache/: the first
+run writes each response there and later runs read it back instead of calling
+the model. Health and credential checks always go to the service.
+
+Per-test prompts and responses are printed only with TEST_VERBOSE=1 (otherwise
+they are logged at DEBUG); main()'s summary and errors are always printed.
 """
 
+import asyncio
+import logging
+import os
+from pathlib import Path
+
+import pytest
+
 from llm.ollama_provider import OllamaProvider
+from llm.ollama_async_provider import AsyncOllamaProvider
 from config.settings import LLMConfig
 
+# Deselected by default (see pytest.ini); kept on one xdist worker so a
+# parallel run does not flood a single `ollama serve`
+pytestmark = [pytest.mark.live, pytest.mark.xdist_group("ollama")]
 
-def test_health_check():
-    """Test health check with live Ollama service."""
-    print("\n" + "="*80)
-    print("TEST 1: Health Check")
-    print("="*80)
+CACHE_DIR = Path(__file__).parent / "_llm_cache"
 
-    config = LLMConfig(
-        provider="ollama",
-        model="llama3"
-    )
+VERBOSE = os.getenv("TEST_VERBOSE") == "1"
+BANNER = "=" * 80
+
+logger = logging.getLogger(__name__)
+
+
+def _say(*args) -> None:
+    """Print test progress with TEST_VERBOSE=1; log it at DEBUG otherwise."""
+    if VERBOSE:
+        print(*args)
+    else:
+        logger.debug(" ".join(str(a) for a in args))
+
+
+class CachingOllamaProvider(OllamaProvider):
+    """
+    OllamaProvider that keeps generate() responses on disk between runs.
+
+    Files are named by the provider's own payload hash (model, prompt with
+    system prompt, temperature, max_tokens and format), so any change to a
+    test's request is a miss and goes to the model.
+    """
+
+    def generate(self, prompt, system_prompt=None, **kwargs):
+        if kwargs.get("no_cache"):
+            return super().generate(prompt, system_prompt=system_prompt, **kwargs)
+        key = self._cache_key(self._build_payload(prompt, system_prompt, kwargs))
+        path = CACHE_DIR / f"{key}.txt"
+        if path.exists():
+            return path.read_text(encoding="utf-8")
+
+        text = super().generate(prompt, system_prompt=system_prompt, **kwargs)
+        CACHE_DIR.mkdir(exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+        return text
 
-    provider = OllamaProvider(config)
+
+def _make_provider() -> OllamaProvider:
+    """One provider (and keep-alive session) for every test; each test passes
+    its own temperature/max_tokens per call."""
+    config = LLMConfig(provider="ollama", model="llama3")
+    if os.getenv("LLM_TEST_CACHE") == "1":
+        return CachingOllamaProvider(config)
+    return OllamaProvider(config)
+
+
+def _warm_up(provider: OllamaProvider) -> None:
+    """
+    Load the model with a one-token generation so the tests time decoding,
+    not the model load, and keep it resident for the rest of the run.
+
+    Errors are ignored here; the health check reports a missing service or model.
+    """
+    try:
+        provider.generate("ping", max_tokens=1, keep_alive="30m", no_cache=True)
+    except (ConnectionError, RuntimeError):
+        pass
+
+
+@pytest.fixture(scope="module")
+def provider():
+    """Shared, warmed OllamaProvider, so requests after the first reuse its connection."""
+    shared = _make_provider()
+    _warm_up(shared)
+    yield shared
+    shared.session.close()
+
+
+def test_health_check(provider):
+    """Test health check with live Ollama service."""
+    _say("\n" + BANNER)
+    _say("TEST 1: Health Check")
+    _say(BANNER)
+
+    config = provider.config
     health = provider.health_check()
 
-    print(f"\n✓ Health Status:")
-    print(f"  Service Running:    {health['service_running']}")
-    print(f"  Model Available:    {health['model_available']}")
-    print(f"  Model Name:         {health['model_name']}")
-    print(f"  Available Models:   {health['available_models']}")
-    print(f"  Error:              {health['error']}")
+    _say(f"\n✓ Health Status:")
+    _say(f"  Service Running:    {health['service_running']}")
+    _say(f"  Model Available:    {health['model_available']}")
+    _say(f"  Model Name:         {health['model_name']}")
+    _say(f"  Available Models:   {health['available_models']}")
+    _say(f"  Error:              {health['error']}")
 
     assert health['service_running'], "Ollama service not running. Start with: ollama serve"
     assert health['model_available'], f"Model {config.model} not found. Pull with: ollama pull {config.model}"
 
-    print("\n✅ Health check passed!")
+    _say("\n✅ Health check passed!")
     return health
 
 
-def test_simple_generation():
+def test_simple_generation(provider):
     """Test simple text generation."""
-    print("\n" + "="*80)
-    print("TEST 2: Simple Generation")
-    print("="*80)
-
-    config = LLMConfig(
-        provider="ollama",
-        model="llama3",
-        temperature=0.7,
-        max_tokens=256
-    )
-
-    provider = OllamaProvider(config)
+    _say("\n" + BANNER)
+    _say("TEST 2: Simple Generation")
+    _say(BANNER)
 
     prompt = "List 5 backend developer skills"
-    print(f"\n📝 Prompt: {prompt}")
-    print("\n⏳ Generating... (this may take a few seconds)")
+    _say(f"\n📝 Prompt: {prompt}")
+    _say("\n⏳ Generating... (this may take a few seconds)")
 
-    response = provider.generate(prompt)
+    response = provider.generate(prompt, temperature=0.7, max_tokens=256)
 
-    print(f"\n✓ Response:\n{response}")
+    _say(f"\n✓ Response:\n{response}")
 
     assert response, "Response should not be empty"
     assert len(response) > 20, "Response should be substantial"
 
-    print("\n✅ Simple generation passed!")
+    _say("\n✅ Simple generation passed!")
     return response
 
 
-def test_generation_with_system_prompt():
+def test_generation_with_system_prompt(provider):
     """Test generation with system prompt."""
-    print("\n" + "="*80)
-    print("TEST 3: Generation with System Prompt")
-    print("="*80)
-
-    config = LLMConfig(
-        provider="ollama",
-        model="llama3",
-        temperature=0.5,
-        max_tokens=200
-    )
-
-    provider = OllamaProvider(config)
+    _say("\n" + BANNER)
+    _say("TEST 3: Generation with System Prompt")
+    _say(BANNER)
 
     system_prompt = "You are a hiring manager at a top tech company. Be concise and professional."
     user_prompt = "What are the 3 most important skills for a Python developer?"
 
-    print(f"\n👤 System Prompt: {system_prompt}")
-    print(f"📝 User Prompt: {user_prompt}")
-    print("\n⏳ Generating...")
+    _say(f"\n👤 System Prompt: {system_prompt}")
+    _say(f"📝 User Prompt: {user_prompt}")
+    _say("\n⏳ Generating...")
 
     response = provider.generate(
         user_prompt,
-        system_prompt=system_prompt
+        system_prompt=system_prompt,
+        temperature=0.5,
+        max_tokens=200
     )
 
-    print(f"\n✓ Response:\n{response}")
+    _say(f"\n✓ Response:\n{response}")
 
     assert response, "Response should not be empty"
 
-    print("\n✅ System prompt generation passed!")
+    _say("\n✅ System prompt generation passed!")
     return response
 
 
-def test_structured_output():
+def test_structured_output(provider):
     """Test structured JSON output."""
-    print("\n" + "="*80)
-    print("TEST 4: Structured Output (JSON)")
-    print("="*80)
-
-    config = LLMConfig(
-        provider="ollama",
-        model="llama3",
-        temperature=0.2,  # Lower for more consistent JSON
-        max_tokens=256
-    )
-
-    provider = OllamaProvider(config)
+    _say("\n" + BANNER)
+    _say("TEST 4: Structured Output (JSON)")
+    _say(BANNER)
 
     schema = {
         "skills": "list of 3 backend skills",
@@ -139,73 +201,58 @@ def test_structured_output():
     Generate a JSON response with skills, importance level, and minimum experience.
     """
 
-    print(f"\n📋 Schema: {schema}")
-    print(f"📝 Prompt: {prompt.strip()}")
-    print("\n⏳ Generating JSON... (this may take longer)")
+    _say(f"\n📋 Schema: {schema}")
+    _say(f"📝 Prompt: {prompt.strip()}")
+    _say("\n⏳ Generating JSON... (this may take longer)")
 
     result = provider.generate_with_structured_output(
         prompt,
-        output_schema=schema
+        output_schema=schema,
+        temperature=0.2,  # Lower for more consistent JSON
+        max_tokens=256
     )
 
-    print(f"\n✓ Structured Output:")
-    print(f"  Skills:             {result.get('skills', 'N/A')}")
-    print(f"  Importance:         {result.get('importance', 'N/A')}")
-    print(f"  Experience Years:   {result.get('experience_years', 'N/A')}")
+    _say(f"\n✓ Structured Output:")
+    _say(f"  Skills:             {result.get('skills', 'N/A')}")
+    _say(f"  Importance:         {result.get('importance', 'N/A')}")
+    _say(f"  Experience Years:   {result.get('experience_years', 'N/A')}")
 
     assert isinstance(result, dict), "Result should be a dictionary"
     assert result.get('skills'), "Response should have skills"
 
-    print("\n✅ Structured output passed!")
+    _say("\n✅ Structured output passed!")
     return result
 
 
-def test_validate_credentials():
+def test_validate_credentials(provider):
     """Test credential validation."""
-    print("\n" + "="*80)
-    print("TEST 5: Validate Credentials")
-    print("="*80)
+    _say("\n" + BANNER)
+    _say("TEST 5: Validate Credentials")
+    _say(BANNER)
 
-    config = LLMConfig(
-        provider="ollama",
-        model="llama3"
-    )
-
-    provider = OllamaProvider(config)
-
-    print("\n⏳ Validating credentials...")
+    _say("\n⏳ Validating credentials...")
     is_valid = provider.validate_credentials()
 
-    print(f"\n✓ Validation Result: {is_valid}")
+    _say(f"\n✓ Validation Result: {is_valid}")
 
     assert is_valid, "Credentials should be valid"
 
-    print("\n✅ Credential validation passed!")
+    _say("\n✅ Credential validation passed!")
     return is_valid
 
 
-def test_custom_parameters():
+def test_custom_parameters(provider):
     """Test generation with custom parameters."""
-    print("\n" + "="*80)
-    print("TEST 6: Custom Parameters")
-    print("="*80)
-
-    config = LLMConfig(
-        provider="ollama",
-        model="llama3",
-        temperature=0.7,
-        max_tokens=512,
-        timeout=30
-    )
-
-    provider = OllamaProvider(config)
+    _say("\n" + BANNER)
+    _say("TEST 6: Custom Parameters")
+    _say(BANNER)
 
     # Override parameters for this request
-    print("\n📝 Prompt: Generate a job description for a Python Developer")
-    print("⚙️ Custom Parameters:")
-    print("   temperature: 0.9 (more creative)")
-    print("   max_tokens: 256")
-    print("\n⏳ Generating...")
+    _say("\n📝 Prompt: Generate a job description for a Python Developer")
+    _say("⚙️ Custom Parameters:")
+    _say("   temperature: 0.9 (more creative)")
+    _say("   max_tokens: 256")
+    _say("\n⏳ Generating...")
 
     response = provider.generate(
         "Generate a job description for a Python Developer",
@@ -213,15 +260,55 @@ def test_custom_parameters():
         max_tokens=256
     )
 
-    print(f"\n✓ Response:\n{response}")
+    _say(f"\n✓ Response:\n{response}")
 
     assert response, "Response should not be empty"
     assert len(response) > 0, "Response should have content"
 
-    print("\n✅ Custom parameters test passed!")
+    _say("\n✅ Custom parameters test passed!")
     return response
 
 
+def test_async_generation(provider):
+    """Test concurrent generation over one persistent AsyncClient."""
+    _say("\n" + BANNER)
+    _say("TEST 7: Async Concurrent Generation")
+    _say(BANNER)
+
+    prompts = [
+        "Name one backend developer skill",
+        "Name one frontend developer skill",
+        "Name one DevOps skill",
+    ]
+    _say(f"\n📝 Prompts: {prompts}")
+    _say("\n⏳ Generating concurrently on one event loop...")
+
+    # Same settings as the shared provider, but async: one loop, one pooled client
+    async_provider = AsyncOllamaProvider(provider.config)
+
+    async def generate_all():
+        try:
+            return await async_provider.agenerate_many(prompts, temperature=0.7, max_tokens=64)
+        finally:
+            await async_provider.aclose()
+
+    responses = asyncio.run(generate_all())
+
+    for prompt, response in zip(prompts, responses):
+        _say(f"\n✓ {prompt}:\n{response}")
+
+    assert len(responses) == len(prompts), "Expected one response per prompt"
+    assert all(responses), "Responses should not be empty"
+
+    _say("\n✅ Async generation test passed!")
+    return responses
+
+
+async def _run_concurrently(provider, *tests):
+    """Run blocking test functions on worker threads; the first failure is raised."""
+    return await asyncio.gather(*(asyncio.to_thread(test, provider) for test in tests))
+
+
 def main():
     """Run all live tests."""
     print("\n")
@@ -235,35 +322,35 @@ def main():
     print("  1. Ollama service running:  ollama serve")
     print("  2. llama3 model pulled:     ollama pull llama3")
 
+    provider = _make_provider()
     try:
-        # Test 1: Health check
-        test_health_check()
-
-        # Test 2: Simple generation
-        test_simple_generation()
-
-        # Test 3: System prompt
-        test_generation_with_system_prompt()
-
-        # Test 4: Structured output
-        test_structured_output()
-
-        # Test 5: Credential validation
-        test_validate_credentials()
-
-        # Test 6: Custom parameters
-        test_custom_parameters()
+        # Tests 1 and 5: service checks, before any generation
+        test_health_check(provider)
+        test_validate_credentials(provider)
+        _warm_up(provider)
+
+        # Tests 2, 3, 4 and 6: generations, run concurrently
+        asyncio.run(_run_concurrently(
+            provider,
+            test_simple_generation,
+            test_generation_with_system_prompt,
+            test_structured_output,
+            test_custom_parameters,
+        ))
+
+        # Test 7: async provider, on its own event loop and client
+        test_async_generation(provider)
 
         # Summary
-        print("\n" + "="*80)
+        print("\n" + BANNER)
         print("✅ ALL TESTS PASSED!")
-        print("="*80)
+        print(BANNER)
         print("\n🎉 OllamaProvider is working correctly with live Ollama service!")
 
     except ConnectionError as e:
-        print("\n" + "="*80)
+        print("\n" + BANNER)
         print("❌ CONNECTION ERROR")
-        print("="*80)
+        print(BANNER)
         print(f"\n{e}")
         print("\n⚠️  Make sure to:")
         print("   1. Start Ollama:  ollama serve")
@@ -271,9 +358,9 @@ def main():
         return False
 
     except RuntimeError as e:
-        print("\n" + "="*80)
+        print("\n" + BANNER)
         print("❌ RUNTIME ERROR")
-        print("="*80)
+        print(BANNER)
         print(f"\n{e}")
         print("\n⚠️  This might indicate:")
         print("   • Ollama service is slow")
@@ -282,16 +369,16 @@ def main():
         return False
 
     except AssertionError as e:
-        print("\n" + "="*80)
+        print("\n" + BANNER)
         print("❌ ASSERTION FAILED")
-        print("="*80)
+        print(BANNER)
         print(f"\n{e}")
         return False
 
     except Exception as e:
-        print("\n" + "="*80)
+        print("\n" + BANNER)
         print("❌ UNEXPECTED ERROR")
-        print("="*80)
+        print(BANNER)
         print(f"\n{type(e).__name__}: {e}")
         import traceback
         traceback.print_exc()
@@ -0,0 +1,99 @@
+"""
+Unit tests for AsyncOllamaProvider.
+
+Tests cover:
+- Concurrent generation order and OLLAMA_NUM_PARALLEL limit
+- Structured output batches with partial failures
+- Error mapping
+"""
+
+import asyncio
+import json
+import pytest
+import httpx
+
+from config.settings import LLMConfig
+from llm.ollama_async_provider import AsyncOllamaProvider
+
+
+def _provider_with_handler(handler) -> AsyncOllamaProvider:
+    """Build a provider whose async client is served by handler."""
+    provider = AsyncOllamaProvider(LLMConfig(provider="ollama", model="llama3"))
+    provider._aclient = httpx.AsyncClient(
+        base_url=provider.base_url,
+        transport=httpx.MockTransport(handler),
+    )
+    return provider
+
+
+class TestAgenerate:
+    """Tests for agenerate() and agenerate_many()."""
+
+    def test_agenerate_many_preserves_order(self):
+        """Test that responses come back in prompt order."""
+        def handler(request):
+            prompt = json.loads(request.content)["prompt"]
+            return httpx.Response(200, json={"response": f"  echo {prompt}  "})
+
+        provider = _provider_with_handler(handler)
+        results = asyncio.run(provider.agenerate_many(["a", "b", "c"]))
+
+        assert results == ["echo a", "echo b", "echo c"]
+
+    def test_agenerate_many_respects_num_parallel(self, monkeypatch):
+        """Test that no more than OLLAMA_NUM_PARALLEL requests are in flight."""
+        monkeypatch.setenv("OLLAMA_NUM_PARALLEL", "2")
+        in_flight = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json={"response": "ok"})
+
+        provider = _provider_with_handler(handler)
+        results = asyncio.run(provider.agenerate_many([f"p{i}" for i in range(6)]))
+
+        assert results == ["ok"] * 6
+        assert peak == 2
+
+    def test_agenerate_empty_prompt(self):
+        """Test that empty prompts are rejected before any request."""
+        provider = _provider_with_handler(lambda request: httpx.Response(500))
+
+        with pytest.raises(ValueError, match="Prompt cannot be empty"):
+            asyncio.run(provider.agenerate("   "))
+
+    def test_agenerate_connection_error(self):
+        """Test that connection failures surface as ConnectionError."""
+        def handler(request):
+            raise httpx.ConnectError("refused", request=request)
+
+        provider = _provider_with_handler(handler)
+
+        with pytest.raises(ConnectionError, match="Ollama service not running"):
+            asyncio.run(provider.agenerate("Test prompt"))
+
+
+class TestStructuredBatch:
+    """Tests for agenerate_many_with_structured_output()."""
+
+    def test_failed_prompt_does_not_sink_batch(self):
+        """Test that one unparseable response is returned as its exception."""
+        def handler(request):
+            prompt = json.loads(request.content)["prompt"]
+            if prompt.startswith("bad"):
+                return httpx.Response(200, json={"response": "not json"})
+            return httpx.Response(200, json={"response": '{"score": 0.9}'})
+
+        provider = _provider_with_handler(handler)
+        results = asyncio.run(provider.agenerate_many_with_structured_output(
+            ["good", "bad", "good"], {"score": "float"}
+        ))
+
+        assert results[0] == {"score": 0.9}
+        assert isinstance(results[1], Exception)
+        assert results[2] == {"score": 0.9}
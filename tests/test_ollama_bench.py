@@ -0,0 +1,52 @@
+"""
+Microbenchmarks for the client-side OllamaProvider hot paths.
+
+Marked `benchmark` and deselected by default (see pytest.ini). Requires
+pytest-benchmark:
+
+    pytest tests/test_ollama_bench.py -m benchmark
+"""
+
+import json
+import pytest
+from unittest.mock import Mock, patch
+
+from llm.ollama_provider import OllamaProvider
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.benchmark
+
+
+def _canned_response() -> Mock:
+    """A /api/generate response as the mocked session returns it."""
+    mock_response = Mock()
+    mock_response.content = json.dumps({"response": "Hello, world!"}).encode()
+    mock_response.raise_for_status.return_value = None
+    return mock_response
+
+
+def test_bench_extract_json_direct(benchmark):
+    """Constrained (format="json") output that parses directly."""
+    result = benchmark(
+        OllamaProvider._extract_json_from_response, '{"a": 1, "b": [1, 2, 3]}'
+    )
+    assert result == {"a": 1, "b": [1, 2, 3]}
+
+
+def test_bench_extract_json_with_surrounding_text(benchmark):
+    """JSON embedded in prose, found by the bracket scan."""
+    result = benchmark(
+        OllamaProvider._extract_json_from_response, 'Here is: {"a": 1, "b": [1, 2, 3]} done'
+    )
+    assert result == {"a": 1, "b": [1, 2, 3]}
+
+
+@patch("llm.ollama_provider.requests.Session.post")
+def test_bench_generate_mocked(mock_post, benchmark, ollama_provider):
+    """A full uncached generate() call against a mocked session."""
+    mock_post.return_value = _canned_response()
+
+    result = benchmark(ollama_provider.generate, "Test prompt")
+
+    assert result == "Hello, world!"
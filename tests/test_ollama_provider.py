@@ -17,6 +17,10 @@ import requests
 from config.settings import LLMConfig
 from llm.ollama_provider import OllamaProvider
 
+# Configs shared by tests that need a fresh provider; nothing mutates them
+DETERMINISTIC_CONFIG = LLMConfig(provider="ollama", model="llama3", temperature=0.0)
+SAMPLED_CONFIG = LLMConfig(provider="ollama", model="llama3", temperature=0.7)
+
 
 class TestOllamaProviderInitialization:
     """Tests for OllamaProvider initialization."""
@@ -49,34 +53,28 @@ class TestGenerateMethod:
     """Tests for the generate() method."""
 
     @patch("llm.ollama_provider.requests.Session.post")
-    def test_generate_basic(self, mock_post):
+    def test_generate_basic(self, mock_post, ollama_provider):
         """Test basic text generation."""
         # Mock response
         mock_response = Mock()
-        mock_response.json.return_value = {"response": "Hello, world!"}
+        mock_response.content = json.dumps({"response": "Hello, world!"}).encode()
         mock_response.raise_for_status.return_value = None
         mock_post.return_value = mock_response
 
-        config = LLMConfig(provider="ollama", model="llama3")
-        provider = OllamaProvider(config)
-
-        result = provider.generate("What is AI?")
+        result = ollama_provider.generate("What is AI?")
 
         assert result == "Hello, world!"
         mock_post.assert_called_once()
 
     @patch("llm.ollama_provider.requests.Session.post")
-    def test_generate_with_system_prompt(self, mock_post):
+    def test_generate_with_system_prompt(self, mock_post, ollama_provider):
         """Test generation with system prompt."""
         mock_response = Mock()
-        mock_response.json.return_value = {"response": "I am an AI assistant."}
+        mock_response.content = json.dumps({"response": "I am an AI assistant."}).encode()
         mock_response.raise_for_status.return_value = None
         mock_post.return_value = mock_response
 
-        config = LLMConfig(provider="ollama", model="llama3")
-        provider = OllamaProvider(config)
-
-        result = provider.generate(
+        result = ollama_provider.generate(
             "What are you?",
             system_prompt="You are a helpful AI assistant."
         )
@@ -91,41 +89,50 @@ class TestGenerateMethod:
     def test_generate_with_custom_temperature(self, mock_post):
         """Test generation with custom temperature override."""
         mock_response = Mock()
-        mock_response.json.return_value = {"response": "Response"}
+        mock_response.content = json.dumps({"response": "Response"}).encode()
         mock_response.raise_for_status.return_value = None
         mock_post.return_value = mock_response
 
-        config = LLMConfig(provider="ollama", model="llama3", temperature=0.7)
-        provider = OllamaProvider(config)
+        provider = OllamaProvider(SAMPLED_CONFIG)
 
         provider.generate("Test prompt", temperature=0.3)
 
         # Verify custom temperature was used
         call_args = mock_post.call_args
         payload = call_args.kwargs["json"]
-        assert payload["temperature"] == 0.3
+        assert payload["options"]["temperature"] == 0.3
+        assert payload["options"]["num_predict"] == SAMPLED_CONFIG.max_tokens
+        assert "temperature" not in payload
 
-    def test_generate_empty_prompt_raises_error(self):
-        """Test that empty prompts raise ValueError."""
-        config = LLMConfig(provider="ollama", model="llama3")
-        provider = OllamaProvider(config)
+    @patch("llm.ollama_provider.requests.Session.post")
+    def test_generate_forwards_keep_alive(self, mock_post, ollama_provider):
+        """Test that keep_alive is sent only when given."""
+        mock_response = Mock()
+        mock_response.content = json.dumps({"response": "pong"}).encode()
+        mock_response.raise_for_status.return_value = None
+        mock_post.return_value = mock_response
+
+        ollama_provider.generate("ping", keep_alive="30m")
+        assert mock_post.call_args.kwargs["json"]["keep_alive"] == "30m"
 
+        ollama_provider.generate("ping")
+        assert "keep_alive" not in mock_post.call_args.kwargs["json"]
+
+    def test_generate_empty_prompt_raises_error(self, ollama_provider):
+        """Test that empty prompts raise ValueError."""
         with pytest.raises(ValueError, match="Prompt cannot be empty"):
-            provider.generate("")
+            ollama_provider.generate("")
 
         with pytest.raises(ValueError, match="Prompt cannot be empty"):
-            provider.generate("   ")
+            ollama_provider.generate("   ")
 
     @patch("llm.ollama_provider.requests.Session.post")
-    def test_generate_connection_error(self, mock_post):
+    def test_generate_connection_error(self, mock_post, ollama_provider):
         """Test ConnectionError when Ollama service is down."""
         mock_post.side_effect = requests.exceptions.ConnectionError("Connection refused")
 
-        config = LLMConfig(provider="ollama", model="llama3")
-        provider = OllamaProvider(config)
-
         with pytest.raises(ConnectionError, match="Ollama service not running"):
-            provider.generate("Test prompt")
+            ollama_provider.generate("Test prompt")
 
     @patch("llm.ollama_provider.requests.Session.post")
     def test_generate_timeout_error(self, mock_post):
@@ -139,50 +146,140 @@ class TestGenerateMethod:
             provider.generate("Test prompt")
 
     @patch("llm.ollama_provider.requests.Session.post")
-    def test_generate_empty_response(self, mock_post):
+    def test_generate_empty_response(self, mock_post, ollama_provider):
         """Test handling of empty model response."""
         mock_response = Mock()
-        mock_response.json.return_value = {"response": ""}
+        mock_response.content = json.dumps({"response": ""}).encode()
         mock_response.raise_for_status.return_value = None
         mock_post.return_value = mock_response
 
-        config = LLMConfig(provider="ollama", model="llama3")
-        provider = OllamaProvider(config)
-
         with pytest.raises(RuntimeError, match="empty response"):
-            provider.generate("Test prompt")
+            ollama_provider.generate("Test prompt")
 
     @patch("llm.ollama_provider.requests.Session.post")
-    def test_generate_invalid_json_response(self, mock_post):
+    def test_generate_invalid_json_response(self, mock_post, ollama_provider):
         """Test handling of invalid JSON in response."""
         mock_response = Mock()
-        mock_response.json.side_effect = json.JSONDecodeError("Invalid JSON", "", 0)
+        mock_response.content = b"not json"
         mock_post.return_value = mock_response
 
-        config = LLMConfig(provider="ollama", model="llama3")
-        provider = OllamaProvider(config)
-
         with pytest.raises(RuntimeError, match="Invalid response"):
-            provider.generate("Test prompt")
+            ollama_provider.generate("Test prompt")
+
+
+class TestResponseCache:
+    """Tests for the deterministic-prompt response cache."""
+
+    @staticmethod
+    def _mock_response(text):
+        mock_response = Mock()
+        mock_response.content = json.dumps({"response": text}).encode()
+        mock_response.raise_for_status.return_value = None
+        return mock_response
+
+    @patch("llm.ollama_provider.requests.Session.post")
+    def test_deterministic_calls_are_cached(self, mock_post):
+        """Test that identical temperature-0 calls hit Ollama once."""
+        mock_post.return_value = self._mock_response("Cached answer")
+
+        provider = OllamaProvider(DETERMINISTIC_CONFIG)
+
+        assert provider.generate("Same prompt") == "Cached answer"
+        assert provider.generate("Same prompt") == "Cached answer"
+        assert mock_post.call_count == 1
+
+        provider.generate("Other prompt")
+        assert mock_post.call_count == 2
+
+    @patch("llm.ollama_provider.requests.Session.post")
+    def test_sampled_calls_are_not_cached(self, mock_post):
+        """Test that calls with a non-zero temperature always reach Ollama."""
+        mock_post.return_value = self._mock_response("Fresh answer")
+
+        provider = OllamaProvider(SAMPLED_CONFIG)
+
+        provider.generate("Same prompt")
+        provider.generate("Same prompt")
+        assert mock_post.call_count == 2
+
+    @patch("llm.ollama_provider.requests.Session.post")
+    def test_no_cache_bypasses_cache(self, mock_post):
+        """Test that no_cache=True skips the cache lookup."""
+        mock_post.return_value = self._mock_response("Answer")
+
+        provider = OllamaProvider(DETERMINISTIC_CONFIG)
+
+        provider.generate("Same prompt")
+        provider.generate("Same prompt", no_cache=True)
+        assert mock_post.call_count == 2
+
+    @patch("llm.ollama_provider.time.monotonic")
+    @patch("llm.ollama_provider.requests.Session.post")
+    def test_expired_entries_are_refetched(self, mock_post, mock_monotonic):
+        """Test that entries older than the TTL are not served."""
+        mock_post.return_value = self._mock_response("Answer")
+        mock_monotonic.return_value = 1000.0
+
+        provider = OllamaProvider(DETERMINISTIC_CONFIG)
+
+        provider.generate("Same prompt")
+        mock_monotonic.return_value = 1000.0 + OllamaProvider.CACHE_TTL_SECONDS
+        provider.generate("Same prompt")
+        assert mock_post.call_count == 2
+
+
+class TestStreaming:
+    """Tests for streamed generation."""
+
+    @staticmethod
+    def _stream_response(deltas):
+        lines = [json.dumps({"response": d, "done": False}).encode() for d in deltas]
+        lines.append(json.dumps({"response": "", "done": True}).encode())
+        mock_response = MagicMock()
+        mock_response.__enter__.return_value = mock_response
+        mock_response.raise_for_status.return_value = None
+        mock_response.iter_lines.return_value = iter(lines)
+        return mock_response
+
+    @patch("llm.ollama_provider.requests.Session.post")
+    def test_generate_stream_joins_deltas(self, mock_post, ollama_provider):
+        """Test that stream=True returns the concatenated deltas."""
+        mock_post.return_value = self._stream_response(["Hello", ", ", "world! "])
+
+        result = ollama_provider.generate("Say hello", stream=True)
+
+        assert result == "Hello, world!"
+        assert mock_post.call_args.kwargs["json"]["stream"] is True
+        assert mock_post.call_args.kwargs["stream"] is True
+
+    @patch("llm.ollama_provider.requests.Session.post")
+    def test_structured_stream_stops_at_closing_brace(self, mock_post, ollama_provider):
+        """Test that structured streaming ignores text after the JSON object."""
+        mock_post.return_value = self._stream_response(
+            ['Here: {"skills": ["a", "}"]', ', "score": {"v": 1}}', " and {broken"]
+        )
+
+        result = ollama_provider.generate_with_structured_output(
+            "Rate", {"skills": "list", "score": "object"}, stream=True
+        )
+
+        assert result == {"skills": ["a", "}"], "score": {"v": 1}}
 
 
 class TestGenerateStructuredOutput:
     """Tests for generate_with_structured_output() method."""
 
     @patch("llm.ollama_provider.requests.Session.post")
-    def test_generate_structured_valid_json(self, mock_post):
+    def test_generate_structured_valid_json(self, mock_post, ollama_provider):
         """Test structured output generation with valid JSON."""
         mock_response = Mock()
         json_response = {"task": "analyze", "score": 0.9, "reasoning": "Good match"}
-        mock_response.json.return_value = {"response": json.dumps(json_response)}
+        mock_response.content = json.dumps({"response": json.dumps(json_response)}).encode()
         mock_response.raise_for_status.return_value = None
         mock_post.return_value = mock_response
 
-        config = LLMConfig(provider="ollama", model="llama3")
-        provider = OllamaProvider(config)
-
         schema = {"task": "string", "score": "float", "reasoning": "string"}
-        result = provider.generate_with_structured_output(
+        result = ollama_provider.generate_with_structured_output(
             "Analyze this job",
             output_schema=schema
         )
@@ -192,7 +289,7 @@ class TestGenerateStructuredOutput:
         assert result["reasoning"] == "Good match"
 
     @patch("llm.ollama_provider.requests.Session.post")
-    def test_generate_structured_json_with_extra_text(self, mock_post):
+    def test_generate_structured_json_with_extra_text(self, mock_post, ollama_provider):
         """Test extraction of JSON when model adds extra text."""
         mock_response = Mock()
         # Model output with extra text
@@ -201,15 +298,12 @@ class TestGenerateStructuredOutput:
             '{"task": "match", "score": 0.85}\n'
             'This is a good match.'
         )
-        mock_response.json.return_value = {"response": response_text}
+        mock_response.content = json.dumps({"response": response_text}).encode()
         mock_response.raise_for_status.return_value = None
         mock_post.return_value = mock_response
 
-        config = LLMConfig(provider="ollama", model="llama3")
-        provider = OllamaProvider(config)
-
         schema = {"task": "string", "score": "float"}
-        result = provider.generate_with_structured_output(
+        result = ollama_provider.generate_with_structured_output(
             "Analyze",
             output_schema=schema
         )
@@ -217,23 +311,34 @@ class TestGenerateStructuredOutput:
         assert result["task"] == "match"
         assert result["score"] == 0.85
 
-    def test_generate_structured_invalid_schema(self):
-        """Test that invalid schema raises error."""
-        config = LLMConfig(provider="ollama", model="llama3")
-        provider = OllamaProvider(config)
+    @patch("llm.ollama_provider.requests.Session.post")
+    def test_generate_structured_requests_json_format(self, mock_post, ollama_provider):
+        """Test that structured calls ask Ollama for constrained JSON output."""
+        mock_response = Mock()
+        mock_response.content = json.dumps({"response": '{"score": 0.5}'}).encode()
+        mock_response.raise_for_status.return_value = None
+        mock_post.return_value = mock_response
+
+        ollama_provider.generate_with_structured_output("Rate", output_schema={"score": "float"})
+
+        payload = mock_post.call_args.kwargs["json"]
+        assert payload["format"] == "json"
+        assert '{"score":"float"}' in payload["prompt"]
 
+    def test_generate_structured_invalid_schema(self, ollama_provider):
+        """Test that invalid schema raises error."""
         with pytest.raises(ValueError, match="output_schema must be"):
-            provider.generate_with_structured_output("Prompt", output_schema={})
+            ollama_provider.generate_with_structured_output("Prompt", output_schema={})
 
         with pytest.raises(ValueError, match="output_schema must be"):
-            provider.generate_with_structured_output("Prompt", output_schema=None)
+            ollama_provider.generate_with_structured_output("Prompt", output_schema=None)
 
 
 class TestValidateCredentials:
     """Tests for validate_credentials() method."""
 
     @patch("llm.ollama_provider.requests.Session.get")
-    def test_validate_credentials_success(self, mock_get):
+    def test_validate_credentials_success(self, mock_get, ollama_provider):
         """Test successful credential validation."""
         mock_response = Mock()
         mock_response.json.return_value = {
@@ -245,13 +350,10 @@ class TestValidateCredentials:
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
-        config = LLMConfig(provider="ollama", model="llama3")
-        provider = OllamaProvider(config)
-
-        assert provider.validate_credentials() is True
+        assert ollama_provider.validate_credentials() is True
 
     @patch("llm.ollama_provider.requests.Session.get")
-    def test_validate_credentials_model_not_found(self, mock_get):
+    def test_validate_credentials_model_not_found(self, mock_get, ollama_provider):
         """Test validation when model is not available."""
         mock_response = Mock()
         mock_response.json.return_value = {
@@ -262,37 +364,28 @@ class TestValidateCredentials:
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
-        config = LLMConfig(provider="ollama", model="llama3")
-        provider = OllamaProvider(config)
-
-        assert provider.validate_credentials() is False
+        assert ollama_provider.validate_credentials() is False
 
     @patch("llm.ollama_provider.requests.Session.get")
-    def test_validate_credentials_service_down(self, mock_get):
+    def test_validate_credentials_service_down(self, mock_get, ollama_provider):
         """Test validation when Ollama service is down."""
         mock_get.side_effect = requests.exceptions.ConnectionError()
 
-        config = LLMConfig(provider="ollama", model="llama3")
-        provider = OllamaProvider(config)
-
-        assert provider.validate_credentials() is False
+        assert ollama_provider.validate_credentials() is False
 
     @patch("llm.ollama_provider.requests.Session.get")
-    def test_validate_credentials_timeout(self, mock_get):
+    def test_validate_credentials_timeout(self, mock_get, ollama_provider):
         """Test validation with timeout."""
         mock_get.side_effect = requests.exceptions.Timeout()
 
-        config = LLMConfig(provider="ollama", model="llama3")
-        provider = OllamaProvider(config)
-
-        assert provider.validate_credentials() is False
+        assert ollama_provider.validate_credentials() is False
 
 
 class TestHealthCheck:
     """Tests for health_check() method."""
 
     @patch("llm.ollama_provider.requests.Session.get")
-    def test_health_check_all_good(self, mock_get):
+    def test_health_check_all_good(self, mock_get, ollama_provider):
         """Test health check when everything is working."""
         mock_response = Mock()
         mock_response.json.return_value = {
@@ -304,10 +397,7 @@ class TestHealthCheck:
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
-        config = LLMConfig(provider="ollama", model="llama3")
-        provider = OllamaProvider(config)
-
-        health = provider.health_check()
+        health = ollama_provider.health_check()
 
         assert health["service_running"] is True
         assert health["model_available"] is True
@@ -315,21 +405,18 @@ class TestHealthCheck:
         assert len(health["available_models"]) == 2
 
     @patch("llm.ollama_provider.requests.Session.get")
-    def test_health_check_service_down(self, mock_get):
+    def test_health_check_service_down(self, mock_get, ollama_provider):
         """Test health check when service is not running."""
         mock_get.side_effect = requests.exceptions.ConnectionError()
 
-        config = LLMConfig(provider="ollama", model="llama3")
-        provider = OllamaProvider(config)
-
-        health = provider.health_check()
+        health = ollama_provider.health_check()
 
         assert health["service_running"] is False
         assert health["model_available"] is False
         assert health["error"] is not None
 
     @patch("llm.ollama_provider.requests.Session.get")
-    def test_health_check_model_not_available(self, mock_get):
+    def test_health_check_model_not_available(self, mock_get, ollama_provider):
         """Test health check when model is not loaded."""
         mock_response = Mock()
         mock_response.json.return_value = {
@@ -340,10 +427,7 @@ class TestHealthCheck:
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
-        config = LLMConfig(provider="ollama", model="llama3")
-        provider = OllamaProvider(config)
-
-        health = provider.health_check()
+        health = ollama_provider.health_check()
 
         assert health["service_running"] is True
         assert health["model_available"] is False
@@ -393,43 +477,58 @@ class TestExtractJsonFromResponse:
         assert result["trimmed"] is True
 
 
+class TestTagsProbe:
+    """Tests for the shared /api/tags probe."""
+
+    @patch("llm.ollama_provider.requests.Session.get")
+    def test_validate_then_health_check_probe_once(self, mock_get, ollama_provider):
+        """Test that back-to-back checks reuse one tags response."""
+        mock_response = Mock()
+        mock_response.json.return_value = {"models": [{"name": "llama3:latest"}]}
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+
+        assert ollama_provider.validate_credentials() is True
+        assert ollama_provider.health_check()["model_available"] is True
+        assert mock_get.call_count == 1
+
+    def test_model_available_ignores_version_tags(self):
+        """Test that tagged and untagged names match the same model."""
+        available = ["llama3:latest", "mistral:7b"]
+
+        assert OllamaProvider._model_available(available, "llama3")
+        assert OllamaProvider._model_available(available, "mistral:latest")
+        assert not OllamaProvider._model_available(available, "phi3")
+
+
 class TestPullModel:
     """Tests for pull_model() method."""
 
     @patch("llm.ollama_provider.requests.Session.post")
-    def test_pull_model_success(self, mock_post):
+    def test_pull_model_success(self, mock_post, ollama_provider):
         """Test successful model pull."""
         mock_response = Mock()
         mock_response.raise_for_status.return_value = None
         mock_post.return_value = mock_response
 
-        config = LLMConfig(provider="ollama", model="llama3")
-        provider = OllamaProvider(config)
-
-        result = provider.pull_model("mistral")
+        result = ollama_provider.pull_model("mistral")
 
         assert result is True
         mock_post.assert_called_once()
 
     @patch("llm.ollama_provider.requests.Session.post")
-    def test_pull_model_failure(self, mock_post):
+    def test_pull_model_failure(self, mock_post, ollama_provider):
         """Test failed model pull."""
         mock_post.side_effect = requests.exceptions.RequestException("Pull failed")
 
-        config = LLMConfig(provider="ollama", model="llama3")
-        provider = OllamaProvider(config)
-
-        result = provider.pull_model("nonexistent")
+        result = ollama_provider.pull_model("nonexistent")
 
         assert result is False
 
-    def test_pull_model_empty_name(self):
+    def test_pull_model_empty_name(self, ollama_provider):
         """Test pull with empty model name."""
-        config = LLMConfig(provider="ollama", model="llama3")
-        provider = OllamaProvider(config)
-
         with pytest.raises(ValueError, match="Model name cannot be empty"):
-            provider.pull_model("")
+            ollama_provider.pull_model("")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,97 @@
+"""
+Unit tests for LLM resume extraction post-processing.
+
+Tests cover:
+- Work descriptions sliced from description_lines pointers
+- Out-of-range, reversed and malformed ranges
+"""
+
+import logging
+
+from profile.parser import _description_from_lines, _dict_to_user_profile
+
+SOURCE_LINES = [
+    "Jane Doe",
+    "jane@example.com",
+    "Acme Corp - Backend Engineer",
+    "  Built payment APIs in Python",
+    "  Ran the on-call rotation",
+    "Education",
+]
+
+
+def _profile_data(**work_fields):
+    """Minimal extraction dict with one work entry."""
+    work = {
+        "company": "Acme Corp",
+        "position": "Backend Engineer",
+        "start_date": "2020-01-01",
+        **work_fields,
+    }
+    return {"full_name": "Jane Doe", "email": "jane@example.com", "work_experience": [work]}
+
+
+class TestDescriptionFromLines:
+    """Tests for _description_from_lines()."""
+
+    def test_valid_range(self):
+        """Test that an inclusive range is sliced and stripped."""
+        assert _description_from_lines([3, 4], SOURCE_LINES) == (
+            "Built payment APIs in Python\nRan the on-call rotation"
+        )
+
+    def test_range_clamped_to_text(self):
+        """Test that a range overrunning either end is clamped."""
+        assert _description_from_lines([-2, 0], SOURCE_LINES) == "Jane Doe"
+        assert _description_from_lines([5, 99], SOURCE_LINES) == "Education"
+
+    def test_out_of_range_and_reversed(self):
+        """Test that ranges with no lines inside the text give None."""
+        assert _description_from_lines([40, 50], SOURCE_LINES) is None
+        assert _description_from_lines([4, 3], SOURCE_LINES) is None
+
+    def test_malformed(self):
+        """Test that non-pair or non-integer ranges give None."""
+        assert _description_from_lines(None, SOURCE_LINES) is None
+        assert _description_from_lines([3], SOURCE_LINES) is None
+        assert _description_from_lines(["a", "b"], SOURCE_LINES) is None
+
+
+class TestDictToUserProfileDescription:
+    """Tests for work descriptions in _dict_to_user_profile()."""
+
+    def test_description_lines_used(self):
+        """Test that a valid pointer becomes the role description."""
+        profile = _dict_to_user_profile(_profile_data(description_lines=[3, 3]), SOURCE_LINES)
+
+        assert profile.work_experience[0].description == "Built payment APIs in Python"
+
+    def test_out_of_range_falls_back_to_description(self, caplog):
+        """Test that an unusable range uses the description field and warns."""
+        data = _profile_data(description_lines=[40, 50], description="Payments backend")
+
+        with caplog.at_level(logging.WARNING, logger="profile.parser"):
+            profile = _dict_to_user_profile(data, SOURCE_LINES)
+
+        assert profile.work_experience[0].description == "Payments backend"
+        assert "Invalid description_lines" in caplog.text
+
+    def test_reversed_range_without_description_is_empty(self, caplog):
+        """Test that a reversed range with no fallback leaves an empty description."""
+        data = _profile_data(description_lines=[4, 3], description=None)
+
+        with caplog.at_level(logging.WARNING, logger="profile.parser"):
+            profile = _dict_to_user_profile(data, SOURCE_LINES)
+
+        assert profile.work_experience[0].description == ""
+        assert "Invalid description_lines" in caplog.text
+
+    def test_missing_range_uses_description(self, caplog):
+        """Test that a missing pointer silently uses the description field."""
+        data = _profile_data(description="Payments backend")
+
+        with caplog.at_level(logging.WARNING, logger="profile.parser"):
+            profile = _dict_to_user_profile(data, SOURCE_LINES)
+
+        assert profile.work_experience[0].description == "Payments backend"
+        assert "Invalid description_lines" not in caplog.text